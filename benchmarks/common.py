@@ -0,0 +1,69 @@
+import json
+import math
+import os
+import platform
+import time
+from typing import Any
+from typing import Optional
+
+
+def percentile(values: list[float], q: float) -> float:
+    """
+    Compute a percentile with linear interpolation.
+
+    Args:
+        values: Sample values
+        q: Percentile between 0 and 100
+
+    Returns:
+        Percentile value, or 0.0 for an empty sample
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * q / 100
+    low = math.floor(rank)
+    high = math.ceil(rank)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def summarize(values: list[float]) -> dict[str, float]:
+    """
+    Summarize a latency sample.
+
+    Args:
+        values: Latencies in seconds
+
+    Returns:
+        Count, mean, p50, p95, p99 and max of the sample
+    """
+    return {
+        'count': len(values),
+        'mean': round(sum(values) / len(values), 6) if values else 0.0,
+        'p50': round(percentile(values, 50), 6),
+        'p95': round(percentile(values, 95), 6),
+        'p99': round(percentile(values, 99), 6),
+        'max': round(max(values), 6) if values else 0.0,
+    }
+
+
+def write_results(results: dict[str, Any], output: Optional[str]) -> None:
+    """
+    Print benchmark results and optionally write them as JSON.
+
+    Args:
+        results: Benchmark results
+        output: Path of the JSON file to write (None prints only)
+    """
+    results = {
+        'timestamp': time.time(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        **results,
+    }
+    text = json.dumps(results, indent=2, default=str)
+    print(text)
+    if output:
+        os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+        with open(output, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
@@ -0,0 +1,255 @@
+import argparse
+import asyncio
+import os
+import time
+import uuid
+from typing import Any
+
+import numpy as np
+
+from benchmarks.common import summarize
+from benchmarks.common import write_results
+from benchmarks.standins import make_pdf
+from benchmarks.standins import sample_text
+from benchmarks.standins import StandinServer
+
+
+def bench_text(service: Any, megabytes: float) -> dict[str, Any]:
+    """
+    Measure process_text and chunk_text throughput.
+
+    Args:
+        service: DocumentIngestionService under test
+        megabytes: Size of the generated input text
+
+    Returns:
+        Throughput of both functions in MB/s
+    """
+    paragraph = sample_text('text-benchmark', 2000) + ' 42\n'
+    text = paragraph * max(1, int(megabytes * 1024 * 1024 / len(paragraph)))
+    size = len(text) / (1024 * 1024)
+
+    started = time.perf_counter()
+    processed = service.process_text(text)
+    process_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    chunks = sum(1 for _ in service.chunk_text(processed))
+    chunk_seconds = time.perf_counter() - started
+
+    return {
+        'input_megabytes': round(size, 3),
+        'process_text_mb_per_second': round(size / process_seconds, 3),
+        'chunk_text_mb_per_second': round(len(processed) / (1024 * 1024) / chunk_seconds, 3),
+        'chunks': chunks,
+    }
+
+
+def bench_parse(page_counts: list[int], repeat: int, server: StandinServer) -> dict[str, Any]:
+    """
+    Measure PDF parse time per page, and get_arxiv_paper against the local PDF server.
+
+    Args:
+        page_counts: PDF sizes to measure, in pages
+        repeat: Repetitions per size
+        server: Running StandinServer the PDFs are fetched from
+
+    Returns:
+        Parse and fetch timings keyed by page count
+    """
+    from multi_tool_agent.core.tools import arxiv
+
+    results: dict[str, Any] = {}
+    for pages in page_counts:
+        pdf = make_pdf([sample_text(f'parse:{page}', 400) for page in range(pages)])
+        parse_times = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            arxiv.parse_arxiv_pdf('bench', pdf)
+            parse_times.append(time.perf_counter() - started)
+
+        server.pages = pages
+        fetch_times = []
+        for i in range(repeat):
+            started = time.perf_counter()
+            arxiv.get_arxiv_paper(f'{pages:04d}.{i:05d}v1')
+            fetch_times.append(time.perf_counter() - started)
+
+        parse = summarize(parse_times)
+        results[str(pages)] = {
+            'pdf_bytes': len(pdf),
+            'parse_seconds': parse,
+            'parse_seconds_per_page': round(parse['p50'] / pages, 6),
+            'get_arxiv_paper_seconds': summarize(fetch_times),
+        }
+    return results
+
+
+async def bench_ingest(service: Any, documents: int, length: int) -> dict[str, Any]:
+    """
+    Measure ingest_document throughput.
+
+    Args:
+        service: DocumentIngestionService under test
+        documents: Number of documents to ingest
+        length: Characters of each document
+
+    Returns:
+        Chunks and documents ingested per second
+    """
+    collection = f'bench_ingest_{uuid.uuid4().hex[:8]}'
+    texts = [sample_text(f'ingest:{i}', length // 6)[:length] for i in range(documents)]
+    chunks = sum(1 for text in texts for _ in service.chunk_text(service.process_text(text)))
+
+    started = time.perf_counter()
+    for i, text in enumerate(texts):
+        await service.ingest_document(f'doc-{i}', text, {'source': 'benchmark'}, collection, max_length=length)
+    elapsed = time.perf_counter() - started
+
+    return {
+        'documents': documents,
+        'document_characters': length,
+        'chunks': chunks,
+        'chunks_per_second': round(chunks / elapsed, 2),
+        'documents_per_second': round(documents / elapsed, 2),
+    }
+
+
+async def bench_search(service: Any, sizes: list[int], queries: int, dim: int, batch: int) -> dict[str, Any]:
+    """
+    Measure search_documents latency as the collection grows.
+
+    Args:
+        service: DocumentIngestionService under test
+        sizes: Collection sizes (in points) at which searches are measured
+        queries: Searches per size
+        dim: Dimension of the stored vectors
+        batch: Points per upsert while loading
+
+    Returns:
+        Search latency and load throughput keyed by collection size
+    """
+    from multi_tool_agent.data.vector_stores.base import Document
+
+    collection = f'bench_search_{uuid.uuid4().hex[:8]}'
+    rng = np.random.default_rng(0)
+    loaded = 0
+    results: dict[str, Any] = {}
+    previous = 0
+    for size in sorted(sizes):
+        started = time.perf_counter()
+        while loaded < size:
+            count = min(batch, size - loaded)
+            vectors = rng.standard_normal((count, dim), dtype=np.float32)
+            vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+            await service.vector_store.add_documents(
+                [
+                    Document(id=str(uuid.uuid4()), content=f'point {loaded + i}', vector=vector.tolist())
+                    for i, vector in enumerate(vectors)
+                ],
+                collection,
+            )
+            loaded += count
+        load_seconds = time.perf_counter() - started
+
+        latencies = []
+        for i in range(queries):
+            started = time.perf_counter()
+            await service.search_documents(sample_text(f'query:{i}', 12), collection_name=collection)
+            latencies.append(time.perf_counter() - started)
+
+        results[str(size)] = {
+            'search_seconds': summarize(latencies),
+            'load_points_per_second': round((size - previous) / load_seconds, 2) if load_seconds else 0.0,
+        }
+        previous = size
+        print(f'search @ {size} points: p50 {results[str(size)]["search_seconds"]["p50"]:.4f}s', flush=True)
+    return results
+
+
+async def benchmark(args: argparse.Namespace, server: StandinServer) -> dict[str, Any]:
+    """
+    Run the selected data-layer benchmarks.
+
+    Args:
+        args: Parsed command-line arguments
+        server: Running StandinServer serving the PDFs
+
+    Returns:
+        Benchmark results
+    """
+    from benchmarks.standins import create_embedding_service
+    from multi_tool_agent.data.document_service import DocumentIngestionService
+    from multi_tool_agent.data.vector_store import create_vector_store
+    from multi_tool_agent.utils.config import config
+
+    embedding = create_embedding_service(args.dim)
+    service = DocumentIngestionService(
+        vector_store=create_vector_store(config, embedding),
+        embedding_service=embedding,
+    )
+
+    suites = set(args.suites.split(','))
+    results: dict[str, Any] = {
+        'benchmark': 'data_layer',
+        'parameters': vars(args),
+        'vector_store': {
+            'type': config.vector_store_type,
+            'location': config.qdrant_location or f'{config.qdrant_host}:{config.qdrant_port}',
+        },
+    }
+    if 'text' in suites:
+        results['text'] = bench_text(service, args.text_megabytes)
+    if 'parse' in suites:
+        pages = [int(p) for p in args.pages.split(',')]
+        results['parse'] = await asyncio.to_thread(bench_parse, pages, args.repeat, server)
+    if 'ingest' in suites:
+        results['ingest'] = await bench_ingest(service, args.documents, args.document_length)
+    if 'search' in suites:
+        sizes = [int(size) for size in args.sizes.split(',')]
+        results['search'] = await bench_search(service, sizes, args.queries, args.dim, args.batch)
+    return results
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    Parse the command-line arguments.
+
+    Returns:
+        Parsed arguments
+    """
+    parser = argparse.ArgumentParser(description='Micro-benchmarks of the data layer hot paths')
+    parser.add_argument('--suites', default='text,parse,ingest,search', help='Comma-separated suites to run')
+    parser.add_argument(
+        '--vector-store', default='memory',
+        help="Vector store location: 'memory' (embedded, in-memory), 'server' (QDRANT_HOST/QDRANT_PORT) or a local path",
+    )
+    parser.add_argument('--text-megabytes', type=float, default=8.0, help='Input size of the text suite')
+    parser.add_argument('--pages', default='1,5,20', help='PDF page counts of the parse suite')
+    parser.add_argument('--repeat', type=int, default=5, help='Repetitions per PDF size')
+    parser.add_argument('--documents', type=int, default=50, help='Documents of the ingest suite')
+    parser.add_argument('--document-length', type=int, default=3000, help='Characters per ingested document')
+    parser.add_argument('--sizes', default='1000,10000,100000', help='Collection sizes of the search suite (up to 1000000)')
+    parser.add_argument('--queries', type=int, default=100, help='Searches per collection size')
+    parser.add_argument('--dim', type=int, default=1536, help='Embedding dimension')
+    parser.add_argument('--batch', type=int, default=2000, help='Points per upsert while loading')
+    parser.add_argument('--output', help='Path of the JSON results file')
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Run the benchmark from the command line."""
+    args = parse_args()
+    with StandinServer() as server:
+        os.environ.update({
+            'ARXIV_PDF_URL': f'{server.url}/pdf',
+            'CACHE_DIR': '',
+            'TRACING': 'none',
+            'QDRANT_LOCATION': {'memory': ':memory:', 'server': ''}.get(args.vector_store, args.vector_store),
+        })
+        results = asyncio.run(benchmark(args, server))
+    write_results(results, args.output)
+
+
+if __name__ == '__main__':
+    main()
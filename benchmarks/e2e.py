@@ -0,0 +1,133 @@
+import argparse
+import asyncio
+import tempfile
+import time
+from typing import Any
+
+from benchmarks.common import summarize
+from benchmarks.common import write_results
+from benchmarks.standins import configure_environment
+from benchmarks.standins import FakeLlm
+from benchmarks.standins import StandinServer
+
+QUERIES = [
+    'What are the latest techniques for reducing transformer inference latency?',
+    'How does mixture-of-experts routing affect training throughput?',
+    'Which quantization methods preserve accuracy in large language models?',
+    'What is the state of speculative decoding for LLM serving?',
+]
+
+
+async def run_query(runner: Any, session_service: Any, user_id: str, text: str) -> tuple[float, int]:
+    """
+    Run one research request through the ADK runner in a fresh session.
+
+    Args:
+        runner: ADK Runner wrapping the root agent
+        session_service: Session service of the runner
+        user_id: User owning the session
+        text: Research request
+
+    Returns:
+        Tuple of the end-to-end latency in seconds and the number of events emitted
+    """
+    from google.genai import types
+
+    session = await session_service.create_session(app_name=runner.app_name, user_id=user_id)
+    message = types.Content(role='user', parts=[types.Part(text=text)])
+    started = time.perf_counter()
+    events = 0
+    async for _ in runner.run_async(user_id=user_id, session_id=session.id, new_message=message):
+        events += 1
+    return time.perf_counter() - started, events
+
+
+async def benchmark(args: argparse.Namespace) -> dict[str, Any]:
+    """
+    Run the end-to-end benchmark against the stand-ins.
+
+    Args:
+        args: Parsed command-line arguments
+
+    Returns:
+        Benchmark results
+    """
+    from google.adk.runners import Runner
+    from google.adk.sessions import InMemorySessionService
+
+    from benchmarks.standins import create_root_agent
+    from multi_tool_agent.utils import tracing
+
+    agent = create_root_agent()
+    session_service = InMemorySessionService()
+    runner = Runner(agent=agent, app_name='benchmark', session_service=session_service)
+
+    for i in range(args.warmup):
+        await run_query(runner, session_service, 'warmup', QUERIES[i % len(QUERIES)])
+    tracing.recent_summaries.clear()
+
+    latencies: list[float] = []
+    started = time.perf_counter()
+    for i in range(args.runs):
+        latency, events = await run_query(runner, session_service, 'benchmark', QUERIES[i % len(QUERIES)])
+        latencies.append(latency)
+        print(f'run {i + 1}/{args.runs}: {latency:.3f}s, {events} events', flush=True)
+    elapsed = time.perf_counter() - started
+
+    stage_times: dict[str, list[float]] = {}
+    for summary in tracing.recent_summaries:
+        for stage, stats in summary['stages'].items():
+            stage_times.setdefault(stage, []).append(stats['total_seconds'])
+
+    return {
+        'benchmark': 'e2e',
+        'parameters': vars(args),
+        'end_to_end_seconds': summarize(latencies),
+        'throughput_runs_per_second': round(args.runs / elapsed, 4) if elapsed else 0.0,
+        'stages_seconds': {stage: summarize(times) for stage, times in sorted(stage_times.items())},
+        'llm_calls': dict(FakeLlm.calls),
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    Parse the command-line arguments.
+
+    Returns:
+        Parsed arguments
+    """
+    parser = argparse.ArgumentParser(description='Offline end-to-end benchmark of the research workflow')
+    parser.add_argument('--runs', type=int, default=10, help='Measured research requests')
+    parser.add_argument('--warmup', type=int, default=1, help='Unmeasured requests run first')
+    parser.add_argument('--llm-latency', type=float, default=0.05, help='Fake LLM latency per call in seconds')
+    parser.add_argument('--token-delay', type=float, default=0.0, help='Delay between streamed answer chunks')
+    parser.add_argument('--http-latency', type=float, default=0.02, help='Stand-in server latency per request')
+    parser.add_argument('--pdf-pages', type=int, default=4, help='Pages of each served PDF')
+    parser.add_argument('--plan', default='arxiv_search,arxiv_search,web_search', help='Comma-separated plan actions')
+    parser.add_argument('--warm-caches', action='store_true', help='Keep the search, paper and embedding caches enabled across runs')
+    parser.add_argument('--streaming', action='store_true', help='Stream the final answer')
+    parser.add_argument('--output', help='Path of the JSON results file')
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Run the benchmark from the command line."""
+    args = parse_args()
+    FakeLlm.latency = args.llm_latency
+    FakeLlm.token_delay = args.token_delay
+    FakeLlm.plan_steps = [action.strip() for action in args.plan.split(',') if action.strip()]
+
+    with StandinServer(latency=args.http_latency, pages=args.pdf_pages) as server:
+        configure_environment(
+            server.url,
+            trace_dir=tempfile.mkdtemp(prefix='deep-research-traces-'),
+            warm_caches=args.warm_caches,
+            streaming=args.streaming,
+        )
+        results = asyncio.run(benchmark(args))
+        results['http_requests'] = dict(server.requests)
+    write_results(results, args.output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+import argparse
+import asyncio
+import time
+from contextlib import ExitStack
+from typing import Any
+
+from benchmarks.common import summarize
+from benchmarks.common import write_results
+from benchmarks.standins import StandinServer
+
+
+async def run_mode(args: argparse.Namespace, mirrors: list[StandinServer], hedged: bool) -> dict[str, Any]:
+    """
+    Download PDFs from the stand-in mirrors with or without hedging.
+
+    Args:
+        args: Parsed command-line arguments
+        mirrors: Running stand-in servers acting as PDF mirrors
+        hedged: Whether to hedge across all mirrors (otherwise one request to the first mirror)
+
+    Returns:
+        Download latency distribution, error count and per-endpoint metrics
+    """
+    from multi_tool_agent.core.tools.mirrors import MirroredDownloader
+
+    urls = [f'{mirror.url}/pdf' for mirror in mirrors]
+    downloader = MirroredDownloader(
+        base_urls=urls if hedged else urls[:1],
+        hedge_delay=args.hedge_delay,
+        hedge_percentile=args.percentile,
+        max_requests=args.max_requests if hedged else 1,
+        timeout=args.timeout,
+    )
+    semaphore = asyncio.Semaphore(args.concurrency)
+    latencies: list[float] = []
+    errors = 0
+
+    async def download(index: int) -> None:
+        nonlocal errors
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                await downloader.fetch(f'{index % args.papers:04d}.00001v1.pdf')
+            except Exception:
+                errors += 1
+                return
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(download(i) for i in range(args.downloads)))
+    elapsed = time.perf_counter() - started
+    await downloader.close()
+
+    metrics = downloader.metrics()
+    requests = sum(endpoint['requests'] for endpoint in metrics['endpoints'].values())
+    return {
+        'download_seconds': summarize(latencies),
+        'errors': errors,
+        'elapsed_seconds': round(elapsed, 3),
+        'requests_per_download': round(requests / args.downloads, 3) if args.downloads else 0.0,
+        **metrics,
+    }
+
+
+async def benchmark(args: argparse.Namespace, mirrors: list[StandinServer]) -> dict[str, Any]:
+    """
+    Compare single-endpoint and hedged downloads against the same mirrors.
+
+    Args:
+        args: Parsed command-line arguments
+        mirrors: Running stand-in servers acting as PDF mirrors
+
+    Returns:
+        Benchmark results
+    """
+    results: dict[str, Any] = {'benchmark': 'hedging', 'parameters': vars(args)}
+    for mode in args.modes.split(','):
+        results[mode] = await run_mode(args, mirrors, hedged=mode == 'hedged')
+        print(f'{mode}: p50 {results[mode]["download_seconds"]["p50"]:.3f}s, '
+              f'p99 {results[mode]["download_seconds"]["p99"]:.3f}s', flush=True)
+    return results
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    Parse the command-line arguments.
+
+    Returns:
+        Parsed arguments
+    """
+    parser = argparse.ArgumentParser(description='Hedged PDF downloads against local mirrors with injected delays')
+    parser.add_argument('--modes', default='single,hedged', help='Comma-separated modes to run (single, hedged)')
+    parser.add_argument('--downloads', type=int, default=200, help='Downloads per mode')
+    parser.add_argument('--concurrency', type=int, default=4, help='Downloads in flight')
+    parser.add_argument('--papers', type=int, default=20, help='Distinct papers downloaded')
+    parser.add_argument('--mirrors', type=int, default=2, help='Number of stand-in mirrors')
+    parser.add_argument('--latency', type=float, default=0.02, help='Base latency of every mirror request')
+    parser.add_argument('--tail-latency', type=float, default=1.0, help='Extra latency of slow requests')
+    parser.add_argument('--tail-probability', type=float, default=0.05, help='Share of slow requests')
+    parser.add_argument('--error-probability', type=float, default=0.0, help='Share of requests failing with 503')
+    parser.add_argument('--hedge-delay', type=float, default=0.1, help='Hedging delay until enough latencies are observed')
+    parser.add_argument('--percentile', type=float, default=90.0, help='Observed latency percentile used as hedging delay')
+    parser.add_argument('--max-requests', type=int, default=2, help='Maximum requests per hedged download')
+    parser.add_argument('--timeout', type=float, default=30.0, help='Timeout of each request')
+    parser.add_argument('--output', help='Path of the JSON results file')
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Run the benchmark from the command line."""
+    args = parse_args()
+    with ExitStack() as stack:
+        mirrors = [
+            stack.enter_context(StandinServer(
+                latency=args.latency,
+                tail_latency=args.tail_latency,
+                tail_probability=args.tail_probability,
+                error_probability=args.error_probability,
+                seed=i,
+            ))
+            for i in range(max(1, args.mirrors))
+        ]
+        results = asyncio.run(benchmark(args, mirrors))
+    write_results(results, args.output)
+
+
+if __name__ == '__main__':
+    main()
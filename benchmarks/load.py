@@ -0,0 +1,339 @@
+import argparse
+import asyncio
+import json
+import os
+import random
+import resource
+import tempfile
+import time
+from typing import Any
+from typing import Optional
+
+from benchmarks.common import summarize
+from benchmarks.common import write_results
+from benchmarks.e2e import QUERIES
+from benchmarks.standins import configure_environment
+from benchmarks.standins import FakeLlm
+from benchmarks.standins import StandinServer
+
+try:
+    import psutil
+except ImportError:  # pragma: no cover - psutil is optional
+    psutil = None
+
+GENERAL_QUERIES = ['Hello there!', 'What is 2+2?', 'Thanks!']
+
+
+class ResourceMonitor:
+    """Samples event-loop lag, memory, sockets and child processes during the test."""
+
+    def __init__(self, interval: float = 0.1) -> None:
+        """
+        Initialize the monitor.
+
+        Args:
+            interval: Sampling interval in seconds
+        """
+        self.interval = interval
+        self.lags: list[float] = []
+        self.rss: list[int] = []
+        self.sockets: list[int] = []
+        self.children: list[int] = []
+        self._task: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def _rss() -> int:
+        """
+        Resident set size of this process.
+
+        Returns:
+            RSS in bytes
+        """
+        if psutil is not None:
+            return psutil.Process().memory_info().rss
+        try:
+            with open('/proc/self/statm') as f:
+                return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+        except OSError:
+            return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+    @staticmethod
+    def _sockets() -> int:
+        """
+        Number of open sockets of this process.
+
+        Returns:
+            Socket count, or -1 when it cannot be determined
+        """
+        if psutil is not None:
+            return len(psutil.Process().net_connections(kind='all'))
+        try:
+            fds = os.listdir('/proc/self/fd')
+        except OSError:
+            return -1
+        count = 0
+        for fd in fds:
+            try:
+                count += os.readlink(f'/proc/self/fd/{fd}').startswith('socket:')
+            except OSError:
+                # The descriptor was closed while listing
+                pass
+        return count
+
+    @staticmethod
+    def _children() -> int:
+        """
+        Number of child processes of this process (e.g. MCP servers).
+
+        Returns:
+            Child process count, or -1 when it cannot be determined
+        """
+        if psutil is not None:
+            return len(psutil.Process().children(recursive=True))
+        try:
+            pid = os.getpid()
+            count = 0
+            for task in os.listdir(f'/proc/{pid}/task'):
+                with open(f'/proc/{pid}/task/{task}/children') as f:
+                    count += len(f.read().split())
+            return count
+        except OSError:
+            return -1
+
+    async def _run(self) -> None:
+        """Sample until cancelled."""
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.lags.append(max(0.0, loop.time() - expected))
+            self.rss.append(self._rss())
+            self.sockets.append(self._sockets())
+            self.children.append(self._children())
+
+    def start(self) -> None:
+        """Start sampling in the running event loop."""
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> dict[str, Any]:
+        """
+        Stop sampling and summarize the samples.
+
+        Returns:
+            Event-loop lag distribution and peak/final resource usage
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        return {
+            'event_loop_lag_seconds': summarize(self.lags),
+            'rss_megabytes': {
+                'peak': round(max(self.rss, default=0) / 2**20, 1),
+                'final': round(self.rss[-1] / 2**20, 1) if self.rss else 0.0,
+            },
+            'open_sockets': {'peak': max(self.sockets, default=0), 'final': self.sockets[-1] if self.sockets else 0},
+            'child_processes': {'peak': max(self.children, default=0), 'final': self.children[-1] if self.children else 0},
+        }
+
+
+def load_queries(args: argparse.Namespace) -> list[tuple[str, float]]:
+    """
+    Build the weighted query mix.
+
+    Args:
+        args: Parsed command-line arguments
+
+    Returns:
+        List of (query, weight) pairs
+    """
+    if args.queries:
+        with open(args.queries, encoding='utf-8') as f:
+            mix = []
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    mix.append((record['query'], float(record.get('weight', 1.0))))
+            return mix
+    general = min(max(args.general_ratio, 0.0), 1.0)
+    mix = [(query, (1 - general) / len(QUERIES)) for query in QUERIES]
+    if general:
+        mix += [(query, general / len(GENERAL_QUERIES)) for query in GENERAL_QUERIES]
+    return mix
+
+
+async def run_session(runner: Any, text: str, user_id: str) -> dict[str, Any]:
+    """
+    Run one research session and record its outcome.
+
+    Args:
+        runner: ADK Runner wrapping the root agent
+        text: Message sent to the agent
+        user_id: User owning the session
+
+    Returns:
+        Latency, time to first event and error of the session
+    """
+    from google.genai import types
+
+    started = time.perf_counter()
+    first_event = None
+    error = None
+    try:
+        session = await runner.session_service.create_session(app_name=runner.app_name, user_id=user_id)
+        message = types.Content(role='user', parts=[types.Part(text=text)])
+        async for event in runner.run_async(user_id=user_id, session_id=session.id, new_message=message):
+            if first_event is None:
+                first_event = time.perf_counter() - started
+            if event.error_code:
+                error = f'{event.error_code}: {event.error_message}'
+    except Exception as e:
+        error = repr(e)
+    return {
+        'latency': time.perf_counter() - started,
+        'first_event': first_event,
+        'error': error,
+    }
+
+
+async def load_test(args: argparse.Namespace) -> dict[str, Any]:
+    """
+    Drive concurrent research sessions through the runner.
+
+    With a positive arrival rate, sessions arrive as a Poisson process (open
+    loop) and wait for one of `concurrency` slots; with rate 0, `concurrency`
+    workers issue sessions back to back (closed loop).
+
+    Args:
+        args: Parsed command-line arguments
+
+    Returns:
+        Load test results
+    """
+    from google.adk.runners import Runner
+    from google.adk.sessions import InMemorySessionService
+
+    from multi_tool_agent.utils import tracing
+
+    if args.backend == 'standin':
+        from benchmarks.standins import create_root_agent
+        agent = create_root_agent()
+    else:
+        from multi_tool_agent.agent import root_agent as agent
+
+    runner = Runner(agent=agent, app_name='load_test', session_service=InMemorySessionService())
+    stage_times: dict[str, list[float]] = {}
+
+    def collect(summary: dict[str, Any]) -> None:
+        for stage, stats in summary['stages'].items():
+            stage_times.setdefault(stage, []).append(stats['total_seconds'])
+
+    tracing.add_run_listener(collect)
+
+    mix = load_queries(args)
+    rng = random.Random(args.seed)
+    queries = [q for q, _ in mix]
+    weights = [w for _, w in mix]
+    semaphore = asyncio.Semaphore(args.concurrency)
+    outcomes: list[dict[str, Any]] = []
+    queue_waits: list[float] = []
+
+    async def issue(index: int) -> None:
+        queued = time.perf_counter()
+        async with semaphore:
+            queue_waits.append(time.perf_counter() - queued)
+            text = rng.choices(queries, weights)[0]
+            outcome = await run_session(runner, text, f'user-{index % args.users}')
+            outcomes.append(outcome)
+            if args.verbose:
+                print(f'session {index}: {outcome["latency"]:.3f}s error={outcome["error"]}', flush=True)
+
+    monitor = ResourceMonitor()
+    monitor.start()
+    started = time.perf_counter()
+    deadline = started + args.duration if args.duration else None
+    tasks: list[asyncio.Task] = []
+    index = 0
+    if args.rate > 0:
+        while index < args.requests and (deadline is None or time.perf_counter() < deadline):
+            tasks.append(asyncio.create_task(issue(index)))
+            index += 1
+            await asyncio.sleep(rng.expovariate(args.rate))
+        await asyncio.gather(*tasks)
+    else:
+        async def worker() -> None:
+            nonlocal index
+            while index < args.requests and (deadline is None or time.perf_counter() < deadline):
+                current = index
+                index += 1
+                await issue(current)
+
+        await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - started
+    resources = await monitor.stop()
+
+    errors = [outcome['error'] for outcome in outcomes if outcome['error']]
+    return {
+        'benchmark': 'load',
+        'parameters': vars(args),
+        'sessions': len(outcomes),
+        'elapsed_seconds': round(elapsed, 3),
+        'throughput_sessions_per_second': round(len(outcomes) / elapsed, 4) if elapsed else 0.0,
+        'error_rate': round(len(errors) / len(outcomes), 4) if outcomes else 0.0,
+        'errors': sorted(set(errors))[:20],
+        'end_to_end_seconds': summarize([outcome['latency'] for outcome in outcomes]),
+        'first_event_seconds': summarize([o['first_event'] for o in outcomes if o['first_event'] is not None]),
+        'queue_wait_seconds': summarize(queue_waits),
+        'stages_seconds': {stage: summarize(times) for stage, times in sorted(stage_times.items())},
+        **resources,
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    Parse the command-line arguments.
+
+    Returns:
+        Parsed arguments
+    """
+    parser = argparse.ArgumentParser(description='Concurrent-session load test of the research workflow')
+    parser.add_argument('--backend', choices=['standin', 'real'], default='standin', help='Stand-ins or configured services')
+    parser.add_argument('--requests', type=int, default=50, help='Maximum number of sessions')
+    parser.add_argument('--duration', type=float, default=0.0, help='Stop issuing sessions after this many seconds (0 = no limit)')
+    parser.add_argument('--rate', type=float, default=0.0, help='Poisson arrival rate in sessions/s (0 = closed loop)')
+    parser.add_argument('--concurrency', type=int, default=8, help='Maximum sessions in flight')
+    parser.add_argument('--users', type=int, default=8, help='Distinct user IDs the sessions are spread across')
+    parser.add_argument('--queries', help='JSONL file of {"query": ..., "weight": ...} records for the query mix')
+    parser.add_argument('--general-ratio', type=float, default=0.0, help='Share of non-research messages in the built-in mix')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed of arrivals and query choice')
+    parser.add_argument('--llm-latency', type=float, default=0.2, help='Fake LLM latency per call (stand-in backend)')
+    parser.add_argument('--http-latency', type=float, default=0.05, help='Stand-in server latency per request')
+    parser.add_argument('--verbose', action='store_true', help='Print every session outcome')
+    parser.add_argument('--output', help='Path of the JSON results file')
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Run the load test from the command line."""
+    args = parse_args()
+    if args.backend == 'real':
+        try:
+            from dotenv import load_dotenv
+            load_dotenv(os.path.join(os.path.dirname(__file__), '..', 'multi_tool_agent', '.env'))
+        except ImportError:
+            pass
+        os.environ.setdefault('TRACE_DIR', tempfile.mkdtemp(prefix='deep-research-traces-'))
+        results = asyncio.run(load_test(args))
+    else:
+        FakeLlm.latency = args.llm_latency
+        with StandinServer(latency=args.http_latency) as server:
+            configure_environment(server.url, trace_dir=tempfile.mkdtemp(prefix='deep-research-traces-'))
+            results = asyncio.run(load_test(args))
+            results['http_requests'] = dict(server.requests)
+    write_results(results, args.output)
+
+
+if __name__ == '__main__':
+    main()
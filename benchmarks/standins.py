@@ -0,0 +1,654 @@
+import asyncio
+import hashlib
+import json
+import math
+import os
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from typing import Any
+from typing import ClassVar
+from typing import Optional
+from urllib.parse import parse_qs
+from urllib.parse import urlparse
+
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.llm_response import LlmResponse
+from google.adk.models.registry import LLMRegistry
+from google.genai import types
+
+WORDS = (
+    'attention transformer sparse routing mixture experts latency throughput quantization '
+    'distillation retrieval augmentation benchmark kernel memory bandwidth cache decoding '
+    'speculative batching scheduler gradient optimizer convergence dataset evaluation'
+).split()
+
+
+def _seed(text: str) -> int:
+    """
+    Derive a stable integer seed from a text.
+
+    Args:
+        text: Text to hash
+
+    Returns:
+        Non-negative integer derived from the SHA-1 digest
+    """
+    return int(hashlib.sha1(text.encode('utf-8')).hexdigest()[:12], 16)
+
+
+def sample_text(seed: str, words: int) -> str:
+    """
+    Generate deterministic pseudo-scientific text.
+
+    Args:
+        seed: Seed text selecting the word sequence
+        words: Number of words to generate
+
+    Returns:
+        Generated text
+    """
+    value = _seed(seed)
+    out = []
+    for i in range(words):
+        value = (value * 6364136223846793005 + 1442695040888963407) % (1 << 64)
+        out.append(WORDS[(value >> 33) % len(WORDS)])
+        if i % 12 == 11:
+            out[-1] += '.'
+    return ' '.join(out)
+
+
+def make_pdf(pages: list[str], line_length: int = 90) -> bytes:
+    """
+    Build a minimal text PDF that PyPDF2 can extract.
+
+    Args:
+        pages: Text of each page
+        line_length: Maximum characters per rendered line
+
+    Returns:
+        PDF file content
+    """
+    objects: list[bytes] = []
+    page_ids = [3 + 2 * i for i in range(len(pages))]
+    font_id = 3 + 2 * len(pages)
+    objects.append(b'<< /Type /Catalog /Pages 2 0 R >>')
+    kids = ' '.join(f'{page_id} 0 R' for page_id in page_ids)
+    objects.append(f'<< /Type /Pages /Kids [{kids}] /Count {len(pages)} >>'.encode())
+    for page_id, text in zip(page_ids, pages):
+        lines = [text[i:i + line_length] for i in range(0, len(text), line_length)]
+        escaped = [line.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)') for line in lines]
+        stream = 'BT /F1 9 Tf 11 TL 40 800 Td ' + ' '.join(f'({line}) Tj T*' for line in escaped) + ' ET'
+        objects.append(
+            f'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] /Contents {page_id + 1} 0 R '
+            f'/Resources << /Font << /F1 {font_id} 0 R >> >> >>'.encode(),
+        )
+        data = stream.encode('latin-1', 'replace')
+        objects.append(b'<< /Length %d >>\nstream\n' % len(data) + data + b'\nendstream')
+    objects.append(b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>')
+
+    out = bytearray(b'%PDF-1.4\n')
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b'%d 0 obj\n' % number + body + b'\nendobj\n'
+    xref = len(out)
+    out += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1)
+    for offset in offsets:
+        out += b'%010d 00000 n \n' % offset
+    out += b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (len(objects) + 1, xref)
+    return bytes(out)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Request handler serving the arXiv and Tavily stand-in endpoints."""
+
+    server: '_Server'
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Silence per-request logging."""
+
+    def _send(self, status: int, body: bytes, content_type: str) -> None:
+        """
+        Send a complete response.
+
+        Args:
+            status: HTTP status code
+            body: Response body
+            content_type: Content-Type header value
+        """
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        """Serve arXiv Atom feeds and PDFs."""
+        standin = self.server.standin
+        standin.count('GET ' + self.path.split('?')[0].rsplit('/', 1)[0])
+        failed = standin.wait()
+        url = urlparse(self.path)
+        if failed:
+            self._send(503, b'unavailable', 'text/plain')
+        elif url.path == '/api/query':
+            params = parse_qs(url.query)
+            self._send(
+                200,
+                standin.atom_feed(
+                    params.get('search_query', [''])[0],
+                    int(params.get('max_results', ['50'])[0]),
+                ),
+                'application/atom+xml',
+            )
+        elif url.path.startswith('/pdf/'):
+            arxiv_id = url.path[len('/pdf/'):].removesuffix('.pdf')
+            self._send(200, standin.pdf(arxiv_id), 'application/pdf')
+        else:
+            self._send(404, b'not found', 'text/plain')
+
+    def do_HEAD(self) -> None:
+        """Answer connection warm-up probes."""
+        self.server.standin.count('HEAD ' + urlparse(self.path).path)
+        self.server.standin.wait()
+        self.send_response(200)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def do_POST(self) -> None:
+        """Serve Tavily searches."""
+        standin = self.server.standin
+        standin.count('POST ' + self.path)
+        standin.wait()
+        body = json.loads(self.rfile.read(int(self.headers.get('Content-Length', '0'))) or b'{}')
+        if self.path == '/search':
+            self._send(200, standin.web_results(body.get('query', ''), body.get('max_results', 5)), 'application/json')
+        else:
+            self._send(404, b'not found', 'text/plain')
+
+
+class _Server(ThreadingHTTPServer):
+    """HTTP server holding a reference to its stand-in configuration."""
+
+    daemon_threads = True
+    standin: 'StandinServer'
+
+
+class StandinServer:
+    """
+    Local HTTP server standing in for the arXiv API, arXiv PDFs and Tavily search.
+
+    Responses are deterministic for a given query or paper ID, and every request
+    can be delayed by a fixed latency to model network round trips. A random
+    share of requests can be delayed further, or fail, to model a latency tail
+    and an unreliable upstream.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        pages: int = 4,
+        papers: int = 50,
+        words_per_page: int = 400,
+        tail_latency: float = 0.0,
+        tail_probability: float = 0.0,
+        error_probability: float = 0.0,
+        seed: int = 0,
+    ) -> None:
+        """
+        Initialize the server.
+
+        Args:
+            latency: Delay added to every request in seconds
+            pages: Number of pages of each served PDF
+            papers: Maximum number of entries of each Atom feed
+            words_per_page: Words of text on each PDF page
+            tail_latency: Extra delay of the slow requests in seconds
+            tail_probability: Share of requests that get the extra delay
+            error_probability: Share of GET requests answered with 503
+            seed: Seed of the random tail and error draws
+        """
+        self.latency = latency
+        self.tail_latency = tail_latency
+        self.tail_probability = tail_probability
+        self.error_probability = error_probability
+        self._random = random.Random(seed)
+        self.pages = pages
+        self.papers = papers
+        self.words_per_page = words_per_page
+        self.requests: dict[str, int] = {}
+        self._pdfs: dict[str, bytes] = {}
+        self._lock = threading.Lock()
+        self._server: Optional[_Server] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """
+        Base URL of the running server.
+
+        Returns:
+            URL such as http://127.0.0.1:PORT
+        """
+        assert self._server is not None, 'server not started'
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def count(self, endpoint: str) -> None:
+        """
+        Count a request to an endpoint.
+
+        Args:
+            endpoint: Method and path prefix of the request
+        """
+        with self._lock:
+            self.requests[endpoint] = self.requests.get(endpoint, 0) + 1
+
+    def wait(self) -> bool:
+        """
+        Delay the current request by the configured latency, and the tail latency if drawn.
+
+        Returns:
+            True if the request should fail
+        """
+        with self._lock:
+            slow = self._random.random() < self.tail_probability
+            failed = self._random.random() < self.error_probability
+        time.sleep(self.latency + (self.tail_latency if slow else 0.0))
+        return failed
+
+    def paper_ids(self, query: str, max_results: int) -> list[str]:
+        """
+        Deterministic arXiv IDs returned for a query.
+
+        Args:
+            query: Search query
+            max_results: Requested number of results
+
+        Returns:
+            List of arXiv IDs with version suffix
+        """
+        seed = _seed(query)
+        return [
+            f'{2300 + seed % 200:04d}.{(seed + i * 7919) % 100000:05d}v1'
+            for i in range(min(max_results, self.papers))
+        ]
+
+    def atom_feed(self, query: str, max_results: int) -> bytes:
+        """
+        Render the Atom feed of an arXiv search.
+
+        Args:
+            query: Search query
+            max_results: Requested number of results
+
+        Returns:
+            Atom XML document
+        """
+        entries = []
+        for arxiv_id in self.paper_ids(query, max_results):
+            entries.append(
+                '<entry>'
+                f'<id>http://arxiv.org/abs/{arxiv_id}</id>'
+                f'<title>{sample_text(arxiv_id + "title", 8)}</title>'
+                f'<summary>{sample_text(arxiv_id + "abstract", 60)}</summary>'
+                f'<link href="http://arxiv.org/abs/{arxiv_id}" rel="alternate" type="text/html"/>'
+                f'<link title="pdf" href="{self.url}/pdf/{arxiv_id}" rel="related" type="application/pdf"/>'
+                '</entry>',
+            )
+        return (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<feed xmlns="http://www.w3.org/2005/Atom">'
+            f'<title>arXiv Query: {query}</title>{"".join(entries)}</feed>'
+        ).encode('utf-8')
+
+    def pdf(self, arxiv_id: str) -> bytes:
+        """
+        Return the PDF of a paper, generating it on first request.
+
+        Args:
+            arxiv_id: arXiv ID of the paper
+
+        Returns:
+            PDF file content
+        """
+        with self._lock:
+            content = self._pdfs.get(arxiv_id)
+        if content is None:
+            content = make_pdf([
+                sample_text(f'{arxiv_id}:{page}', self.words_per_page) for page in range(self.pages)
+            ])
+            with self._lock:
+                self._pdfs[arxiv_id] = content
+        return content
+
+    def web_results(self, query: str, max_results: int) -> bytes:
+        """
+        Render a Tavily search response.
+
+        Args:
+            query: Search query
+            max_results: Requested number of results
+
+        Returns:
+            JSON document in the Tavily /search response format
+        """
+        seed = _seed(query)
+        results = [
+            {
+                'title': sample_text(f'{query}:{i}:title', 6),
+                'url': f'https://example.com/{seed % 1000}/{i}',
+                'content': sample_text(f'{query}:{i}', 80),
+                'score': round(1.0 - i / 10, 2),
+            }
+            for i in range(max_results)
+        ]
+        return json.dumps({'query': query, 'results': results, 'response_time': self.latency}).encode('utf-8')
+
+    def start(self) -> 'StandinServer':
+        """
+        Start serving on a free local port in a background thread.
+
+        Returns:
+            The started server
+        """
+        self._server = _Server(('127.0.0.1', 0), _Handler)
+        self._server.standin = self
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the server."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> 'StandinServer':
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+
+def _estimate_tokens(text: str) -> int:
+    """
+    Roughly estimate the token count of a text.
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        Estimated token count
+    """
+    return len(text) // 4 + 1
+
+
+class FakeLlm(BaseLlm):
+    """
+    Fake LLM answering every stage of the workflow with schema-valid output.
+
+    The stage is taken from the model name (fake-classify, fake-plan, fake-filter,
+    fake-web-search, fake-answer). Each call waits `latency` seconds before
+    responding, and streamed answers are split into chunks `token_delay` apart.
+    Messages shorter than four words are classified as general requests, so
+    query mixes can include messages that end after classification.
+    """
+
+    latency: ClassVar[float] = 0.0
+    token_delay: ClassVar[float] = 0.0
+    plan_steps: ClassVar[list[str]] = ['arxiv_search', 'arxiv_search', 'web_search']
+    calls: ClassVar[dict[str, int]] = {}
+
+    @classmethod
+    def supported_models(cls) -> list[str]:
+        """
+        Model name patterns served by the fake LLM.
+
+        Returns:
+            Regular expressions matching fake-* model names
+        """
+        return [r'fake-.*']
+
+    @staticmethod
+    def _user_text(llm_request: Any) -> str:
+        """
+        Extract the latest user text of a request.
+
+        Args:
+            llm_request: Request sent to the model
+
+        Returns:
+            Text of the last user message with text parts
+        """
+        for content in reversed(llm_request.contents or []):
+            texts = [part.text for part in content.parts or [] if part.text]
+            if content.role == 'user' and texts:
+                return ' '.join(texts)
+        return ''
+
+    def _reply(self, llm_request: Any) -> types.Content:
+        """
+        Build the reply of the stage the request belongs to.
+
+        Args:
+            llm_request: Request sent to the model
+
+        Returns:
+            Model content to respond with
+        """
+        stage = (llm_request.model or self.model).removeprefix('fake-')
+        instruction = str(llm_request.config.system_instruction or '') if llm_request.config else ''
+        user_text = self._user_text(llm_request)
+
+        if stage == 'classify':
+            if len(user_text.split()) < 4:
+                text = json.dumps({'type': 'general', 'next_message': 'I can only help with research requests.'})
+            else:
+                text = json.dumps({'type': 'valid', 'user_intent': user_text})
+        elif stage == 'plan':
+            topic = ' '.join(user_text.split()[:8]) or 'research topic'
+            text = json.dumps({
+                'steps': [
+                    {'action': action, 'query': f'{topic} aspect {i}'}
+                    for i, action in enumerate(self.plan_steps)
+                ],
+            })
+        elif stage == 'filter':
+            ids = re.findall(r'"id": "([^"]+)"', instruction)
+            text = json.dumps({'ids': ids[:3]})
+        elif stage == 'web-search':
+            responses = [
+                part.function_response for content in llm_request.contents or []
+                for part in content.parts or [] if part.function_response
+            ]
+            if not responses and llm_request.tools_dict:
+                query = instruction.rsplit('Query:', 1)[-1].strip() or user_text
+                tool_name = next(iter(llm_request.tools_dict))
+                return types.Content(role='model', parts=[
+                    types.Part(function_call=types.FunctionCall(name=tool_name, args={'query': query})),
+                ])
+            response = responses[-1].response if responses else {}
+            results = (response or {}).get('results', [])
+            text = '\n'.join(
+                f'{i}. {result.get("content", "")[:200]} (Source: {result.get("url", "")})'
+                for i, result in enumerate(results, start=1)
+            ) or 'No web findings.'
+        else:
+            sources = re.findall(r'^\[([^\]]+)\]', instruction, flags=re.MULTILINE)
+            text = 'Answer synthesized from the research results. ' + sample_text(instruction[:200], 150)
+            text += '\n\nReferences:\n' + '\n'.join(f'- {source}' for source in sources)
+        return types.Content(role='model', parts=[types.Part(text=text)])
+
+    async def generate_content_async(self, llm_request: Any, stream: bool = False) -> Any:
+        """
+        Respond to a request after the configured latency.
+
+        Args:
+            llm_request: Request sent to the model
+            stream: Whether to stream partial text chunks first
+
+        Yields:
+            Partial responses when streaming, then the final response
+        """
+        stage = llm_request.model or self.model
+        FakeLlm.calls[stage] = FakeLlm.calls.get(stage, 0) + 1
+        await asyncio.sleep(self.latency)
+        content = self._reply(llm_request)
+        text = content.parts[0].text or ''
+        usage = types.GenerateContentResponseUsageMetadata(
+            prompt_token_count=_estimate_tokens(
+                str(llm_request.config.system_instruction or '') if llm_request.config else '',
+            ) + sum(_estimate_tokens(str(c.model_dump())) for c in llm_request.contents or []),
+            candidates_token_count=_estimate_tokens(text),
+        )
+
+        if stream and text:
+            chunk_size = max(1, math.ceil(len(text) / 16))
+            for i in range(0, len(text), chunk_size):
+                yield LlmResponse(
+                    content=types.Content(role='model', parts=[types.Part(text=text[i:i + chunk_size])]),
+                    partial=True,
+                )
+                await asyncio.sleep(self.token_delay)
+        yield LlmResponse(content=content, usage_metadata=usage)
+
+
+LLMRegistry.register(FakeLlm)
+
+
+def configure_environment(
+    server_url: str,
+    trace_dir: str,
+    warm_caches: bool = False,
+    streaming: bool = False,
+) -> None:
+    """
+    Point the workflow configuration at the local stand-ins.
+
+    Must run before `multi_tool_agent` is imported.
+
+    Args:
+        server_url: Base URL of the running StandinServer
+        trace_dir: Directory receiving the tracing spans and run summaries
+        warm_caches: Keep the search, paper and embedding caches enabled
+        streaming: Stream the final answer
+    """
+    os.environ.update({
+        'CLASSIFY_MODEL': 'fake-classify',
+        'PLAN_MODEL': 'fake-plan',
+        'FILTER_MODEL': 'fake-filter',
+        'WEB_SEARCH_MODEL': 'fake-web-search',
+        'ANSWER_MODEL': 'fake-answer',
+        'FALLBACK_MODEL': 'fake-answer',
+        'ARXIV_API_URL': f'{server_url}/api/query',
+        'ARXIV_PDF_URL': f'{server_url}/pdf',
+        'TAVILY_API_URL': server_url,
+        'TAVILY_API_KEY': 'benchmark',
+        'WEB_SEARCH_BACKEND': 'native',
+        'QDRANT_LOCATION': ':memory:',
+        'CACHE_DIR': '',
+        'ARXIV_SEARCH_CACHE_TTL': '3600' if warm_caches else '0',
+        'TAVILY_SEARCH_CACHE_TTL': '900' if warm_caches else '0',
+        'ARXIV_PAPER_CACHE_TTL': '2592000' if warm_caches else '0',
+        'EMBEDDING_CACHE_TTL': '2592000' if warm_caches else '0',
+        'TRACING': 'jsonl',
+        'TRACE_DIR': trace_dir,
+        'ANSWER_STREAMING': 'true' if streaming else 'false',
+        'RUN_STATE_PRUNING': 'delete',
+    })
+
+
+class DeterministicEmbedding:
+    """Feature-hashing embedder producing stable, similarity-preserving vectors."""
+
+    def __init__(self, size: int = 64) -> None:
+        """
+        Initialize the embedder.
+
+        Args:
+            size: Dimension of the produced vectors
+        """
+        self.size = size
+
+    def embed(self, text: str) -> list[float]:
+        """
+        Embed a text by hashing its words into a normalized bag-of-words vector.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Unit-length vector
+        """
+        vector = [0.0] * self.size
+        for word in text.lower().split():
+            digest = _seed(word)
+            vector[digest % self.size] += 1.0 if digest & (1 << 40) else -1.0
+        norm = math.sqrt(sum(v * v for v in vector)) or 1.0
+        return [v / norm for v in vector]
+
+
+def create_embedding_service(size: int = 64) -> Any:
+    """
+    Create a deterministic EmbeddingService for the workflow.
+
+    Args:
+        size: Dimension of the produced vectors
+
+    Returns:
+        EmbeddingService backed by DeterministicEmbedding
+    """
+    from multi_tool_agent.data.embeddings.base import EmbeddingService
+
+    class StandinEmbedding(EmbeddingService):
+        """EmbeddingService adapter over DeterministicEmbedding."""
+
+        def __init__(self) -> None:
+            self._embedder = DeterministicEmbedding(size)
+
+        async def embed_text(self, text: str) -> list[float]:
+            return self._embedder.embed(text)
+
+        async def embed_texts(self, texts: list[str]) -> list[list[float]]:
+            return [self._embedder.embed(text) for text in texts]
+
+        @property
+        def vector_size(self) -> int:
+            return size
+
+    return StandinEmbedding()
+
+
+def create_root_agent(embedding_size: int = 64) -> Any:
+    """
+    Build a RootAgent wired to the stand-in embedder and embedded Qdrant.
+
+    Args:
+        embedding_size: Dimension of the stand-in embeddings
+
+    Returns:
+        RootAgent using an in-memory document service
+    """
+    from multi_tool_agent.agent import RootAgent
+    from multi_tool_agent.core.agents.main.classify import classify_agent
+    from multi_tool_agent.core.agents.main.plan import plan_agent
+    from multi_tool_agent.core.services import ServiceContainer
+    from multi_tool_agent.data.document_service import DocumentIngestionService
+    from multi_tool_agent.data.vector_stores.qdrant import QdrantVectorStore
+    from multi_tool_agent.utils.config import config
+
+    embedding = create_embedding_service(embedding_size)
+    vector_store = QdrantVectorStore(embedding_service=embedding, location=config.qdrant_location or ':memory:')
+    document_service = DocumentIngestionService(vector_store=vector_store, embedding_service=embedding)
+    return RootAgent(
+        name='root',
+        description='Root Agent',
+        classify_agent=classify_agent,
+        plan_agent=plan_agent,
+        services=ServiceContainer(config, document_service=document_service),
+    )
@@ -0,0 +1,212 @@
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any
+
+from benchmarks.common import summarize
+from benchmarks.common import write_results
+
+HEAVY_MODULES = ['qdrant_client', 'openai', 'PyPDF2', 'feedparser', 'tavily', 'mcp']
+
+_IMPORTTIME = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|(\s+)(\S+)$')
+
+
+def _child_import(module: str) -> dict[str, Any]:
+    """
+    Import a module in this (fresh) process and report what it cost.
+
+    Args:
+        module: Module to import
+
+    Returns:
+        Import time and the heavy modules it loaded
+    """
+    started = time.perf_counter()
+    __import__(module)
+    return {
+        'import_seconds': time.perf_counter() - started,
+        'heavy_modules_loaded': [name for name in HEAVY_MODULES if name in sys.modules],
+        'modules_loaded': len(sys.modules),
+    }
+
+
+def _child_first_request(launched: float, query: str, warmup: bool) -> dict[str, Any]:
+    """
+    Serve one research request with the stand-ins in this (fresh) process.
+
+    Args:
+        launched: Wall-clock time at which the parent launched this process
+        query: Research request to send
+        warmup: Whether to warm up the connections before the request
+
+    Returns:
+        Seconds from launch until the process was ready, the first event and the last event,
+        and the latency of the request itself
+    """
+    import asyncio
+
+    from google.adk.runners import Runner
+    from google.adk.sessions import InMemorySessionService
+    from google.genai import types
+
+    from benchmarks.standins import create_root_agent
+    from multi_tool_agent.core.warmup import start_warmup
+
+    agent = create_root_agent()
+    runner = Runner(agent=agent, app_name='startup', session_service=InMemorySessionService())
+
+    async def run() -> tuple[float, float, float]:
+        if warmup:
+            await start_warmup(agent.services).wait_ready()
+        ready = time.time() - launched
+        session = await runner.session_service.create_session(app_name='startup', user_id='startup')
+        message = types.Content(role='user', parts=[types.Part(text=query)])
+        first_event = None
+        async for _ in runner.run_async(user_id='startup', session_id=session.id, new_message=message):
+            if first_event is None:
+                first_event = time.time() - launched
+        return ready, first_event or 0.0, time.time() - launched
+
+    ready, first_event, completed = asyncio.run(run())
+    return {
+        'ready_seconds': ready,
+        'first_event_seconds': first_event,
+        'completed_seconds': completed,
+        'request_seconds': completed - ready,
+    }
+
+
+def _spawn(args: list[str], env: dict[str, str]) -> dict[str, Any]:
+    """
+    Run a child measurement in a fresh interpreter.
+
+    Args:
+        args: Arguments of the child mode
+        env: Environment of the child process
+
+    Returns:
+        Measurement printed by the child, plus the process wall time
+    """
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, '-m', 'benchmarks.startup', *args],
+        env=env, capture_output=True, text=True, check=True,
+    )
+    measurement = json.loads(result.stdout.strip().splitlines()[-1])
+    measurement['process_seconds'] = time.perf_counter() - started
+    return measurement
+
+
+def import_profile(module: str, env: dict[str, str], top: int) -> dict[str, Any]:
+    """
+    Profile an import with `python -X importtime`.
+
+    Args:
+        module: Module to import
+        env: Environment of the child process
+        top: Number of entries to report
+
+    Returns:
+        The slowest third-party packages by cumulative time, and the slowest
+        modules of this project by self time
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        env=env, capture_output=True, text=True, check=True,
+    )
+    entries = []
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME.match(line)
+        if match:
+            entries.append({
+                'module': match.group(4),
+                'self_seconds': int(match.group(1)) / 1e6,
+                'cumulative_seconds': int(match.group(2)) / 1e6,
+                'depth': (len(match.group(3)) - 1) // 2,
+            })
+    project = [entry for entry in entries if entry['module'].startswith('multi_tool_agent')]
+    packages = [
+        entry for entry in entries
+        if entry['depth'] > 0 and '.' not in entry['module'] and entry['module'] != 'multi_tool_agent'
+    ]
+    return {
+        'third_party': sorted(packages, key=lambda entry: entry['cumulative_seconds'], reverse=True)[:top],
+        'project': sorted(project, key=lambda entry: entry['self_seconds'], reverse=True)[:top],
+    }
+
+
+def benchmark(args: argparse.Namespace) -> dict[str, Any]:
+    """
+    Measure cold-start cost in fresh interpreters.
+
+    Args:
+        args: Parsed command-line arguments
+
+    Returns:
+        Benchmark results
+    """
+    # Imported here so that the child processes start from a clean interpreter
+    from benchmarks.standins import configure_environment
+    from benchmarks.standins import StandinServer
+
+    env = dict(os.environ)
+    imports = [_spawn(['--child', 'import', '--module', args.module], env) for _ in range(args.runs)]
+
+    with StandinServer() as server:
+        configure_environment(server.url, trace_dir=tempfile.mkdtemp(prefix='deep-research-traces-'))
+        env = dict(os.environ)
+        child = ['--child', 'first-request', *(['--warmup'] if args.warmup else [])]
+        first_requests = [_spawn([*child, '--launched', repr(time.time())], env) for _ in range(args.runs)]
+
+    return {
+        'benchmark': 'startup',
+        'parameters': vars(args),
+        'import_seconds': summarize([m['import_seconds'] for m in imports]),
+        'import_process_seconds': summarize([m['process_seconds'] for m in imports]),
+        'heavy_modules_loaded_on_import': imports[0]['heavy_modules_loaded'],
+        'modules_loaded_on_import': imports[0]['modules_loaded'],
+        'ready_seconds': summarize([m['ready_seconds'] for m in first_requests]),
+        'first_event_seconds': summarize([m['first_event_seconds'] for m in first_requests]),
+        'first_request_seconds': summarize([m['completed_seconds'] for m in first_requests]),
+        'first_request_latency_seconds': summarize([m['request_seconds'] for m in first_requests]),
+        'import_profile': import_profile(args.module, env, args.top),
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    Parse the command-line arguments.
+
+    Returns:
+        Parsed arguments
+    """
+    parser = argparse.ArgumentParser(description='Cold-start benchmark: import time and time to first request')
+    parser.add_argument('--runs', type=int, default=5, help='Fresh processes per measurement')
+    parser.add_argument('--module', default='multi_tool_agent.agent', help='Module whose import is measured')
+    parser.add_argument('--top', type=int, default=15, help='Entries of the import profile to report')
+    parser.add_argument('--warmup', action='store_true', help='Warm up the connections before the first request')
+    parser.add_argument('--output', help='Path of the JSON results file')
+    parser.add_argument('--child', choices=['import', 'first-request'], help=argparse.SUPPRESS)
+    parser.add_argument('--launched', type=float, help=argparse.SUPPRESS)
+    parser.add_argument('--query', default='What is the state of speculative decoding for LLM serving?', help=argparse.SUPPRESS)
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Run the benchmark from the command line."""
+    args = parse_args()
+    if args.child == 'import':
+        print(json.dumps(_child_import(args.module)))
+    elif args.child == 'first-request':
+        print(json.dumps(_child_first_request(args.launched, args.query, args.warmup)))
+    else:
+        write_results(benchmark(args), args.output)
+
+
+if __name__ == '__main__':
+    main()
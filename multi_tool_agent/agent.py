@@ -1,5 +1,6 @@
 from collections.abc import AsyncGenerator
 from typing import Any
+from typing import Optional
 
 from google.adk.agents import BaseAgent
 from google.adk.agents import LlmAgent
@@ -11,10 +12,24 @@ from google.genai import types
 from multi_tool_agent.core.agents.main.answer import AnswerAgent
 from multi_tool_agent.core.agents.main.classify import classify_agent
 from multi_tool_agent.core.agents.main.plan import plan_agent
+from multi_tool_agent.core.agents.main.prune import PruneStep
 from multi_tool_agent.core.agents.main.research import ResearchAgent
+from multi_tool_agent.core.agents.main.speculation import SpeculativePlan
+from multi_tool_agent.core.checkpoints import CHECKPOINT_KEY
+from multi_tool_agent.core.checkpoints import checkpoint_event
+from multi_tool_agent.core.checkpoints import request_text
+from multi_tool_agent.core.checkpoints import resumable_checkpoint
+from multi_tool_agent.core.registry import describe_run
+from multi_tool_agent.core.services import service_container
 from multi_tool_agent.core.services import ServiceContainer
+from multi_tool_agent.core.tools.tavily import forget_run
+from multi_tool_agent.core.warmup import start_warmup
 from multi_tool_agent.utils.config import config
+from multi_tool_agent.utils.deadline import deadline_scope
 from multi_tool_agent.utils.logger import get_logger
+from multi_tool_agent.utils.tracing import bind
+from multi_tool_agent.utils.tracing import finish_run
+from multi_tool_agent.utils.tracing import span
 from multi_tool_agent.utils.utils import valid_uuid
 
 logger = get_logger(__name__)
@@ -36,73 +51,208 @@ class RootAgent(BaseAgent):
             **kwargs: Keyword arguments including agents and services
         """
         if 'services' not in kwargs:
-            kwargs['services'] = ServiceContainer(config)
+            kwargs['services'] = service_container
         super().__init__(**kwargs)
 
     async def _run_async_impl(self, context: InvocationContext) -> AsyncGenerator[Event, None]:
+        """
+        Execute the complete research workflow under a run_id and the request deadline.
+
+        A request that retries the session's unfinished run resumes it under its
+        run_id, skipping the stages that completed; otherwise a new run starts and
+        the transient state of an abandoned run is pruned.
+
+        Args:
+            context: Invocation context containing user query and session state
+
+        Yields:
+            Events from each stage of the research process
+        """
+        if config.warmup:
+            # No-op after the first run; hosts can also start it at startup
+            start_warmup(self.services)
+
+        checkpoint = resumable_checkpoint(context)
+        if checkpoint is None:
+            abandoned = context.session.state.get(CHECKPOINT_KEY)
+            if abandoned:
+                logger.info(f'Pruning the state of abandoned run {abandoned["run_id"]}')
+                async for event in PruneStep(name='prune', run_id=abandoned['run_id']).run_async(context):
+                    yield event
+                yield checkpoint_event(self.name, None)
+            run_id = valid_uuid()
+        else:
+            run_id = checkpoint['run_id']
+            logger.info(f'Resuming run {run_id} after attempt {checkpoint["attempt"]}')
+            checkpoint = {**checkpoint, 'attempt': checkpoint['attempt'] + 1}
+
+        with bind(run_id=run_id, session_id=context.session.id), deadline_scope(config.request_deadline):
+            try:
+                async for event in self._run_workflow(context, run_id, checkpoint):
+                    yield event
+            finally:
+                finish_run(run_id)
+
+    async def _run_workflow(
+        self, context: InvocationContext, run_id: str, checkpoint: Optional[dict[str, Any]] = None,
+    ) -> AsyncGenerator[Event, None]:
         """
         Execute the complete research workflow.
 
+        With RUN_CHECKPOINTS, the classification and the plan are checkpointed in
+        the session as soon as they are known; the research steps checkpoint their
+        own progress under the run_id.
+
         Args:
             context: Invocation context containing user query and session state
+            run_id: Unique identifier for the current run
+            checkpoint: Checkpoint of the run being resumed, or None for a new run
 
         Yields:
             Events from each stage of the research process
         """
         logger.info('Starting research workflow')
+        resumed = checkpoint is not None
 
-        # Classify the user request
-        logger.debug('Classifying user request')
-        async for event in self.classify_agent.run_async(context):
-            yield event
+        # Optionally start planning from the raw message while classifying
+        speculative_plan = None
+        if config.speculative_planning and not resumed:
+            speculative_plan = SpeculativePlan(self.plan_agent, context)
 
-        classification = context.session.state['classification']
-        logger.info(f'Classification result: {classification["type"]}')
+        try:
+            if resumed:
+                classification = checkpoint['classification']
+                yield Event(
+                    author=self.name,
+                    content=types.Content(
+                        role='assistant',
+                        parts=[types.Part(
+                            text=f'Resuming the interrupted research run (attempt {checkpoint["attempt"]})',
+                        )],
+                    ),
+                    actions=EventActions(state_delta={'classification': classification}),
+                )
+                yield checkpoint_event(self.name, checkpoint)
+            else:
+                # Classify the user request
+                logger.debug('Classifying user request')
+                with span('classify'):
+                    async for event in self.classify_agent.run_async(context):
+                        yield event
+                classification = context.session.state['classification']
+            logger.info(f'Classification result: {classification["type"]}')
 
-        if classification['type'] != 'valid':
-            logger.info(
-                'Request classified as invalid, returning classification message',
-            )
-            yield Event(
-                author=self.name,
-                content=types.Content(
-                    role='assistant',
-                    parts=[types.Part(text=classification['next_message'])],
-                ),
+            if classification['type'] != 'valid':
+                if speculative_plan is not None:
+                    speculative_plan.discard(f'classified as {classification["type"]}')
+                logger.info(
+                    'Request classified as invalid, returning classification message',
+                )
+                yield Event(
+                    author=self.name,
+                    content=types.Content(
+                        role='assistant',
+                        parts=[types.Part(text=classification['next_message'])],
+                    ),
+                )
+                return
+
+            if config.run_checkpoints and not resumed:
+                checkpoint = {
+                    'run_id': run_id, 'request': request_text(context), 'attempt': 1, 'classification': classification,
+                }
+                yield checkpoint_event(self.name, checkpoint)
+
+            # Set up query state for planning
+            logger.debug('Setting up query state for planning')
+            state_delta: dict[str, object] = {
+                'query': context.session.state['classification']['user_intent'],
+            }
+            system_event = Event(
+                invocation_id=context.invocation_id,
+                author='system',
+                actions=EventActions(state_delta=state_delta),
             )
-            return
-
-        # Set up query state for planning
-        logger.debug('Setting up query state for planning')
-        state_delta: dict[str, object] = {
-            'query': context.session.state['classification']['user_intent'],
-        }
-        system_event = Event(
-            invocation_id=context.invocation_id,
-            author='system',
-            actions=EventActions(state_delta=state_delta),
-        )
-        await context.session_service.append_event(context.session, system_event)
+            await context.session_service.append_event(context.session, system_event)
 
-        # Generate research plan
-        logger.info('Generating research plan')
-        async for event in self.plan_agent.run_async(context):
-            yield event
+            # Reuse the plan and the corpus of a similar earlier run, if any
+            plan = checkpoint.get('plan') if checkpoint is not None else None
+            if plan is None and config.run_reuse:
+                reused = await self.services.run_registry.find(classification.get('user_intent') or '')
+                if reused is not None:
+                    plan = reused['plan']
+                    yield Event(
+                        author=self.name,
+                        content=types.Content(
+                            role='assistant',
+                            parts=[types.Part(
+                                text='Reusing the research of a similar earlier request '
+                                f'(similarity {reused["score"]:.2f})',
+                            )],
+                        ),
+                        actions=EventActions(state_delta={f'reused_run:{run_id}': reused}),
+                    )
+
+            # Generate research plan
+            if plan is not None:
+                if speculative_plan is not None:
+                    speculative_plan.discard('reusing an earlier plan')
+                logger.info('Reusing an earlier research plan')
+                yield Event(author=self.name, actions=EventActions(state_delta={'research_plan': plan}))
+            else:
+                plan_events = None
+                if speculative_plan is not None:
+                    plan_events = await speculative_plan.commit(
+                        classification.get('user_intent') or '', config.speculation_min_overlap,
+                    )
+
+                with span('plan', speculative=plan_events is not None):
+                    if plan_events is not None:
+                        logger.info('Using speculative research plan')
+                        for event in plan_events:
+                            yield event
+                    else:
+                        logger.info('Generating research plan')
+                        async for event in self.plan_agent.run_async(context):
+                            yield event
+        finally:
+            # Cancels the plan if the workflow failed or was closed before using it
+            if speculative_plan is not None:
+                speculative_plan.discard('workflow ended before planning')
+
+        if checkpoint is not None and checkpoint.get('plan') is None:
+            checkpoint = {**checkpoint, 'plan': context.session.state.get('research_plan')}
+            yield checkpoint_event(self.name, checkpoint)
 
         # Execute research plan
-        run_id = valid_uuid()
         logger.info(f'Executing research plan with run_id: {run_id}')
         research_agent = ResearchAgent(
             name='ResearchAgent', description='Coordinates research steps', run_id=run_id, services=self.services,
         )
-        async for event in research_agent.run_async(context):
-            yield event
+        try:
+            async for event in research_agent.run_async(context):
+                yield event
+
+            # Generate final answer
+            logger.info('Generating final answer')
+            answer_agent = AnswerAgent(name='AnswerAgent', run_id=run_id)
+            async for event in answer_agent.run_async(context):
+                yield event
+        finally:
+            forget_run(run_id)
+
+        # Make the run reusable by similar requests, unless it reused one itself
+        if config.run_reuse and context.session.state.get(f'reused_run:{run_id}') is None:
+            entry = describe_run(context.session.state, run_id)
+            if entry is not None:
+                await self.services.run_registry.register(classification.get('user_intent') or '', entry)
 
-        # Generate final answer
-        logger.info('Generating final answer')
-        answer_agent = AnswerAgent(name='AnswerAgent', run_id=run_id)
-        async for event in answer_agent.run_async(context):
+        # Drop the run's transient state now that the answer is persisted
+        prune_step = PruneStep(name='prune', run_id=run_id)
+        async for event in prune_step.run_async(context):
             yield event
+        if checkpoint is not None:
+            yield checkpoint_event(self.name, None)
 
         logger.info('Research workflow completed successfully')
 
@@ -112,5 +262,4 @@ root_agent = RootAgent(
     description='Root Agent',
     classify_agent=classify_agent,
     plan_agent=plan_agent,
-    services=ServiceContainer(config),
 )
@@ -0,0 +1,335 @@
+import argparse
+import asyncio
+import json
+import os
+import time
+from collections.abc import Iterator
+from typing import Any
+from typing import TextIO
+
+from multi_tool_agent.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+APP_NAME = 'deep-research-batch'
+
+
+def read_queries(path: str, offset: int = 0) -> Iterator[tuple[int, dict[str, Any]]]:
+    """
+    Read research queries from a JSONL file.
+
+    Each non-empty line is either an object with a `query` field (and optionally
+    `id` and `user_id`) or a JSON string holding the query. A line that is not
+    valid JSON yields a record with an `error` field instead, so that it is
+    reported as a failed query rather than aborting the batch.
+
+    Args:
+        path: Path of the JSONL file
+        offset: Number of leading lines to skip
+
+    Yields:
+        Tuples of the line index and the query record
+    """
+    with open(path, encoding='utf-8') as f:
+        for index, line in enumerate(f):
+            if index < offset or not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield index, {'error': f'Invalid JSON: {e}'}
+                continue
+            yield index, record if isinstance(record, dict) else {'query': record}
+
+
+def completed_indices(path: str) -> set[int]:
+    """
+    Collect the line indices of the queries an earlier batch answered successfully.
+
+    Args:
+        path: Path of the JSONL output of the earlier batch
+
+    Returns:
+        Indices of the queries with an 'ok' result
+    """
+    if not os.path.exists(path):
+        return set()
+    completed = set()
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            try:
+                result = json.loads(line)
+            except json.JSONDecodeError:
+                # Last line of an interrupted batch
+                continue
+            if result.get('status') == 'ok':
+                completed.add(result['index'])
+    return completed
+
+
+def _percentile(values: list[float], q: float) -> float:
+    """
+    Nearest-rank percentile of a sample.
+
+    Args:
+        values: Sample values
+        q: Percentile between 0 and 100
+
+    Returns:
+        Percentile value, or 0.0 for an empty sample
+    """
+    ordered = sorted(values)
+    return ordered[round(q / 100 * (len(ordered) - 1))] if ordered else 0.0
+
+
+class BatchRunner:
+    """
+    Runs research queries through an agent with bounded concurrency.
+
+    All queries run in this process through one ADK runner, so they share the
+    search caches, the HTTP and MCP connection pools and the vector store client.
+    Each query gets a session of its own, deleted once its result is written.
+    """
+
+    def __init__(self, agent: Any, concurrency: int, output: TextIO) -> None:
+        """
+        Initialize the batch runner.
+
+        Args:
+            agent: Root agent answering the queries
+            concurrency: Maximum number of queries in flight
+            output: Stream the JSONL results are written to
+        """
+        from google.adk.runners import Runner
+        from google.adk.sessions import InMemorySessionService
+
+        self.agent = agent
+        self.concurrency = max(1, concurrency)
+        self.output = output
+        self.runner = Runner(agent=agent, app_name=APP_NAME, session_service=InMemorySessionService())
+        self.results: list[dict[str, Any]] = []
+        self._summaries: dict[str, dict[str, Any]] = {}
+
+    def _collect(self, summary: dict[str, Any]) -> None:
+        """
+        Keep the trace summary of a finished run for the query that ran it.
+
+        Args:
+            summary: Trace summary of the run
+        """
+        if summary.get('session_id'):
+            self._summaries[summary['session_id']] = summary
+
+    async def run_query(self, index: int, record: dict[str, Any]) -> dict[str, Any]:
+        """
+        Run one query in a fresh session.
+
+        Args:
+            index: Line index of the query in the input file
+            record: Query record
+
+        Returns:
+            Result with the answer (or error), latency and per-stage timings
+        """
+        from google.genai import types
+
+        user_id = str(record.get('user_id') or 'batch')
+        started = time.perf_counter()
+        first_event = None
+        answer = None
+        query = record.get('query')
+        error = None
+        session_id = None
+        if not isinstance(query, str) or not query.strip():
+            error = record.get('error') or 'Record has no query'
+            logger.warning(f'Query {index} skipped: {error}')
+        else:
+            try:
+                session = await self.runner.session_service.create_session(app_name=APP_NAME, user_id=user_id)
+                session_id = session.id
+                message = types.Content(role='user', parts=[types.Part(text=query)])
+                async for event in self.runner.run_async(user_id=user_id, session_id=session_id, new_message=message):
+                    if first_event is None:
+                        first_event = time.perf_counter() - started
+                    if event.error_code:
+                        error = f'{event.error_code}: {event.error_message}'
+                    # The last final text of the answer (or of the root agent, for invalid requests)
+                    if not event.partial and event.author in ('answer', self.agent.name) and event.content:
+                        text = ''.join(part.text or '' for part in event.content.parts or [])
+                        if text:
+                            answer = text
+            except Exception as e:
+                logger.error(f'Query {index} failed: {e}', exc_info=True)
+                error = repr(e)
+            finally:
+                if session_id is not None:
+                    await self.runner.session_service.delete_session(
+                        app_name=APP_NAME, user_id=user_id, session_id=session_id,
+                    )
+
+        summary = self._summaries.pop(session_id, {}) if session_id else {}
+        return {
+            'index': index,
+            'id': record.get('id', index),
+            'query': query,
+            'status': 'error' if error or answer is None else 'ok',
+            'answer': answer,
+            'error': error,
+            'seconds': round(time.perf_counter() - started, 6),
+            'first_event_seconds': round(first_event, 6) if first_event is not None else None,
+            'run_id': summary.get('run_id'),
+            'stages': {stage: stats['total_seconds'] for stage, stats in summary.get('stages', {}).items()},
+            'prompt_tokens': summary.get('prompt_tokens', 0),
+            'output_tokens': summary.get('output_tokens', 0),
+            'completed_at': time.time(),
+        }
+
+    async def run(self, queries: Iterator[tuple[int, dict[str, Any]]]) -> dict[str, Any]:
+        """
+        Run all queries, writing each result as soon as it is complete.
+
+        Args:
+            queries: Line indices and records of the queries to run
+
+        Returns:
+            Aggregate statistics of the batch
+        """
+        from multi_tool_agent.utils import tracing
+
+        tracing.add_run_listener(self._collect)
+
+        async def worker() -> None:
+            for index, record in queries:
+                result = await self.run_query(index, record)
+                self.output.write(json.dumps(result, ensure_ascii=False, default=str) + '\n')
+                self.output.flush()
+                self.results.append(result)
+                logger.info(f'Query {index} {result["status"]} in {result["seconds"]:.3f}s')
+
+        started = time.perf_counter()
+        # Workers share one iterator, so at most `concurrency` queries are read ahead
+        await asyncio.gather(*(worker() for _ in range(self.concurrency)))
+        return self.statistics(time.perf_counter() - started)
+
+    def statistics(self, elapsed: float) -> dict[str, Any]:
+        """
+        Aggregate the results of the batch.
+
+        Args:
+            elapsed: Wall time of the batch in seconds
+
+        Returns:
+            Query counts, throughput, latency percentiles and mean stage timings
+        """
+        latencies = [result['seconds'] for result in self.results]
+        stages: dict[str, list[float]] = {}
+        for result in self.results:
+            for stage, seconds in result['stages'].items():
+                stages.setdefault(stage, []).append(seconds)
+        return {
+            'queries': len(self.results),
+            'succeeded': sum(result['status'] == 'ok' for result in self.results),
+            'failed': sum(result['status'] != 'ok' for result in self.results),
+            'elapsed_seconds': round(elapsed, 3),
+            'throughput_queries_per_second': round(len(self.results) / elapsed, 4) if elapsed else 0.0,
+            'latency_seconds': {
+                'p50': round(_percentile(latencies, 50), 3),
+                'p95': round(_percentile(latencies, 95), 3),
+                'max': round(max(latencies, default=0.0), 3),
+            },
+            'stage_mean_seconds': {
+                stage: round(sum(times) / len(times), 3) for stage, times in sorted(stages.items())
+            },
+            'prompt_tokens': sum(result['prompt_tokens'] for result in self.results),
+            'output_tokens': sum(result['output_tokens'] for result in self.results),
+        }
+
+
+async def run_batch(
+    agent: Any,
+    input_path: str,
+    output_path: str,
+    concurrency: int = 4,
+    offset: int = 0,
+    resume: bool = False,
+    warmup: bool = False,
+) -> dict[str, Any]:
+    """
+    Run the queries of a JSONL file through an agent and stream the results to JSONL.
+
+    Args:
+        agent: Root agent answering the queries
+        input_path: Path of the JSONL query file
+        output_path: Path of the JSONL results file
+        concurrency: Maximum number of queries in flight
+        offset: Number of leading input lines to skip
+        resume: Append to the output, skipping the queries it already answered
+        warmup: Warm up the connections before the first query
+
+    Returns:
+        Aggregate statistics of the batch
+    """
+    from multi_tool_agent.core.tools.mcp_pool import tavily_mcp_pool
+    from multi_tool_agent.core.tools.mirrors import pdf_downloader
+    from multi_tool_agent.core.warmup import start_warmup
+
+    completed = completed_indices(output_path) if resume else set()
+    queries = ((index, record) for index, record in read_queries(input_path, offset) if index not in completed)
+    if completed:
+        logger.info(f'Resuming batch: skipping {len(completed)} answered queries')
+
+    warm = start_warmup(agent.services) if warmup else None
+    try:
+        if warm is not None:
+            await warm.wait_ready(timeout=agent.services.config.warmup_timeout)
+        with open(output_path, 'a' if resume else 'w', encoding='utf-8') as output:
+            statistics = await BatchRunner(agent, concurrency, output).run(queries)
+    finally:
+        if warm is not None:
+            await warm.close()
+        if agent.services.config.ingest_queue:
+            await agent.services.ingestion_queue.close()
+        await tavily_mcp_pool.close()
+        await pdf_downloader.close()
+    return {**statistics, 'skipped': len(completed)}
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    Parse the command-line arguments.
+
+    Returns:
+        Parsed arguments
+    """
+    parser = argparse.ArgumentParser(description='Run research queries from a JSONL file through the root agent')
+    parser.add_argument('input', help='JSONL file of {"query": ..., "id": ...} records')
+    parser.add_argument('output', help='JSONL file receiving one result per query as it completes')
+    parser.add_argument('--concurrency', type=int, default=4, help='Maximum queries in flight')
+    parser.add_argument('--offset', type=int, default=0, help='Skip this many leading input lines')
+    parser.add_argument('--resume', action='store_true', help='Append to the output, skipping queries already answered')
+    parser.add_argument('--warmup', action='store_true', help='Warm up the connections before the first query')
+    parser.add_argument('--env-file', help='Environment file to load (default: multi_tool_agent/.env)')
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Run a batch from the command line."""
+    args = parse_args()
+    try:
+        from dotenv import load_dotenv
+        load_dotenv(args.env_file or os.path.join(os.path.dirname(__file__), '.env'))
+    except ImportError:
+        pass
+
+    # Imported after the environment is loaded, since the configuration is read on import
+    from multi_tool_agent.agent import root_agent
+
+    statistics = asyncio.run(run_batch(
+        root_agent, args.input, args.output,
+        concurrency=args.concurrency, offset=args.offset, resume=args.resume, warmup=args.warmup,
+    ))
+    print(json.dumps(statistics, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,275 @@
+import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+from multi_tool_agent.utils.config import config
+from multi_tool_agent.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class AdmissionRejected(Exception):
+    """Raised when a request is not admitted."""
+
+    def __init__(self, reason: str, status: int, retry_after: float) -> None:
+        """
+        Initialize the rejection.
+
+        Args:
+            reason: Why the request was rejected ('tenant_quota', 'queue_full', 'overloaded' or 'queue_timeout')
+            status: HTTP status code to answer with (429 or 503)
+            retry_after: Seconds after which the client may retry
+        """
+        super().__init__(f'Request rejected: {reason}')
+        self.reason = reason
+        self.status = status
+        self.retry_after = retry_after
+
+
+class _Waiter:
+    """A request waiting in the admission queue."""
+
+    def __init__(self, cost: int) -> None:
+        """
+        Initialize the waiter.
+
+        Args:
+            cost: Estimated cost of the request in capacity units
+        """
+        self.cost = cost
+        self.future: asyncio.Future = asyncio.get_running_loop().create_future()
+
+
+class AdmissionController:
+    """
+    Process-wide admission control for research requests.
+
+    Every request has an estimated cost in capacity units: a research run holds
+    LLM calls, MCP sessions and PDF downloads for far longer than a message that
+    ends at classification. Requests run while the cost in flight fits the
+    capacity, and otherwise wait in a bounded FIFO queue. Each tenant may have a
+    limited number of requests in flight or queued. A request is shed up front
+    when the queue is full or when its estimated wait, derived from the observed
+    request durations, exceeds the maximum queue wait.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        max_queue: int,
+        max_queue_wait: float,
+        tenant_limit: int,
+        research_cost: int,
+    ) -> None:
+        """
+        Initialize the admission controller.
+
+        Args:
+            capacity: Capacity units that may be in flight at once
+            max_queue: Maximum number of queued requests
+            max_queue_wait: Maximum seconds a request may wait in the queue
+            tenant_limit: Maximum requests of one tenant in flight or queued
+            research_cost: Capacity units of a research request
+        """
+        self.capacity = max(1, capacity)
+        self.max_queue = max_queue
+        self.max_queue_wait = max_queue_wait
+        self.tenant_limit = max(1, tenant_limit)
+        self.research_cost = min(max(1, research_cost), self.capacity)
+        self.inflight = 0
+        self.inflight_cost = 0
+        self.admitted = 0
+        self.rejected: dict[str, int] = {}
+        self._queue: deque[_Waiter] = deque()
+        self._tenants: dict[str, int] = {}
+        self._durations: deque[float] = deque(maxlen=200)
+        self.wait_times: deque[float] = deque(maxlen=1000)
+
+    def estimate_cost(self, message: str) -> int:
+        """
+        Estimate the capacity units a request will hold.
+
+        Args:
+            message: Text of the user message
+
+        Returns:
+            1 for messages too short to be research requests, which end at
+            classification, and the research cost otherwise
+        """
+        return 1 if len(message.split()) < 4 else self.research_cost
+
+    @property
+    def queued_cost(self) -> int:
+        """
+        Capacity units requested by the queued requests.
+
+        Returns:
+            Sum of the costs of the waiting requests
+        """
+        return sum(waiter.cost for waiter in self._queue if not waiter.future.done())
+
+    def estimated_wait(self, cost: int) -> float:
+        """
+        Estimate how long a new request would wait in the queue.
+
+        Args:
+            cost: Estimated cost of the request
+
+        Returns:
+            Seconds until enough capacity frees up for the queued requests and
+            this one, or 0.0 before any request duration has been observed
+        """
+        if not self._durations:
+            return 0.0
+        mean_duration = sum(self._durations) / len(self._durations)
+        backlog = self.queued_cost + cost - (self.capacity - self.inflight_cost)
+        return max(0.0, backlog) * mean_duration / self.capacity
+
+    def _reject(self, reason: str, status: int, retry_after: float) -> AdmissionRejected:
+        """
+        Count a rejection and build its exception.
+
+        Args:
+            reason: Why the request was rejected
+            status: HTTP status code to answer with
+            retry_after: Seconds after which the client may retry
+
+        Returns:
+            Exception to raise
+        """
+        self.rejected[reason] = self.rejected.get(reason, 0) + 1
+        logger.warning(f'Rejected request: {reason} (queue depth {len(self._queue)}, cost in flight {self.inflight_cost})')
+        return AdmissionRejected(reason, status, round(max(1.0, retry_after), 1))
+
+    def _start(self, cost: int) -> None:
+        """
+        Account for a request starting to run.
+
+        Args:
+            cost: Estimated cost of the request
+        """
+        self.inflight += 1
+        self.inflight_cost += cost
+        self.admitted += 1
+
+    def _dispatch(self) -> None:
+        """Start queued requests, in order, while their cost fits the free capacity."""
+        while self._queue:
+            waiter = self._queue[0]
+            if waiter.future.done():
+                self._queue.popleft()
+                continue
+            if self.inflight_cost + waiter.cost > self.capacity:
+                break
+            self._queue.popleft()
+            self._start(waiter.cost)
+            waiter.future.set_result(None)
+
+    def _release(self, cost: int, duration: float) -> None:
+        """
+        Account for a request finishing and start queued ones.
+
+        Args:
+            cost: Estimated cost of the request
+            duration: Seconds the request ran
+        """
+        self.inflight -= 1
+        self.inflight_cost -= cost
+        self._durations.append(duration)
+        self._dispatch()
+
+    @asynccontextmanager
+    async def admit(self, tenant: str, cost: int) -> AsyncIterator[float]:
+        """
+        Hold capacity for a request for the duration of the context.
+
+        Args:
+            tenant: Tenant of the request
+            cost: Estimated cost of the request in capacity units
+
+        Yields:
+            Seconds the request waited in the queue
+
+        Raises:
+            AdmissionRejected: If the tenant is over its quota, the queue is full,
+                the estimated wait is too long or the request waited too long
+        """
+        cost = min(max(1, cost), self.capacity)
+        if self._tenants.get(tenant, 0) >= self.tenant_limit:
+            raise self._reject('tenant_quota', 429, self.estimated_wait(cost))
+
+        queued_at = time.perf_counter()
+        self._tenants[tenant] = self._tenants.get(tenant, 0) + 1
+        try:
+            if not self._queue and self.inflight_cost + cost <= self.capacity:
+                self._start(cost)
+            else:
+                if len(self._queue) >= self.max_queue:
+                    raise self._reject('queue_full', 503, self.estimated_wait(cost))
+                wait = self.estimated_wait(cost)
+                if wait > self.max_queue_wait:
+                    raise self._reject('overloaded', 503, wait)
+
+                waiter = _Waiter(cost)
+                self._queue.append(waiter)
+                try:
+                    await asyncio.wait_for(asyncio.shield(waiter.future), timeout=self.max_queue_wait)
+                except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+                    if waiter.future.done() and not waiter.future.cancelled():
+                        # Admitted just before the timeout or cancellation
+                        self._release(cost, 0.0)
+                    else:
+                        waiter.future.cancel()
+                        self._dispatch()
+                    if isinstance(e, asyncio.CancelledError):
+                        raise
+                    raise self._reject('queue_timeout', 503, self.estimated_wait(cost)) from None
+
+            waited = time.perf_counter() - queued_at
+            self.wait_times.append(waited)
+            started = time.perf_counter()
+            try:
+                yield waited
+            finally:
+                self._release(cost, time.perf_counter() - started)
+        finally:
+            remaining = self._tenants.get(tenant, 1) - 1
+            if remaining > 0:
+                self._tenants[tenant] = remaining
+            else:
+                self._tenants.pop(tenant, None)
+
+    def metrics(self) -> dict[str, Any]:
+        """
+        Snapshot of the queue, the work in flight and the rejections, e.g. for an autoscaler.
+
+        Returns:
+            Dictionary of admission metrics
+        """
+        waits = sorted(self.wait_times)
+        return {
+            'capacity': self.capacity,
+            'inflight': self.inflight,
+            'inflight_cost': self.inflight_cost,
+            'utilization': round(self.inflight_cost / self.capacity, 4),
+            'queue_depth': sum(1 for waiter in self._queue if not waiter.future.done()),
+            'queued_cost': self.queued_cost,
+            'max_queue': self.max_queue,
+            'estimated_wait_seconds': round(self.estimated_wait(self.research_cost), 3),
+            'admitted': self.admitted,
+            'rejected': dict(self.rejected),
+            'tenants': dict(self._tenants),
+            'wait_p95_seconds': round(waits[int(0.95 * (len(waits) - 1))], 4) if waits else 0.0,
+        }
+
+
+admission_controller = AdmissionController(
+    capacity=config.service_capacity,
+    max_queue=config.service_max_queue,
+    max_queue_wait=config.service_max_queue_wait,
+    tenant_limit=config.service_tenant_limit,
+    research_cost=config.service_research_cost,
+)
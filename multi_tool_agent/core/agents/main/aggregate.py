@@ -35,24 +35,46 @@ class AggregateStep(BaseAgent):
         """
         Execute the aggregation step to collect and combine research results.
 
+        Steps that were cut short by a deadline contribute whatever they produced;
+        steps without results are listed under `skipped:{run_id}` with their
+        source, query and reason, so the answer can acknowledge the gap.
+
         Args:
             ctx: Invocation context containing session state with research results
 
         Yields:
             Event containing the aggregated results
         """
-        results = [
-            v for k, v in ctx.session.state.items(
-            ) if k.startswith(f'results:{self.run_id}')
-        ]
-        step_delta: dict[str, object] = {f'results:{self.run_id}': results}
+        state = ctx.session.state
+        results_index = state.get(f'results_index:{self.run_id}', {})
+        results = []
+        skipped = []
+        partial = 0
+        for agent_id, key in results_index.items():
+            status = state.get(f'status:{self.run_id}:{agent_id}') or {}
+            if state.get(key) is not None:
+                results.append(state[key])
+                partial += status.get('status') == 'partial'
+            else:
+                skipped.append({
+                    'source': status.get('source', ''),
+                    'query': state.get(f'query:{self.run_id}:{agent_id}', ''),
+                    'reason': status.get('reason', 'no results'),
+                })
+        step_delta: dict[str, object] = {
+            f'results:{self.run_id}': results,
+            f'skipped:{self.run_id}': skipped,
+        }
 
+        text = 'Aggregated results'
+        if skipped or partial:
+            text += f' ({partial} partial, {len(skipped)} skipped)'
         yield Event(
             author=self.name,
             actions=EventActions(state_delta=step_delta),
             content=types.Content(
                 role='assistant', parts=[
-                    types.Part(text='Aggregated results'),
+                    types.Part(text=text),
                 ],
             ),
         )
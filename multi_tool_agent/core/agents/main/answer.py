@@ -1,10 +1,21 @@
+import time
 from collections.abc import AsyncGenerator
 
 from google.adk.agents import BaseAgent
 from google.adk.agents import LlmAgent
 from google.adk.agents.invocation_context import InvocationContext
+from google.adk.agents.readonly_context import ReadonlyContext
+from google.adk.agents.run_config import RunConfig
+from google.adk.agents.run_config import StreamingMode
 from google.adk.events import Event
 
+from multi_tool_agent.core.routing import model_router
+from multi_tool_agent.utils.config import config
+from multi_tool_agent.utils.logger import get_logger
+from multi_tool_agent.utils.tracing import span
+
+logger = get_logger(__name__)
+
 
 system_prompt = """Synthesize the research results to provide a direct, comprehensive answer to the user's query.
 
@@ -41,23 +52,61 @@ class AnswerAgent(BaseAgent):
         self._run_id = run_id
 
         self._answer_llm = LlmAgent(
-            model='gemini-2.0-flash',
+            model=model_router.model('answer'),
             name=f'answer',
-            instruction=system_prompt.format(
-                results=f'{{results:{self._run_id}}}',
-                query='{query}',
-            ),
+            instruction=self._instruction,
+            # The packed context already carries every finding worth citing
+            include_contents='none',
+            **model_router.callbacks('answer'),
+        )
+
+    def _instruction(self, context: ReadonlyContext) -> str:
+        """
+        Build the answer instruction from the packed context of this run.
+
+        Args:
+            context: Read-only context exposing the session state
+
+        Returns:
+            System instruction for the answer LLM
+        """
+        return system_prompt.format(
+            results=context.state.get(f'context:{self._run_id}', ''),
+            query=context.state.get('query', ''),
         )
 
     async def _run_async_impl(self, context: InvocationContext) -> AsyncGenerator[Event, None]:
         """
         Execute the answer generation process.
 
+        With ANSWER_STREAMING enabled the answer LLM runs in SSE mode: partial text
+        events are yielded as tokens arrive, followed by the final aggregated event
+        which is the one persisted to the session.
+
         Args:
             context: Invocation context containing research results and query
 
         Yields:
             Events from the answer generation LLM
         """
-        async for event in self._answer_llm.run_async(context):
-            yield event
+        if config.answer_streaming:
+            run_config = (context.run_config or RunConfig()).model_copy(
+                update={'streaming_mode': StreamingMode.SSE},
+            )
+            context = context.model_copy(update={'run_config': run_config})
+
+        started_at = time.perf_counter()
+        first_token_at = None
+        with span('answer', streaming=config.answer_streaming) as answer_span:
+            async for event in self._answer_llm.run_async(context):
+                if first_token_at is None and event.content and any(part.text for part in event.content.parts or []):
+                    first_token_at = time.perf_counter()
+                yield event
+
+            total = time.perf_counter() - started_at
+            ttft = (first_token_at or time.perf_counter()) - started_at
+            answer_span.set(ttft_seconds=round(ttft, 6))
+        logger.info(
+            f'Answer generated (streaming={config.answer_streaming}): '
+            f'time to first token {ttft:.3f}s, total {total:.3f}s',
+        )
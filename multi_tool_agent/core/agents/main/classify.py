@@ -5,6 +5,8 @@ from google.adk.agents import LlmAgent
 from pydantic import BaseModel
 from pydantic import Field
 
+from multi_tool_agent.core.routing import model_router
+
 
 class UserRequest(BaseModel):
     """Model representing a user's research request."""
@@ -25,8 +27,6 @@ class ClassificationResult(BaseModel):
     )
 
 
-GEMINI_MODEL = 'gemini-2.0-flash'
-
 system_prompt = """You are a Request Classification Agent that categorizes user requests into three types:
 
 **Categories:**
@@ -44,10 +44,11 @@ Personalize messages when possible.
 
 classify_agent = LlmAgent(
     name='ClassifyAgent',
-    model=GEMINI_MODEL,
+    model=model_router.model('classify'),
     instruction=system_prompt,
     description='Classify user requests and provide follow-up messages',
     input_schema=UserRequest,
     output_schema=ClassificationResult,
     output_key='classification',
+    **model_router.callbacks('classify'),
 )
@@ -0,0 +1,216 @@
+import hashlib
+import json
+from collections.abc import AsyncGenerator
+from typing import Any
+
+from google.adk.agents import BaseAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event
+from google.adk.events import EventActions
+from google.genai import types
+
+from multi_tool_agent.utils.config import config
+from multi_tool_agent.utils.logger import get_logger
+from multi_tool_agent.utils.tracing import span
+
+logger = get_logger(__name__)
+
+WEB_SOURCE = 'web'
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Roughly estimate the number of LLM tokens in a text.
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        Estimated token count, assuming about four characters per token
+    """
+    return len(text) // 4 + 1
+
+
+def _content_hash(text: str) -> str:
+    """
+    Hash text content after whitespace and case normalization.
+
+    Args:
+        text: Text to hash
+
+    Returns:
+        Hex digest identifying the normalized content
+    """
+    return hashlib.sha1(' '.join(text.lower().split()).encode('utf-8')).hexdigest()
+
+
+def _collect_chunks(results: list[Any]) -> list[dict[str, Any]]:
+    """
+    Flatten aggregated step results into scored chunks with a source label.
+
+    RAG steps contribute lists of retrieved documents; web steps contribute free
+    text, which is kept as a single chunk ranked ahead of retrieved documents.
+
+    Args:
+        results: Aggregated results of all research steps
+
+    Returns:
+        List of chunks with 'id', 'source', 'url', 'score' and 'text' keys
+    """
+    chunks: list[dict[str, Any]] = []
+    for result in results:
+        if isinstance(result, str):
+            try:
+                result = json.loads(result)
+            except ValueError:
+                pass
+
+        if isinstance(result, list):
+            for doc in result:
+                metadata = doc.get('metadata') or {}
+                arxiv_id = metadata.get('arxiv_id')
+                chunks.append({
+                    'id': doc.get('id', ''),
+                    'source': f'arXiv:{arxiv_id}' if arxiv_id else metadata.get('source', 'document'),
+                    'url': metadata.get('abs_url') or metadata.get('pdf_url', ''),
+                    'score': float(doc.get('score', 0.0)),
+                    'text': doc.get('content', ''),
+                })
+        elif result:
+            chunks.append({
+                'id': '',
+                'source': WEB_SOURCE,
+                'url': '',
+                'score': float('inf'),
+                'text': str(result).strip(),
+            })
+    return chunks
+
+
+def pack_context(results: list[Any], token_budget: int) -> tuple[str, dict[str, int]]:
+    """
+    Pack research results into a compact, citation-ready context.
+
+    Chunks are deduplicated by ID and by content, then added greedily by score
+    until the token budget is used up, and finally rendered grouped by source.
+
+    Args:
+        results: Aggregated results of all research steps
+        token_budget: Maximum estimated tokens of the packed context
+
+    Returns:
+        Tuple of the packed context text and packing statistics
+    """
+    chunks = _collect_chunks(results)
+    seen_ids: set[str] = set()
+    seen_hashes: set[str] = set()
+    unique: list[dict[str, Any]] = []
+    for chunk in chunks:
+        if not chunk['text']:
+            continue
+        content_hash = _content_hash(chunk['text'])
+        if content_hash in seen_hashes or (chunk['id'] and chunk['id'] in seen_ids):
+            continue
+        seen_hashes.add(content_hash)
+        if chunk['id']:
+            seen_ids.add(chunk['id'])
+        unique.append(chunk)
+
+    remaining = token_budget
+    groups: dict[str, dict[str, Any]] = {}
+    packed = 0
+    for chunk in sorted(unique, key=lambda c: c['score'], reverse=True):
+        text = chunk['text']
+        tokens = estimate_tokens(text)
+        if tokens > remaining:
+            if chunk['source'] != WEB_SOURCE or remaining < 64:
+                continue
+            # Web summaries are truncated rather than dropped, to at most `remaining` tokens
+            text = text[:(remaining - 1) * 4]
+            tokens = estimate_tokens(text)
+
+        group = groups.setdefault(chunk['source'], {'url': chunk['url'], 'texts': []})
+        group['texts'].append(text)
+        remaining -= tokens
+        packed += 1
+
+    sections = []
+    for source, group in groups.items():
+        header = f'[{source}] {group["url"]}'.rstrip()
+        if source == WEB_SOURCE:
+            sections.append(header + '\n' + '\n\n'.join(group['texts']))
+        else:
+            sections.append(header + '\n' + '\n'.join(f'- {text}' for text in group['texts']))
+
+    stats = {
+        'chunks': len(chunks),
+        'unique_chunks': len(unique),
+        'packed_chunks': packed,
+        'sources': len(groups),
+        'tokens': token_budget - remaining,
+    }
+    return '\n\n'.join(sections), stats
+
+
+class ContextPackStep(BaseAgent):
+    """Agent step for packing aggregated research results into the answer context."""
+
+    name: str = ''
+    description: str = ''
+    run_id: str = ''
+
+    def __init__(
+        self,
+        name: str = 'pack_step',
+        description: str = 'Pack the aggregated results into a token-budgeted context',
+        run_id: str = '',
+    ) -> None:
+        """
+        Initialize the ContextPackStep agent.
+
+        Args:
+            name: Name of the agent step
+            description: Description of what this step does
+            run_id: Unique identifier for the current run
+        """
+        super().__init__(name=name, description=description)
+        self.run_id = run_id
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        """
+        Execute the packing step on the aggregated results of the run.
+
+        Research steps that were skipped are listed after the packed results.
+
+        Args:
+            ctx: Invocation context containing the aggregated results
+
+        Yields:
+            Event storing the packed context under `context:{run_id}`
+        """
+        results = ctx.session.state.get(f'results:{self.run_id}', [])
+        skipped = ctx.session.state.get(f'skipped:{self.run_id}') or []
+        with span('pack') as pack_span:
+            context_text, stats = pack_context(results, config.answer_context_tokens)
+            if skipped:
+                # Let the answer acknowledge research steps that produced nothing
+                note = '[Not covered] These research steps did not finish:\n' + '\n'.join(
+                    f'- {step["source"] or "research"}: {step["query"]} ({step["reason"]})' for step in skipped
+                )
+                context_text = f'{context_text}\n\n{note}' if context_text else note
+                stats['skipped_steps'] = len(skipped)
+            pack_span.set(**stats)
+        logger.info(f'Packed answer context: {stats}')
+
+        step_delta: dict[str, object] = {f'context:{self.run_id}': context_text}
+        yield Event(
+            author=self.name,
+            actions=EventActions(state_delta=step_delta),
+            content=types.Content(
+                role='assistant', parts=[
+                    types.Part(
+                        text=f'Packed {stats["packed_chunks"]} chunks from {stats["sources"]} sources',
+                    ),
+                ],
+            ),
+        )
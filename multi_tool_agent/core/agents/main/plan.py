@@ -6,6 +6,8 @@ from google.adk.planners.plan_re_act_planner import PlanReActPlanner
 from pydantic import BaseModel
 from pydantic import Field
 
+from multi_tool_agent.core.routing import model_router
+
 
 class ClassificationResult(BaseModel):
     """Result from user request classification."""
@@ -38,8 +40,6 @@ class ResearchPlan(BaseModel):
     )
 
 
-GEMINI_MODEL = 'gemini-2.0-flash'
-
 system_prompt = """You are a Research Planning Agent that creates step-by-step research plans from the user_intent.
 
 **Available Tools:**
@@ -60,11 +60,12 @@ system_prompt = """You are a Research Planning Agent that creates step-by-step r
 
 plan_agent = LlmAgent(
     name='PlanAgent',
-    model=GEMINI_MODEL,
+    model=model_router.model('plan'),
     instruction=system_prompt,
     planner=PlanReActPlanner(),
     description='Plan a list of steps to gather all the information needed to answer the user query',
     input_schema=ClassificationResult,
     output_schema=ResearchPlan,
     output_key='research_plan',
+    **model_router.callbacks('plan'),
 )
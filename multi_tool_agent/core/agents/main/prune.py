@@ -0,0 +1,113 @@
+import asyncio
+import json
+import os
+import time
+from collections.abc import AsyncGenerator
+from typing import Any
+
+from google.adk.agents import BaseAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event
+from google.adk.events import EventActions
+
+from multi_tool_agent.utils.config import config
+from multi_tool_agent.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+AGENT_KEY_PREFIXES = ('query', 'candidates', 'paper_ids', 'ingested', 'results', 'status')
+RUN_KEY_PREFIXES = ('results', 'collection_name', 'context', 'results_index', 'skipped', 'reused_run')
+
+
+def transient_keys(state: dict[str, Any], run_id: str) -> list[str]:
+    """
+    List the session state keys that only matter while a run is in progress.
+
+    Args:
+        state: Session state
+        run_id: Unique identifier of the run
+
+    Returns:
+        Keys of the run's per-agent and per-run transient state present in the session
+    """
+    agent_ids = state.get(f'results_index:{run_id}') or {}
+    keys = [
+        f'{prefix}:{run_id}:{agent_id}'
+        for agent_id in agent_ids for prefix in AGENT_KEY_PREFIXES
+    ]
+    keys += [f'{prefix}:{run_id}' for prefix in RUN_KEY_PREFIXES]
+    return [key for key in keys if state.get(key) is not None]
+
+
+class PruneStep(BaseAgent):
+    """Agent step for removing a completed run's transient keys from session state."""
+
+    name: str = ''
+    description: str = ''
+    run_id: str = ''
+
+    def __init__(
+        self,
+        name: str = 'prune_step',
+        description: str = 'Prune the transient state of the completed run',
+        run_id: str = '',
+    ) -> None:
+        """
+        Initialize the PruneStep agent.
+
+        Args:
+            name: Name of the agent step
+            description: Description of what this step does
+            run_id: Unique identifier for the current run
+        """
+        super().__init__(name=name, description=description)
+        self.run_id = run_id
+
+    def _archive(self, session_id: str, values: dict[str, Any]) -> None:
+        """
+        Append the pruned values of the run to the session's archive file.
+
+        Args:
+            session_id: Session the run belongs to
+            values: Transient state values being pruned
+        """
+        archive_dir = os.path.join(config.cache_dir, 'archive')
+        os.makedirs(archive_dir, exist_ok=True)
+        record = {'run_id': self.run_id, 'archived_at': time.time(), 'state': values}
+        with open(os.path.join(archive_dir, f'{session_id}.jsonl'), 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record, ensure_ascii=False, default=str) + '\n')
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        """
+        Execute the pruning step according to RUN_STATE_PRUNING.
+
+        Session state cannot drop keys through events, so pruned keys are set to
+        None, which releases their values from the state and later event writes.
+
+        Args:
+            ctx: Invocation context containing the run's session state
+
+        Yields:
+            Event clearing the run's transient keys
+        """
+        if config.run_state_pruning not in ('delete', 'archive'):
+            return
+
+        keys = transient_keys(ctx.session.state, self.run_id)
+        if config.run_state_pruning == 'archive' and config.cache_dir:
+            try:
+                await asyncio.to_thread(
+                    self._archive, ctx.session.id, {key: ctx.session.state[key] for key in keys},
+                )
+            except Exception as e:
+                logger.error(
+                    f'Error archiving state of run {self.run_id}: {e}', exc_info=True,
+                )
+                return
+
+        logger.info(f'Pruning {len(keys)} transient state keys of run {self.run_id}')
+        step_delta: dict[str, object] = {key: None for key in keys}
+        yield Event(
+            author=self.name,
+            actions=EventActions(state_delta=step_delta),
+        )
@@ -1,4 +1,7 @@
+import asyncio
+import time
 from collections.abc import AsyncGenerator
+from contextlib import AsyncExitStack
 from typing import Any
 
 from google.adk.agents import BaseAgent
@@ -9,14 +12,111 @@ from google.adk.events import EventActions
 from google.genai import types
 
 from multi_tool_agent.core.agents.main.aggregate import AggregateStep
+from multi_tool_agent.core.agents.main.pack import ContextPackStep
 from multi_tool_agent.core.agents.research.arxiv.arx_agent import ArxivAgent
 from multi_tool_agent.core.agents.research.web.search_agent import WebSearchAgent
+from multi_tool_agent.core.scheduler import branch_scheduler
 from multi_tool_agent.core.services import ServiceContainer
+from multi_tool_agent.utils.config import config
+from multi_tool_agent.utils.deadline import current_deadline
+from multi_tool_agent.utils.deadline import deadline_scope
+from multi_tool_agent.utils.deadline import DeadlineExceeded
+from multi_tool_agent.utils.deadline import iterate_until
+from multi_tool_agent.utils.deadline import remaining
 from multi_tool_agent.utils.logger import get_logger
+from multi_tool_agent.utils.tracing import bind
+from multi_tool_agent.utils.tracing import span
 from multi_tool_agent.utils.utils import valid_uuid
 
 logger = get_logger(__name__)
 
+# Seconds a branch may overrun its deadline while wrapping up partial results
+BRANCH_GRACE_SECONDS = 1.0
+
+
+class ScheduledBranch(BaseAgent):
+    """Agent wrapper that runs a research branch once the scheduler grants it a slot."""
+
+    def __init__(self, *, name: str, branch: BaseAgent, pool: str, run_id: str, agent_id: str, budget: float) -> None:
+        """
+        Initialize the ScheduledBranch.
+
+        Args:
+            name: Name of the branch, unique within the research run
+            branch: Research agent to run
+            pool: Scheduler pool the branch belongs to ('arxiv' or 'web')
+            run_id: Unique identifier for the current run
+            agent_id: Unique identifier of the wrapped research agent
+            budget: Seconds the branch may run once it has a slot (0 = bounded by the research deadline only)
+        """
+        super().__init__(name=name, sub_agents=[branch])
+        self._pool = pool
+        self._run_id = run_id
+        self._agent_id = agent_id
+        self._budget = budget
+
+    def _skipped_event(self) -> Event:
+        """
+        Build the event recording the branch as skipped at its deadline.
+
+        Returns:
+            Event with the skipped status of the wrapped research agent
+        """
+        return Event(
+            author=self.name,
+            content=types.Content(
+                role='assistant',
+                parts=[types.Part(text=f'Skipped {self._pool} research step: deadline exceeded')],
+            ),
+            actions=EventActions(
+                state_delta={
+                    f'status:{self._run_id}:{self._agent_id}': {
+                        'status': 'skipped', 'source': self._pool, 'reason': 'deadline',
+                    },
+                },
+            ),
+        )
+
+    async def _run_async_impl(self, context: InvocationContext) -> AsyncGenerator[Event, None]:
+        """
+        Wait for a scheduler slot, then run the wrapped branch until its deadline.
+
+        The branch sees its deadline through the deadline context and may wrap up
+        with partial results; if it is still running shortly after, it is cancelled
+        and recorded as skipped. A branch that gets no slot before the research
+        deadline is recorded as skipped without running.
+
+        Args:
+            context: Invocation context of the research run
+
+        Yields:
+            Events from the wrapped research agent
+        """
+        with bind(agent_id=self._agent_id), span('branch', pool=self._pool) as branch_span:
+            queued_at = time.perf_counter()
+            async with AsyncExitStack() as slot:
+                try:
+                    await asyncio.wait_for(
+                        slot.enter_async_context(branch_scheduler.slot(self._pool, context.session.id)),
+                        timeout=remaining(current_deadline()),
+                    )
+                except TimeoutError:
+                    branch_span.set(wait_seconds=round(time.perf_counter() - queued_at, 6), skipped='deadline')
+                    logger.warning(f'Research branch {self.name} got no slot before the research deadline')
+                    yield self._skipped_event()
+                    return
+
+                branch_span.set(wait_seconds=round(time.perf_counter() - queued_at, 6))
+                with deadline_scope(self._budget) as deadline:
+                    hard_deadline = None if deadline is None else deadline + BRANCH_GRACE_SECONDS
+                    try:
+                        async for event in iterate_until(self.sub_agents[0].run_async(context), hard_deadline):
+                            yield event
+                    except DeadlineExceeded:
+                        branch_span.set(skipped='deadline')
+                        logger.warning(f'Research branch {self.name} cancelled at its deadline')
+                        yield self._skipped_event()
+
 
 class ResearchAgent(BaseAgent):
     """Agent for coordinating parallel research execution across multiple sources."""
@@ -35,44 +135,105 @@ class ResearchAgent(BaseAgent):
         """
         super().__init__(**kwargs)
 
+    def _reused_state(self, step: dict[str, Any], agent_id: str) -> dict[str, object]:
+        """
+        State that makes a research step start from the outcome of the reused run.
+
+        Args:
+            step: Step of the reused run's registry entry
+            agent_id: Agent id of the step in this run
+
+        Returns:
+            Session state keys of this run's step, seeded from the reused step
+        """
+        if step.get('action') == 'arxiv_search':
+            # The papers are in the reused collection: only retrieval runs
+            paper_ids = list(step.get('paper_ids') or [])
+            return {
+                f'candidates:{self.run_id}:{agent_id}': [],
+                f'paper_ids:{self.run_id}:{agent_id}': {'ids': paper_ids},
+                f'ingested:{self.run_id}:{agent_id}': paper_ids,
+            }
+        if config.run_reuse_web_refresh or step.get('result') is None:
+            return {}
+        return {f'results:{self.run_id}:{agent_id}': step['result']}
+
     async def _run_async_impl(self, context: InvocationContext) -> AsyncGenerator[Event, None]:
         """
         Execute the research plan with parallel agents.
 
+        Every branch is bounded by the research deadline and its own budget;
+        aggregation then proceeds with the results of the branches that finished.
+        When the run is resumed, the steps keep their agent ids, so branches that
+        completed are not run again and the others pick up from their checkpoints.
+        When the run reuses an earlier one, its arXiv steps retrieve from the
+        earlier run's papers and collection, and its web steps either reuse the
+        earlier results or search again (RUN_REUSE_WEB_REFRESH).
+
         Args:
             context: Invocation context containing the research plan and session state
 
         Yields:
             Events from the research execution process
         """
-        plan = context.session.state.get('research_plan', {})
+        state = context.session.state
+        plan = state.get('research_plan', {})
+        steps = plan.get('steps', [])
         task_delta: dict[str, object] = {}
+        results_index: dict[str, str] = {}
         sub_agents: list[BaseAgent] = []
 
-        for step in plan.get('steps', []):
-            agent_id = valid_uuid()
+        # The steps of a resumed run keep their agent ids, in plan order
+        previous = list(state.get(f'results_index:{self.run_id}') or {})
+        agent_ids = previous if len(previous) == len(steps) else [valid_uuid() for _ in steps]
+        reused = state.get(f'reused_run:{self.run_id}')
+        completed = 0
+
+        for index, (step, agent_id) in enumerate(zip(steps, agent_ids)):
             logger.debug(f'Processing research step: {step}')
 
             task_delta[f'query:{self.run_id}:{agent_id}'] = step.get(
                 'query', '',
             )
-            task_delta[f'collection_name:{self.run_id}'] = self.run_id
+            task_delta[f'collection_name:{self.run_id}'] = reused['collection_name'] if reused else self.run_id
+            results_index[agent_id] = f'results:{self.run_id}:{agent_id}'
+            if reused is not None:
+                seeded = self._reused_state(reused['steps'][index], agent_id)
+                task_delta.update({key: value for key, value in seeded.items() if state.get(key) is None})
+
+            status_key = f'status:{self.run_id}:{agent_id}'
+            results = task_delta.get(results_index[agent_id], state.get(results_index[agent_id]))
+            if results is not None and state.get(status_key) is None:
+                logger.info(f'Research step {agent_id} already completed, reusing its results')
+                completed += 1
+                continue
+            if state.get(status_key) is not None:
+                # The step is retried, so its partial outcome no longer applies
+                task_delta[status_key] = None
 
             if step.get('action') == 'arxiv_search':
-                sub_agents.append(
-                    ArxivAgent(
-                        name='arxiv_search',
-                        run_id=str(self.run_id),
-                        agent_id=str(agent_id),
-                        document_service=self.services.document_service,
-                    ),
+                pool = 'arxiv'
+                branch: BaseAgent = ArxivAgent(
+                    name='arxiv_search',
+                    run_id=str(self.run_id),
+                    agent_id=str(agent_id),
+                    document_service=self.services.document_service,
+                    ingestion_queue=self.services.ingestion_queue if config.ingest_queue else None,
                 )
             else:
-                sub_agents.append(
-                    WebSearchAgent(
-                        name='web_search', run_id=str(self.run_id), agent_id=str(agent_id),
-                    ),
+                pool = 'web'
+                branch = WebSearchAgent(
+                    name='web_search', run_id=str(self.run_id), agent_id=str(agent_id),
                 )
+            budget = config.arxiv_branch_deadline if pool == 'arxiv' else config.web_branch_deadline
+            sub_agents.append(
+                ScheduledBranch(
+                    name=f'{pool}_{agent_id}', branch=branch, pool=pool,
+                    run_id=str(self.run_id), agent_id=agent_id, budget=budget,
+                ),
+            )
+
+        task_delta[f'results_index:{self.run_id}'] = results_index
 
         yield Event(
             author=self.name,
@@ -80,7 +241,8 @@ class ResearchAgent(BaseAgent):
                 role='assistant',
                 parts=[
                     types.Part(
-                        text='Starting parallel research execution',
+                        text='Starting parallel research execution'
+                        + (f' ({completed} of {len(steps)} steps already completed)' if completed else ''),
                     ),
                 ],
             ),
@@ -92,8 +254,14 @@ class ResearchAgent(BaseAgent):
             sub_agents=sub_agents,
         )
 
-        async for ev in parallel.run_async(context):
-            yield ev
+        # Branches inherit the research deadline, which leaves the answer its reserve
+        with span('research', branches=len(sub_agents)), deadline_scope(
+            config.research_deadline, reserve=config.deadline_answer_reserve,
+        ):
+            async for ev in parallel.run_async(context):
+                yield ev
+
+        logger.debug(f'Branch scheduler metrics: {branch_scheduler.metrics()}')
 
         yield Event(
             author=self.name,
@@ -112,3 +280,9 @@ class ResearchAgent(BaseAgent):
         )
         async for ev in aggregate.run_async(context):
             yield ev
+
+        pack = ContextPackStep(
+            name='pack', description='Pack the aggregated results into a token-budgeted context', run_id=self.run_id,
+        )
+        async for ev in pack.run_async(context):
+            yield ev
@@ -0,0 +1,214 @@
+import asyncio
+import re
+import time
+from typing import Optional
+
+from google.adk.agents import LlmAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event
+
+from multi_tool_agent.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_STOPWORDS = frozenset({
+    'the', 'and', 'for', 'with', 'what', 'are', 'how', 'does', 'about', 'into',
+    'from', 'that', 'this', 'these', 'those', 'which', 'who', 'why', 'when',
+    'tell', 'give', 'find', 'research', 'latest', 'current', 'recent', 'user',
+    'understand', 'information', 'wants', 'know', 'learn', 'explain', 'their',
+})
+
+
+def _terms(text: str) -> set[str]:
+    """
+    Extract the set of lowercase content words from a text.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        Set of words longer than two characters that are not stopwords
+    """
+    return {
+        word for word in re.findall(r'\w+', text.lower())
+        if len(word) > 2 and word not in _STOPWORDS
+    }
+
+
+def intent_overlap(user_intent: str, message: str) -> float:
+    """
+    Measure how much of the classified intent is grounded in the raw message.
+
+    Args:
+        user_intent: Intent produced by the classification agent
+        message: Raw user message the speculative plan was built from
+
+    Returns:
+        Fraction of intent terms that also appear in the message (0.0 - 1.0)
+    """
+    intent_terms = _terms(user_intent)
+    if not intent_terms:
+        return 0.0
+    return len(intent_terms & _terms(message)) / len(intent_terms)
+
+
+class SpeculationStats:
+    """Process-wide counters for speculative planning outcomes."""
+
+    def __init__(self) -> None:
+        """Initialize empty speculation counters."""
+        self.committed = 0
+        self.discarded = 0
+        self.saved_seconds = 0.0
+        self.wasted_seconds = 0.0
+
+    def record_commit(self, saved_seconds: float) -> None:
+        """
+        Record a speculative plan that was committed.
+
+        Args:
+            saved_seconds: Latency hidden by overlapping planning with classification
+        """
+        self.committed += 1
+        self.saved_seconds += saved_seconds
+
+    def record_discard(self, wasted_seconds: float) -> None:
+        """
+        Record a speculative plan that was cancelled or discarded.
+
+        Args:
+            wasted_seconds: Time the discarded plan spent running
+        """
+        self.discarded += 1
+        self.wasted_seconds += wasted_seconds
+
+    @property
+    def waste_ratio(self) -> float:
+        """
+        Fraction of speculative plans that were thrown away.
+
+        Returns:
+            Discarded plans divided by all speculative plans
+        """
+        total = self.committed + self.discarded
+        return self.discarded / total if total else 0.0
+
+    def summary(self) -> dict[str, float]:
+        """
+        Summarize the speculation counters.
+
+        Returns:
+            Dictionary with counts, saved and wasted seconds and the waste ratio
+        """
+        return {
+            'committed': self.committed,
+            'discarded': self.discarded,
+            'saved_seconds': round(self.saved_seconds, 3),
+            'wasted_seconds': round(self.wasted_seconds, 3),
+            'waste_ratio': round(self.waste_ratio, 3),
+        }
+
+
+speculation_stats = SpeculationStats()
+
+
+class SpeculativePlan:
+    """Runs the planning agent on the raw user message while classification is in flight."""
+
+    def __init__(self, plan_agent: LlmAgent, context: InvocationContext) -> None:
+        """
+        Start planning speculatively on a snapshot of the session.
+
+        The plan agent runs against a copy of the session so that its events are
+        buffered instead of being persisted; they only reach the session when the
+        plan is committed.
+
+        Args:
+            plan_agent: Planning agent to run speculatively
+            context: Invocation context of the current request
+        """
+        self.message = ''.join(
+            part.text or '' for part in (context.user_content.parts or [])
+        ) if context.user_content else ''
+        session = context.session.model_copy(
+            update={
+                'events': list(context.session.events),
+                'state': dict(context.session.state),
+            },
+        )
+        self._context = context.model_copy(update={'session': session})
+        self._plan_agent = plan_agent
+        self._started_at = time.perf_counter()
+        self._finished_at: Optional[float] = None
+        self._settled = False
+        self._task = asyncio.create_task(self._run())
+        logger.debug('Started speculative planning')
+
+    async def _run(self) -> list[Event]:
+        """
+        Run the plan agent and buffer its events.
+
+        Returns:
+            Events produced by the plan agent
+        """
+        events = [event async for event in self._plan_agent.run_async(self._context)]
+        self._finished_at = time.perf_counter()
+        return events
+
+    def _elapsed(self) -> float:
+        """
+        Time the speculative plan has been running.
+
+        Returns:
+            Seconds from start until completion, or until now if still running
+        """
+        return (self._finished_at or time.perf_counter()) - self._started_at
+
+    def discard(self, reason: str) -> None:
+        """
+        Cancel the speculative plan and record the wasted work.
+
+        Does nothing once the plan has been committed or discarded.
+
+        Args:
+            reason: Why the plan is being discarded
+        """
+        if self._settled:
+            return
+        self._settled = True
+        self._task.cancel()
+        speculation_stats.record_discard(self._elapsed())
+        logger.info(
+            f'Discarded speculative plan ({reason}), speculation stats: {speculation_stats.summary()}',
+        )
+
+    async def commit(self, user_intent: str, min_overlap: float) -> Optional[list[Event]]:
+        """
+        Commit the speculative plan if the classified intent matches the raw message.
+
+        Args:
+            user_intent: Intent produced by the classification agent
+            min_overlap: Minimum intent/message term overlap required to commit
+
+        Returns:
+            Buffered plan events to yield, or None if the plan was discarded
+        """
+        overlap = intent_overlap(user_intent, self.message)
+        if overlap < min_overlap:
+            self.discard(f'intent overlap {overlap:.2f} < {min_overlap:.2f}')
+            return None
+
+        classified_at = time.perf_counter()
+        try:
+            events = await self._task
+        except Exception as e:
+            self.discard(f'planning failed: {e}')
+            return None
+
+        self._settled = True
+        saved = min(self._finished_at or classified_at, classified_at) - self._started_at
+        speculation_stats.record_commit(saved)
+        logger.info(
+            f'Committed speculative plan, saved {saved:.3f}s, speculation stats: {speculation_stats.summary()}',
+        )
+        return events
@@ -1,15 +1,20 @@
 from collections.abc import AsyncGenerator
+from typing import Optional
 
 from google.adk.agents import BaseAgent
 from google.adk.agents.invocation_context import InvocationContext
 from google.adk.events import Event
 
-from multi_tool_agent.core.agents.research.arxiv.filter import filter_agent
+from multi_tool_agent.core.agents.research.arxiv.filter import create_filter_agent
 from multi_tool_agent.core.agents.research.arxiv.find import FindStep
 from multi_tool_agent.core.agents.research.arxiv.ingest import IngestStep
 from multi_tool_agent.core.agents.research.arxiv.rag import RAGStep
+from multi_tool_agent.core.ingestion import IngestionQueue
 from multi_tool_agent.data.document_service import DocumentIngestionService
+from multi_tool_agent.utils.deadline import current_deadline
+from multi_tool_agent.utils.deadline import remaining
 from multi_tool_agent.utils.logger import get_logger
+from multi_tool_agent.utils.tracing import span
 
 logger = get_logger(__name__)
 
@@ -24,6 +29,7 @@ class ArxivAgent(BaseAgent):
         run_id: str,
         agent_id: str,
         document_service: DocumentIngestionService,
+        ingestion_queue: Optional[IngestionQueue] = None,
     ) -> None:
         """
         Initialize the ArXiv agent.
@@ -33,6 +39,7 @@ class ArxivAgent(BaseAgent):
             run_id: Unique identifier for the current run
             agent_id: Unique identifier for this agent instance
             document_service: Service for document ingestion and retrieval
+            ingestion_queue: Queue ingesting the papers (None ingests them inline)
         """
         super().__init__(name=name)
         self._run_id = run_id
@@ -41,8 +48,11 @@ class ArxivAgent(BaseAgent):
         self._find_step = FindStep(
             name='find_step', description='Find papers on arxiv', run_id=run_id, agent_id=agent_id,
         )
+        self._filter_agent = create_filter_agent(run_id, agent_id)
         self._ingest_step = IngestStep(
-            name='ingest_step', description='Ingest documents', run_id=run_id, document_service=document_service,
+            name='ingest_step', description='Ingest documents',
+            run_id=run_id, agent_id=agent_id, document_service=document_service,
+            ingestion_queue=ingestion_queue,
         )
         self._rag_step = RAGStep(
             name='rag_step', description='Perform RAG',
@@ -53,27 +63,42 @@ class ArxivAgent(BaseAgent):
         """
         Execute the complete ArXiv research workflow.
 
+        The workflow runs under the branch deadline set by the research stage:
+        ingestion stops early enough to leave retrieval ARXIV_RAG_RESERVE seconds,
+        so a slow download yields a partial result instead of no result. In a
+        resumed run, the search and the filtering are skipped when their results
+        were checkpointed, and ingestion skips the papers already ingested.
+
         Args:
             context: Invocation context containing session state and configuration
 
         Yields:
             Events from each step of the workflow
         """
+        budget = remaining(current_deadline())
         logger.debug(
-            f'Starting ArXiv research workflow for agent {self._agent_id}',
+            f'Starting ArXiv research workflow for agent {self._agent_id}'
+            + (f' with {budget:.1f}s left' if budget is not None else ''),
         )
 
-        logger.debug('Starting ArXiv paper search step')
-        async for event in self._find_step.run_async(context):
-            yield event
+        state = context.session.state
+        if state.get(f'candidates:{self._run_id}:{self._agent_id}') is None:
+            logger.debug('Starting ArXiv paper search step')
+            async for event in self._find_step.run_async(context):
+                yield event
 
-        logger.debug('Starting paper filtering step')
-        async for event in filter_agent.run_async(context):
-            yield event
+        if state.get(f'paper_ids:{self._run_id}:{self._agent_id}') is None:
+            logger.debug('Starting paper filtering step')
+            with span('arxiv.filter'):
+                async for event in self._filter_agent.run_async(context):
+                    yield event
+        else:
+            logger.debug('Reusing the checkpointed paper selection')
 
         logger.debug('Starting paper ingestion step')
-        async for event in self._ingest_step.run_async(context):
-            yield event
+        with span('arxiv.ingest'):
+            async for event in self._ingest_step.run_async(context):
+                yield event
 
         logger.debug('Starting RAG step')
         async for event in self._rag_step.run_async(context):
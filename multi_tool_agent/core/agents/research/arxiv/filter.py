@@ -1,7 +1,12 @@
+import json
+
 from google.adk.agents import LlmAgent
+from google.adk.agents.readonly_context import ReadonlyContext
 from pydantic import BaseModel
 from pydantic import Field
 
+from multi_tool_agent.core.routing import model_router
+
 
 class PaperMeta(BaseModel):
     """Metadata for an individual ArXiv paper."""
@@ -27,7 +32,6 @@ class PaperIDs(BaseModel):
     )
 
 
-GEMINI_MODEL = 'gemini-2.0-flash'
 PAPERS_NUM = 3
 
 system_prompt = f"""You are a Research Search Agent.
@@ -48,12 +52,34 @@ Output rules (strict):
 - Do not include explanations, text outside the JSON, or formatting such as Markdown.
 """
 
-filter_agent = LlmAgent(
-    name='FilterAgent',
-    model=GEMINI_MODEL,
-    instruction=system_prompt,
-    description='Filter papers',
-    input_schema=PapersMetas,
-    output_schema=PaperIDs,
-    output_key='paper_ids',
-)
+def create_filter_agent(run_id: str, agent_id: str) -> LlmAgent:
+    """
+    Create a filter agent bound to the state keys of a single ArXiv branch.
+
+    Each ArXiv branch gets its own instance reading `candidates:{run_id}:{agent_id}`
+    and writing `paper_ids:{run_id}:{agent_id}`, so several branches can run in
+    parallel without overwriting each other's selections.
+
+    Args:
+        run_id: Unique identifier for the current run
+        agent_id: Unique identifier of the owning ArXiv agent
+
+    Returns:
+        LlmAgent that selects the most relevant candidate papers
+    """
+    candidates_key = f'candidates:{run_id}:{agent_id}'
+
+    def instruction(context: ReadonlyContext) -> str:
+        candidates = context.state.get(candidates_key, [])
+        return f'{system_prompt}\n**Candidate papers:**\n{json.dumps(candidates, ensure_ascii=False)}\n'
+
+    return LlmAgent(
+        name=f'filter_{agent_id}',
+        model=model_router.model('filter'),
+        instruction=instruction,
+        description='Filter papers',
+        input_schema=PapersMetas,
+        output_schema=PaperIDs,
+        output_key=f'paper_ids:{run_id}:{agent_id}',
+        **model_router.callbacks('filter'),
+    )
@@ -1,13 +1,14 @@
-import json
 from collections.abc import AsyncGenerator
 
 from google.adk.agents import BaseAgent
 from google.adk.agents.invocation_context import InvocationContext
 from google.adk.events import Event
+from google.adk.events import EventActions
 from google.genai import types
 
-from multi_tool_agent.core.tools.arxiv import search_arxiv
+from multi_tool_agent.core.tools.arxiv import search_arxiv_cached
 from multi_tool_agent.utils.logger import get_logger
+from multi_tool_agent.utils.tracing import span
 
 logger = get_logger(__name__)
 
@@ -48,20 +49,25 @@ class FindStep(BaseAgent):
             context: Invocation context containing session state and other data
 
         Yields:
-            Event containing the search results
+            Event storing the candidate papers in session state
         """
         query = context.session.state[f'query:{self.run_id}:{self.agent_id}']
         logger.debug(f'Executing ArXiv search for query: "{query}"')
 
-        papers_meta = search_arxiv(query)
+        with span('arxiv.find'):
+            papers_meta = await search_arxiv_cached(query)
         logger.info(f'ArXiv search returned {len(papers_meta)} papers')
 
+        step_delta: dict[str, object] = {
+            f'candidates:{self.run_id}:{self.agent_id}': papers_meta,
+        }
         yield Event(
             author=self.name,
             content=types.Content(
                 role='assistant',
-                parts=[types.Part(text=json.dumps(papers_meta))],
+                parts=[types.Part(text=f'Found {len(papers_meta)} candidate papers on ArXiv')],
             ),
+            actions=EventActions(state_delta=step_delta),
         )
 
 
@@ -1,16 +1,23 @@
+import asyncio
 from collections.abc import AsyncGenerator
 from typing import Any
+from typing import Optional
 
 from google.adk.agents import BaseAgent
 from google.adk.agents.invocation_context import InvocationContext
 from google.adk.events import Event
+from google.adk.events import EventActions
 from google.genai import types
 from pydantic import BaseModel
 from pydantic import ConfigDict
 from pydantic import Field
 
-from multi_tool_agent.core.tools.arxiv import get_arxiv_paper
+from multi_tool_agent.core.ingestion import IngestionQueue
+from multi_tool_agent.core.tools.arxiv import fetch_arxiv_paper_async
 from multi_tool_agent.data.document_service import DocumentIngestionService
+from multi_tool_agent.utils.config import config
+from multi_tool_agent.utils.deadline import deadline_scope
+from multi_tool_agent.utils.deadline import remaining
 from multi_tool_agent.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -29,40 +36,149 @@ class IngestStep(BaseAgent):
 
     model_config = ConfigDict(arbitrary_types_allowed=True, extra='allow')
     document_service: DocumentIngestionService
+    ingestion_queue: Optional[IngestionQueue] = None
     name: str = ''
     description: str = ''
     run_id: str = ''
+    agent_id: str = ''
 
     def __init__(self, **kwargs: Any) -> None:
         """
         Initialize the IngestStep agent.
 
         Args:
-            **kwargs: Keyword arguments including document_service and configuration
+            **kwargs: Keyword arguments including document_service, ingestion_queue and configuration
         """
         super().__init__(**kwargs)
 
+    async def _ingest_paper(
+        self,
+        paper_id: str,
+        collection_name: str,
+        semaphore: asyncio.Semaphore,
+    ) -> tuple[str, bool]:
+        """
+        Download, parse, embed and upsert a single paper.
+
+        The download is hedged across the PDF mirrors and parsing runs in a worker
+        thread, so that several papers can move through the pipeline at once: while
+        one paper is being parsed, another can already be embedding or upserting.
+        Papers already in the paper cache are neither downloaded nor parsed.
+
+        With an ingestion queue, the paper is ingested by the queue's workers
+        instead, and the semaphore is not used since the pool bounds them.
+
+        Args:
+            paper_id: ArXiv ID of the paper to ingest
+            collection_name: Name of the collection to ingest into
+            semaphore: Semaphore bounding the number of papers in flight
+
+        Returns:
+            Tuple of the paper ID and whether ingestion succeeded
+        """
+        if self.ingestion_queue is not None:
+            return paper_id, await self.ingestion_queue.ingest(paper_id, collection_name)
+
+        async with semaphore:
+            logger.info(f'Starting ingestion of paper {paper_id}')
+            try:
+                document_id, text, metadata = await fetch_arxiv_paper_async(paper_id)
+            except Exception as e:
+                logger.error(
+                    f'Error fetching ArXiv paper {paper_id}: {e}', exc_info=True,
+                )
+                return paper_id, False
+            success = await self.document_service.ingest_document(
+                document_id, text, metadata, collection_name, max_length=3000,
+            )
+            logger.info(f'Completed ingestion of paper {paper_id}')
+            return paper_id, success
+
     async def _run_async_impl(self, context: InvocationContext) -> AsyncGenerator[Event, None]:
         """
         Execute the paper ingestion step.
 
+        Papers are ingested concurrently, through the ingestion queue when there
+        is one, and an event is emitted as each one completes. The step finishes
+        once every paper is done, or earlier when the configured quorum or
+        deadline is reached, in which case the step stops waiting for the
+        remaining papers and retrieval runs on what has been ingested. Queued
+        jobs keep running in the background; inline ones are cancelled. The
+        deadline is the earlier of ARXIV_INGEST_DEADLINE and the branch deadline
+        less the time kept for retrieval.
+
+        The papers ingested so far are checkpointed under
+        `ingested:{run_id}:{agent_id}` as each one completes; a resumed run only
+        ingests the others into the run's existing collection.
+
         Args:
             context: Invocation context containing session state and paper IDs
 
         Yields:
-            Event indicating completion of the ingestion process
+            Events reporting per-paper completion and the overall ingestion result
         """
-        content = context.session.state['paper_ids']
+        content = context.session.state.get(
+            f'paper_ids:{self.run_id}:{self.agent_id}', {},
+        )
         collection_name = context.session.state[f'collection_name:{self.run_id}']
         paper_ids = PaperIDs(**content)
+        ingested_key = f'ingested:{self.run_id}:{self.agent_id}'
+        ingested: list[str] = list(context.session.state.get(ingested_key) or [])
+        if ingested:
+            logger.info(f'Resuming ingestion with {len(ingested)} papers already ingested')
 
-        for paper_id in paper_ids.ids:
-            logger.info(f'Starting ingestion of paper {paper_id}')
-            document_id, text, metadata = get_arxiv_paper(paper_id)
-            await self.document_service.ingest_document(document_id, text, metadata, collection_name, max_length=3000)
-            logger.info(f'Completed ingestion of paper {paper_id}')
+        semaphore = asyncio.Semaphore(max(1, config.arxiv_ingest_concurrency))
+        tasks = {
+            asyncio.create_task(self._ingest_paper(paper_id, collection_name, semaphore)): paper_id
+            for paper_id in paper_ids.ids if paper_id not in ingested
+        }
+        pending = set(tasks)
+        quorum = config.arxiv_ingest_quorum or len(paper_ids.ids)
+
+        completed = len(ingested)
+        timed_out = False
+        try:
+            with deadline_scope(config.arxiv_ingest_deadline, reserve=config.arxiv_rag_reserve) as deadline:
+                while pending and len(ingested) < quorum:
+                    timeout = None if deadline is None else max(0.0, remaining(deadline))
+                    done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                    if not done:
+                        logger.warning(f'Ingestion deadline reached with {len(pending)} papers pending')
+                        timed_out = True
+                        break
+
+                    for task in done:
+                        paper_id, success = task.result()
+                        completed += 1
+                        if success:
+                            ingested.append(paper_id)
+                        status = 'Ingested' if success else 'Failed to ingest'
+                        yield Event(
+                            author=self.name,
+                            content=types.Content(
+                                role='assistant',
+                                parts=[
+                                    types.Part(
+                                        text=f'{status} paper {paper_id} ({completed}/{len(paper_ids.ids)})',
+                                    ),
+                                ],
+                            ),
+                            actions=EventActions(state_delta={ingested_key: list(ingested)} if success else {}),
+                        )
+        finally:
+            for task in pending:
+                task.cancel()
+
+        step_delta: dict[str, object] = {}
+        if pending:
+            skipped = sorted(tasks[task] for task in pending)
+            logger.info(f'Skipping {len(skipped)} papers still being ingested')
+            step_delta[f'status:{self.run_id}:{self.agent_id}'] = {
+                'status': 'partial', 'source': 'arxiv', 'reason': 'deadline' if timed_out else 'quorum',
+                'skipped_papers': skipped,
+            }
 
-        result_message = f'Successfully ingested {len(paper_ids.ids)} papers'
+        result_message = f'Successfully ingested {len(ingested)} papers'
         logger.info(result_message)
         yield Event(
             author=self.name,
@@ -70,4 +186,5 @@ class IngestStep(BaseAgent):
                 role='assistant',
                 parts=[types.Part(text=result_message)],
             ),
+            actions=EventActions(state_delta=step_delta),
         )
@@ -1,4 +1,3 @@
-import json
 from collections.abc import AsyncGenerator
 from typing import Any
 
@@ -11,6 +10,7 @@ from pydantic import ConfigDict
 
 from multi_tool_agent.data.document_service import DocumentIngestionService
 from multi_tool_agent.utils.logger import get_logger
+from multi_tool_agent.utils.tracing import span
 
 logger = get_logger(__name__)
 
@@ -51,13 +51,14 @@ class RAGStep(BaseAgent):
             f'Executing RAG search for query: "{query}" in collection: {collection_name}',
         )
 
-        docs = await self.document_service.search_documents(query, collection_name=collection_name)
-        docs_text = json.dumps(docs, ensure_ascii=False, indent=2)
+        with span('rag', collection=collection_name) as rag_span:
+            docs = await self.document_service.search_documents(query, collection_name=collection_name)
+            rag_span.set(results=len(docs))
 
         logger.info(f'RAG search returned {len(docs)} documents')
 
         step_delta: dict[str, object] = {
-            f'results:{self.run_id}:{self.agent_id}': docs_text,
+            f'results:{self.run_id}:{self.agent_id}': docs,
         }
         yield Event(
             author=self.name,
@@ -1,15 +1,23 @@
-import os
+import json
 from collections.abc import AsyncGenerator
 
 from google.adk.agents import BaseAgent
 from google.adk.agents import LlmAgent
 from google.adk.agents.invocation_context import InvocationContext
+from google.adk.agents.readonly_context import ReadonlyContext
 from google.adk.events import Event
-from google.adk.tools.mcp_tool.mcp_session_manager import StdioConnectionParams
-from google.adk.tools.mcp_tool.mcp_toolset import MCPToolset
-from mcp import StdioServerParameters
-
+from google.adk.events import EventActions
+from google.genai import types
+
+from multi_tool_agent.core.routing import model_router
+from multi_tool_agent.core.tools.mcp_pool import tavily_mcp_pool
+from multi_tool_agent.core.tools.tavily import create_tavily_tool
+from multi_tool_agent.utils.config import config
+from multi_tool_agent.utils.deadline import current_deadline
+from multi_tool_agent.utils.deadline import DeadlineExceeded
+from multi_tool_agent.utils.deadline import iterate_until
 from multi_tool_agent.utils.logger import get_logger
+from multi_tool_agent.utils.tracing import span
 
 logger = get_logger(__name__)
 
@@ -64,36 +72,63 @@ class WebSearchAgent(BaseAgent):
         self._run_id = run_id
         self._agent_id = agent_id
 
+        if config.web_search_backend == 'native':
+            search_tool = create_tavily_tool(run_id)
+        else:
+            search_tool = tavily_mcp_pool.acquire()
+
         self._web_search_llm = LlmAgent(
-            model='gemini-2.0-flash',
+            model=model_router.model('web_search'),
             name=f'web_search_{agent_id}',
-            instruction=system_prompt.format(
-                query=f'{{query:{self._run_id}:{self._agent_id}}}',
-            ),
-            tools=[
-                MCPToolset(
-                    connection_params=StdioConnectionParams(
-                        server_params=StdioServerParameters(
-                            command='npx',
-                            args=['-y', 'tavily-mcp@latest'],
-                            env={
-                                'TAVILY_API_KEY': os.getenv(
-                                    'TAVILY_API_KEY', '',
-                                ),
-                            },
-                        ),
-                        timeout=30.0,
-                    ),
-                    tool_filter=['tavily-search'],
-                ),
-            ],
+            instruction=self._instruction,
+            tools=[search_tool],
             output_key=f'results:{self._run_id}:{self._agent_id}',
+            **model_router.callbacks('web_search'),
+        )
+
+    def _instruction(self, context: ReadonlyContext) -> str:
+        """
+        Build the web search instruction for this agent's query.
+
+        Args:
+            context: Read-only context exposing the session state
+
+        Returns:
+            System instruction for the web search LLM
+        """
+        return system_prompt.format(
+            query=context.state.get(f'query:{self._run_id}:{self._agent_id}', ''),
         )
 
+    @staticmethod
+    def _format_partial(responses: list[dict]) -> str:
+        """
+        Render the raw search results gathered before the deadline as a web result.
+
+        Args:
+            responses: Responses of the search tool calls made so far
+
+        Returns:
+            Result text listing each search hit with its source URL
+        """
+        lines = []
+        for response in responses:
+            results = response.get('results')
+            if isinstance(results, list):
+                for result in results:
+                    lines.append(f'- {result.get("title", "")} ({result.get("url", "")}): {result.get("content", "")}')
+            else:
+                lines.append(f'- {json.dumps(response, ensure_ascii=False, default=str)}')
+        return 'Unsummarized web search results (deadline reached):\n' + '\n'.join(lines)
+
     async def _run_async_impl(self, context: InvocationContext) -> AsyncGenerator[Event, None]:
         """
         Execute the web search workflow.
 
+        When the branch deadline passes before the LLM has summarized its
+        searches, the LLM is cancelled and the raw search results gathered so far
+        become the (partial) result of this step.
+
         Args:
             context: Invocation context containing session state and configuration
 
@@ -105,7 +140,28 @@ class WebSearchAgent(BaseAgent):
         )
         logger.debug(f'Starting web search for query: "{query}"')
 
-        async for event in self._web_search_llm.run_async(context):
-            yield event
+        responses: list[dict] = []
+        try:
+            with span('web_search', backend=config.web_search_backend):
+                async for event in iterate_until(self._web_search_llm.run_async(context), current_deadline()):
+                    responses += [response.response for response in event.get_function_responses() if response.response]
+                    yield event
+        except DeadlineExceeded:
+            logger.warning(f'Web search for agent {self._agent_id} reached its deadline after {len(responses)} searches')
+            status = 'partial' if responses else 'skipped'
+            step_delta: dict[str, object] = {
+                f'status:{self._run_id}:{self._agent_id}': {'status': status, 'source': 'web', 'reason': 'deadline'},
+            }
+            if responses:
+                step_delta[f'results:{self._run_id}:{self._agent_id}'] = self._format_partial(responses)
+            yield Event(
+                author=self.name,
+                content=types.Content(
+                    role='assistant',
+                    parts=[types.Part(text=f'Web search deadline reached with {len(responses)} searches done')],
+                ),
+                actions=EventActions(state_delta=step_delta),
+            )
+            return
 
         logger.info(f'Completed web search for agent {self._agent_id}')
@@ -0,0 +1,67 @@
+import time
+from typing import Any
+from typing import Optional
+
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event
+from google.adk.events import EventActions
+
+from multi_tool_agent.utils.config import config
+
+# Session state key of the checkpoint of the session's unfinished run
+CHECKPOINT_KEY = 'run_checkpoint'
+
+
+def request_text(context: InvocationContext) -> str:
+    """
+    Extract the text of the user message that started the invocation.
+
+    Args:
+        context: Invocation context of the request
+
+    Returns:
+        Concatenated text parts of the user message (empty if there is none)
+    """
+    if not context.user_content:
+        return ''
+    return ''.join(part.text or '' for part in (context.user_content.parts or []))
+
+
+def resumable_checkpoint(context: InvocationContext) -> Optional[dict[str, Any]]:
+    """
+    Find the checkpoint of an unfinished run that the current request retries.
+
+    A run is resumed when the session holds the checkpoint of a run that did not
+    complete, for the same request text, written less than RUN_CHECKPOINT_TTL
+    seconds ago.
+
+    Args:
+        context: Invocation context of the request
+
+    Returns:
+        Checkpoint of the run to resume, or None to start a new run
+    """
+    checkpoint = context.session.state.get(CHECKPOINT_KEY)
+    if not config.run_checkpoints or not checkpoint:
+        return None
+    if checkpoint.get('request') != request_text(context):
+        return None
+    if config.run_checkpoint_ttl > 0 and time.time() - checkpoint.get('updated_at', 0.0) > config.run_checkpoint_ttl:
+        return None
+    return checkpoint
+
+
+def checkpoint_event(author: str, checkpoint: Optional[dict[str, Any]]) -> Event:
+    """
+    Build the event persisting (or clearing) the session's run checkpoint.
+
+    Args:
+        author: Author of the event
+        checkpoint: Checkpoint to store, or None to clear it
+
+    Returns:
+        Event whose state delta stores the checkpoint
+    """
+    if checkpoint is not None:
+        checkpoint = {**checkpoint, 'updated_at': time.time()}
+    return Event(author=author, actions=EventActions(state_delta={CHECKPOINT_KEY: checkpoint}))
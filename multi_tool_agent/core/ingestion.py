@@ -0,0 +1,503 @@
+import asyncio
+import contextvars
+import os
+import sqlite3
+import threading
+import time
+from typing import Any
+from typing import Optional
+
+from multi_tool_agent.core.tools.arxiv import fetch_arxiv_paper_async
+from multi_tool_agent.core.tools.arxiv import paper_cache
+from multi_tool_agent.data.document_service import DocumentIngestionService
+from multi_tool_agent.utils.logger import get_logger
+from multi_tool_agent.utils.tracing import bind
+from multi_tool_agent.utils.tracing import bound_attributes
+from multi_tool_agent.utils.tracing import span
+
+logger = get_logger(__name__)
+
+# Priorities of the jobs: papers a request waits for run before pre-ingestion
+_REQUEST_PRIORITY = 1
+_PREINGEST_PRIORITY = 0
+
+# Trace attributes of the requester recorded with each job
+_TRACE_ATTRIBUTES = ('run_id', 'session_id')
+
+
+def _alive(pid: int) -> bool:
+    """
+    Check whether a process is running.
+
+    Args:
+        pid: Id of the process
+
+    Returns:
+        True if the process exists
+    """
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class IngestionQueue:
+    """
+    Durable queue of paper ingestion jobs served by a pool of workers.
+
+    A job downloads, parses, chunks, embeds and upserts one paper into one
+    collection. Jobs are recorded in a SQLite file before they run, so the jobs
+    of a process that dies are adopted and finished by the next queue opening
+    the file. Requests for a paper and collection that is already queued or
+    running, including an adopted job, share its completion future instead of
+    ingesting it twice. The SQLite file is only accessed from worker threads,
+    so that a slow or locked file does not block the event loop. Jobs
+    without a collection pre-ingest a paper: they only fill the paper and
+    embedding caches, so that the first run needing it skips the download,
+    the parsing and the embedding.
+    """
+
+    def __init__(
+        self,
+        document_service: DocumentIngestionService,
+        path: Optional[str],
+        workers: int,
+        max_attempts: int = 2,
+        max_length: int = 3000,
+        preingest_interval: float = 0.0,
+        preingest_top: int = 20,
+        preingest_window: float = 86400.0,
+        retention: float = 86400.0,
+    ) -> None:
+        """
+        Initialize the queue.
+
+        Args:
+            document_service: Document service embedding and storing the papers
+            path: SQLite file of the jobs (None keeps them in memory)
+            workers: Number of concurrent ingestion workers
+            max_attempts: Attempts of a job before it fails
+            max_length: Maximum length of the paper text that is ingested
+            preingest_interval: Seconds between pre-ingestions of the popular papers (0 = disabled)
+            preingest_top: Number of popular papers considered by each pre-ingestion
+            preingest_window: Seconds of request history defining the popular papers
+            retention: Seconds finished jobs are kept in the file
+        """
+        self.document_service = document_service
+        self.path = path
+        self.workers = max(1, workers)
+        self.max_attempts = max(1, max_attempts)
+        self.max_length = max_length
+        self.preingest_interval = preingest_interval
+        self.preingest_top = preingest_top
+        self.preingest_window = preingest_window
+        self.retention = retention
+        self.completed = 0
+        self.failed = 0
+        self.deduplicated = 0
+        self._futures: dict[tuple[str, str], asyncio.Future] = {}
+        self._tasks: list[asyncio.Task] = []
+        self._wakeup: Optional[asyncio.Event] = None
+        self._ready: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Lazily open the job table, adopting the unfinished jobs of dead processes.
+
+        Returns:
+            SQLite connection
+        """
+        # Opened by whichever thread gets here first
+        with self._db_lock:
+            if self._db is None:
+                if self.path:
+                    os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+                db = sqlite3.connect(self.path or ':memory:', timeout=30.0, check_same_thread=False)
+                db.execute('PRAGMA journal_mode=WAL')
+                db.execute(
+                    'CREATE TABLE IF NOT EXISTS jobs ('
+                    'id INTEGER PRIMARY KEY AUTOINCREMENT, paper_id TEXT NOT NULL, collection_name TEXT NOT NULL, '
+                    'priority INTEGER NOT NULL, status TEXT NOT NULL, attempts INTEGER NOT NULL DEFAULT 0, '
+                    'owner INTEGER NOT NULL, error TEXT, created_at REAL NOT NULL, updated_at REAL NOT NULL, '
+                    'run_id TEXT, session_id TEXT)',
+                )
+                # Job files created before the requester was recorded
+                columns = {row[1] for row in db.execute('PRAGMA table_info(jobs)')}
+                for column in _TRACE_ATTRIBUTES:
+                    if column not in columns:
+                        db.execute(f'ALTER TABLE jobs ADD COLUMN {column} TEXT')
+                db.execute('CREATE INDEX IF NOT EXISTS jobs_pending ON jobs (owner, status, priority, id)')
+                db.execute(
+                    'CREATE TABLE IF NOT EXISTS papers '
+                    '(paper_id TEXT PRIMARY KEY, requests INTEGER NOT NULL, last_requested_at REAL NOT NULL)',
+                )
+                owners = [row[0] for row in db.execute(
+                    "SELECT DISTINCT owner FROM jobs WHERE status IN ('queued', 'running') AND owner != ?",
+                    (os.getpid(),),
+                )]
+                db.execute(
+                    "DELETE FROM jobs WHERE status IN ('done', 'failed') AND updated_at < ?",
+                    (time.time() - self.retention,),
+                )
+                orphans = [owner for owner in owners if not _alive(owner)]
+                for owner in orphans:
+                    db.execute(
+                        "UPDATE jobs SET owner = ?, status = 'queued', updated_at = ? "
+                        "WHERE owner = ? AND status IN ('queued', 'running')",
+                        (os.getpid(), time.time(), owner),
+                    )
+                db.commit()
+                if orphans:
+                    logger.info(f'Adopted the unfinished ingestion jobs of {len(orphans)} exited processes')
+                self._db = db
+        return self._db
+
+    def _requeue(self) -> list[tuple[str, str]]:
+        """
+        Requeue the jobs this process left running and merge duplicate queued jobs.
+
+        Returns:
+            Paper IDs and collections of the queued jobs of this process
+        """
+        db = self._connect()
+        with self._db_lock:
+            db.execute(
+                "UPDATE jobs SET status = 'queued' WHERE owner = ? AND status = 'running'", (os.getpid(),),
+            )
+            # Adopted jobs may repeat a paper and collection already queued
+            db.execute(
+                "DELETE FROM jobs WHERE owner = ? AND status = 'queued' AND id NOT IN ("
+                "SELECT MIN(id) FROM jobs WHERE owner = ? AND status = 'queued' GROUP BY paper_id, collection_name)",
+                (os.getpid(), os.getpid()),
+            )
+            rows = db.execute(
+                "SELECT paper_id, collection_name FROM jobs WHERE owner = ? AND status = 'queued'", (os.getpid(),),
+            ).fetchall()
+            db.commit()
+        return [(paper_id, collection_name) for paper_id, collection_name in rows]
+
+    async def _prepare(self) -> None:
+        """Open the job table and register the futures of the queued jobs, so that requests join them."""
+        keys = await asyncio.to_thread(self._requeue)
+        for key in keys:
+            if key not in self._futures:
+                self._futures[key] = self._loop.create_future()
+        if keys:
+            logger.info(f'Resuming {len(keys)} queued ingestion jobs')
+
+    def start(self) -> None:
+        """Start the workers in the running event loop (idempotent per loop)."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._tasks:
+            return
+        # Futures and workers of a previous event loop cannot be awaited from this
+        # one; the jobs they were running are run again
+        self._futures.clear()
+        self._loop = loop
+        self._wakeup = asyncio.Event()
+        # The tasks get empty contexts rather than copies of the context of the
+        # request that happened to start them, so that their spans are not
+        # attributed to its run; each job binds the run that requested it
+        self._ready = loop.create_task(self._prepare(), context=contextvars.Context())
+        self._tasks = [
+            loop.create_task(self._work(index), context=contextvars.Context()) for index in range(self.workers)
+        ]
+        if self.preingest_interval > 0:
+            self._tasks.append(loop.create_task(self._preingest_loop(), context=contextvars.Context()))
+
+    def _record(self, paper_id: str, collection_name: str, priority: int, trace: dict[str, str]) -> None:
+        """
+        Insert a queued job and count the requests of its paper.
+
+        Args:
+            paper_id: ArXiv ID of the paper
+            collection_name: Collection to ingest into ('' to pre-ingest)
+            priority: Priority of the job
+            trace: Trace attributes of the requester (run_id and session_id)
+        """
+        now = time.time()
+        db = self._connect()
+        with self._db_lock:
+            db.execute(
+                'INSERT INTO jobs '
+                '(paper_id, collection_name, priority, status, owner, created_at, updated_at, run_id, session_id) '
+                "VALUES (?, ?, ?, 'queued', ?, ?, ?, ?, ?)",
+                (
+                    paper_id, collection_name, priority, os.getpid(), now, now,
+                    trace.get('run_id'), trace.get('session_id'),
+                ),
+            )
+            if priority == _REQUEST_PRIORITY:
+                db.execute(
+                    'INSERT INTO papers (paper_id, requests, last_requested_at) VALUES (?, 1, ?) '
+                    'ON CONFLICT (paper_id) DO UPDATE SET requests = requests + 1, last_requested_at = excluded.last_requested_at',
+                    (paper_id, now),
+                )
+            db.commit()
+
+    async def _enqueue(self, paper_id: str, collection_name: str, priority: int) -> asyncio.Future:
+        """
+        Record a job, or join the queued or running job of the same paper and collection.
+
+        Args:
+            paper_id: ArXiv ID of the paper
+            collection_name: Collection to ingest into ('' to pre-ingest)
+            priority: Priority of the job
+
+        Returns:
+            Future resolved with whether the job succeeded
+        """
+        self.start()
+        await asyncio.shield(self._ready)
+        key = (paper_id, collection_name)
+        future = self._futures.get(key)
+        if future is not None:
+            self.deduplicated += 1
+            return future
+
+        future = self._loop.create_future()
+        self._futures[key] = future
+        try:
+            trace = {name: value for name, value in bound_attributes().items() if name in _TRACE_ATTRIBUTES}
+            await asyncio.to_thread(self._record, paper_id, collection_name, priority, trace)
+        except Exception as e:
+            del self._futures[key]
+            future.set_exception(e)
+            # Mark the exception as retrieved when nobody joined the job
+            future.exception()
+            raise
+        self._wakeup.set()
+        return future
+
+    async def ingest(self, paper_id: str, collection_name: str) -> bool:
+        """
+        Ingest a paper into a collection through the queue and wait for it.
+
+        Cancelling the wait does not cancel the job, which other requests may share.
+
+        Args:
+            paper_id: ArXiv ID of the paper
+            collection_name: Collection to ingest into
+
+        Returns:
+            True if the paper was ingested, False otherwise
+        """
+        future = await asyncio.shield(self._enqueue(paper_id, collection_name, _REQUEST_PRIORITY))
+        return await asyncio.shield(future)
+
+    async def preingest(self, paper_ids: list[str]) -> int:
+        """
+        Queue the download, parsing and embedding of papers ahead of demand.
+
+        Papers already in the paper cache are skipped, and nothing is queued
+        when the paper cache is disabled.
+
+        Args:
+            paper_ids: ArXiv IDs of the papers
+
+        Returns:
+            Number of papers queued
+        """
+        if not paper_cache.enabled:
+            return 0
+        queued = 0
+        for paper_id in paper_ids:
+            if await paper_cache.get(paper_id) is None:
+                await self._enqueue(paper_id, '', _PREINGEST_PRIORITY)
+                queued += 1
+        return queued
+
+    def popular(self, limit: int, window: float) -> list[str]:
+        """
+        List the papers requested most often.
+
+        Args:
+            limit: Maximum number of papers
+            window: Only count papers requested in the last `window` seconds (0 = no limit)
+
+        Returns:
+            ArXiv IDs of the papers, most requested first
+        """
+        since = time.time() - window if window > 0 else 0.0
+        db = self._connect()
+        with self._db_lock:
+            rows = db.execute(
+                'SELECT paper_id FROM papers WHERE last_requested_at >= ? AND requests > 1 '
+                'ORDER BY requests DESC, last_requested_at DESC LIMIT ?',
+                (since, limit),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    async def preingest_popular(self, limit: int, window: float) -> int:
+        """
+        Pre-ingest the papers requested most often that are no longer cached.
+
+        Args:
+            limit: Maximum number of papers considered
+            window: Only consider papers requested in the last `window` seconds (0 = no limit)
+
+        Returns:
+            Number of papers queued
+        """
+        queued = await self.preingest(await asyncio.to_thread(self.popular, limit, window))
+        if queued:
+            logger.info(f'Pre-ingesting {queued} popular papers')
+        return queued
+
+    async def _preingest_loop(self) -> None:
+        """Periodically pre-ingest the popular papers until cancelled."""
+        while True:
+            await asyncio.sleep(self.preingest_interval)
+            try:
+                await self.preingest_popular(self.preingest_top, self.preingest_window)
+            except Exception as e:
+                logger.warning(f'Pre-ingestion of the popular papers failed: {e}')
+
+    def _claim(self) -> Optional[tuple[int, str, str, int, Optional[str], Optional[str]]]:
+        """
+        Claim the next queued job of this process.
+
+        Returns:
+            Id, paper ID, collection, attempt number, run_id and session_id of the
+            job, or None if the queue is empty
+        """
+        db = self._connect()
+        with self._db_lock:
+            row = db.execute(
+                "UPDATE jobs SET status = 'running', attempts = attempts + 1, updated_at = ? "
+                "WHERE id = (SELECT id FROM jobs WHERE owner = ? AND status = 'queued' ORDER BY priority DESC, id LIMIT 1) "
+                'RETURNING id, paper_id, collection_name, attempts, run_id, session_id',
+                (time.time(), os.getpid()),
+            ).fetchone()
+            db.commit()
+        return row
+
+    def _finish(self, job_id: int, status: str, error: Optional[str] = None) -> None:
+        """
+        Record the outcome of a job.
+
+        Args:
+            job_id: Id of the job
+            status: New status ('done', 'failed' or 'queued' to retry)
+            error: Error of the last attempt
+        """
+        db = self._connect()
+        with self._db_lock:
+            db.execute(
+                'UPDATE jobs SET status = ?, error = ?, updated_at = ? WHERE id = ?',
+                (status, error, time.time(), job_id),
+            )
+            db.commit()
+
+    async def _run(self, paper_id: str, collection_name: str) -> None:
+        """
+        Ingest one paper, or only fill the caches when there is no collection.
+
+        Args:
+            paper_id: ArXiv ID of the paper
+            collection_name: Collection to ingest into ('' to pre-ingest)
+
+        Raises:
+            RuntimeError: If the paper could not be stored in the collection
+        """
+        document_id, text, metadata = await fetch_arxiv_paper_async(paper_id)
+        if not collection_name:
+            chunks = self.document_service.chunk_document(text, self.max_length)
+            if chunks:
+                await self.document_service.embedding.embed_texts(chunks)
+            return
+        success = await self.document_service.ingest_document(
+            document_id, text, metadata, collection_name, max_length=self.max_length,
+        )
+        if not success:
+            raise RuntimeError(f'Could not store paper {paper_id} in collection {collection_name}')
+
+    async def _work(self, index: int) -> None:
+        """
+        Run queued jobs until cancelled.
+
+        Args:
+            index: Index of the worker
+        """
+        await asyncio.shield(self._ready)
+        while True:
+            # Cleared before claiming, so that a job recorded meanwhile wakes the worker again
+            self._wakeup.clear()
+            job = await asyncio.to_thread(self._claim)
+            if job is None:
+                await self._wakeup.wait()
+                continue
+
+            job_id, paper_id, collection_name, attempt, run_id, session_id = job
+            key = (paper_id, collection_name)
+            trace = {name: value for name, value in zip(_TRACE_ATTRIBUTES, (run_id, session_id)) if value}
+            try:
+                with bind(**trace), span(
+                    'ingest.job', paper_id=paper_id, attempt=attempt, preingest=not collection_name,
+                ):
+                    await self._run(paper_id, collection_name)
+            except asyncio.CancelledError:
+                # Requeued for the next queue opening the file
+                await asyncio.to_thread(self._finish, job_id, 'queued')
+                raise
+            except Exception as e:
+                if attempt < self.max_attempts:
+                    logger.warning(f'Ingestion of paper {paper_id} failed (attempt {attempt}), retrying: {e}')
+                    await asyncio.to_thread(self._finish, job_id, 'queued', repr(e))
+                    continue
+                logger.error(f'Ingestion of paper {paper_id} failed: {e}', exc_info=True)
+                await asyncio.to_thread(self._finish, job_id, 'failed', repr(e))
+                self.failed += 1
+                success = False
+            else:
+                await asyncio.to_thread(self._finish, job_id, 'done')
+                self.completed += 1
+                success = True
+
+            future = self._futures.pop(key, None)
+            if future is not None and not future.done():
+                future.set_result(success)
+
+    def metrics(self) -> dict[str, Any]:
+        """
+        Snapshot of the jobs by status and of the outcomes in this process.
+
+        Returns:
+            Dictionary of queue metrics
+        """
+        db = self._connect()
+        with self._db_lock:
+            rows = db.execute(
+                'SELECT status, COUNT(*) FROM jobs WHERE owner = ? GROUP BY status', (os.getpid(),),
+            ).fetchall()
+        return {
+            'workers': self.workers,
+            'jobs': dict(rows),
+            'waiting': len(self._futures),
+            'completed': self.completed,
+            'failed': self.failed,
+            'deduplicated': self.deduplicated,
+        }
+
+    async def close(self) -> None:
+        """Stop the workers, leaving the unfinished jobs queued in the file."""
+        tasks, self._tasks = self._tasks, []
+        if self._ready is not None:
+            tasks.append(self._ready)
+            self._ready = None
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        for future in self._futures.values():
+            future.cancel()
+        self._futures.clear()
@@ -0,0 +1,141 @@
+import time
+import uuid
+from typing import Any
+from typing import Optional
+
+from multi_tool_agent.data.document_service import DocumentIngestionService
+from multi_tool_agent.data.vector_stores.base import Document
+from multi_tool_agent.utils.logger import get_logger
+from multi_tool_agent.utils.tracing import span
+
+logger = get_logger(__name__)
+
+
+def describe_run(state: dict[str, Any], run_id: str) -> Optional[dict[str, Any]]:
+    """
+    Summarize a completed run for the registry from its session state.
+
+    Args:
+        state: Session state holding the run's transient keys
+        run_id: Unique identifier of the run
+
+    Returns:
+        Registry entry with the plan, the papers and web results of each step and
+        the collection, or None if a step was cut short or the state is incomplete
+    """
+    plan = state.get('research_plan') or {}
+    steps = plan.get('steps', [])
+    agent_ids = list(state.get(f'results_index:{run_id}') or {})
+    if not steps or len(agent_ids) != len(steps):
+        return None
+
+    described = []
+    for step, agent_id in zip(steps, agent_ids):
+        if state.get(f'status:{run_id}:{agent_id}') is not None:
+            return None
+        entry = {'action': step.get('action'), 'query': step.get('query', '')}
+        if step.get('action') == 'arxiv_search':
+            entry['paper_ids'] = list(state.get(f'ingested:{run_id}:{agent_id}') or [])
+        else:
+            entry['result'] = state.get(f'results:{run_id}:{agent_id}')
+        described.append(entry)
+
+    return {
+        'run_id': run_id,
+        'plan': plan,
+        'steps': described,
+        'collection_name': state.get(f'collection_name:{run_id}', run_id),
+    }
+
+
+class RunRegistry:
+    """
+    Registry of completed research runs, searchable by the similarity of their intent.
+
+    Each entry stores the embedding of the run's user intent in a dedicated vector
+    store collection, with the plan, the papers selected by each arXiv step, the
+    web results and the collection the papers were ingested into. A new request
+    with a close enough intent can then reuse the plan and the corpus instead of
+    searching, downloading and ingesting them again.
+    """
+
+    def __init__(
+        self,
+        document_service: DocumentIngestionService,
+        collection_name: str,
+        threshold: float,
+        ttl: float,
+    ) -> None:
+        """
+        Initialize the registry.
+
+        Args:
+            document_service: Document service whose embedding and vector store hold the registry
+            collection_name: Vector store collection of the registry
+            threshold: Minimum cosine similarity of a reusable run's intent
+            ttl: Maximum age in seconds of a reusable run (0 = no limit)
+        """
+        self.document_service = document_service
+        self.collection_name = collection_name
+        self.threshold = threshold
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    async def find(self, user_intent: str, candidates: int = 5) -> Optional[dict[str, Any]]:
+        """
+        Look up the most similar reusable run.
+
+        Args:
+            user_intent: Classified intent of the new request
+            candidates: Number of nearest runs considered
+
+        Returns:
+            Registry entry with its similarity under 'score', or None if no
+            recent enough run is similar enough
+        """
+        with span('registry.find') as find_span:
+            results = await self.document_service.search_documents(
+                user_intent, top_k=candidates, collection_name=self.collection_name,
+            )
+            now = time.time()
+            for result in results:
+                entry = result['metadata']
+                if result['score'] < self.threshold:
+                    break
+                if self.ttl > 0 and now - entry.get('created_at', 0.0) > self.ttl:
+                    continue
+                self.hits += 1
+                find_span.set(score=round(result['score'], 4), reused_run=entry.get('run_id'))
+                logger.info(f'Found reusable run {entry.get("run_id")} with similarity {result["score"]:.3f}')
+                return {**entry, 'score': result['score']}
+        self.misses += 1
+        return None
+
+    async def register(self, user_intent: str, entry: dict[str, Any]) -> bool:
+        """
+        Add a completed run to the registry.
+
+        Args:
+            user_intent: Classified intent of the run
+            entry: Registry entry built by describe_run()
+
+        Returns:
+            True if the run was registered, False otherwise
+        """
+        try:
+            with span('registry.register'):
+                vector = await self.document_service.embedding.embed_text(user_intent)
+                document = Document(
+                    id=str(uuid.uuid5(uuid.NAMESPACE_URL, entry['run_id'])),
+                    content=user_intent,
+                    metadata={**entry, 'user_intent': user_intent, 'created_at': time.time()},
+                    vector=vector,
+                )
+                success = await self.document_service.vector_store.add_documents([document], self.collection_name)
+        except Exception as e:
+            logger.error(f'Error registering run {entry["run_id"]}: {e}', exc_info=True)
+            return False
+        if success:
+            logger.info(f'Registered run {entry["run_id"]} for reuse')
+        return success
@@ -0,0 +1,269 @@
+import math
+import time
+from collections import deque
+from typing import Any
+from typing import AsyncGenerator
+from typing import Optional
+
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.models import BaseLlm
+from google.adk.models import LlmRequest
+from google.adk.models import LlmResponse
+from google.adk.models.registry import LLMRegistry
+from pydantic import Field
+
+from multi_tool_agent.utils.config import config
+from multi_tool_agent.utils.logger import get_logger
+from multi_tool_agent.utils.tracing import current_span
+
+logger = get_logger(__name__)
+
+
+class _Stage:
+    """Latency bookkeeping for one LLM stage."""
+
+    def __init__(self, name: str, model: str, budget: float, window: int) -> None:
+        """
+        Initialize the stage.
+
+        Args:
+            name: Name of the stage
+            model: Primary model of the stage
+            budget: p95 latency budget in seconds (0 disables the fallback)
+            window: Number of recent calls the p95 is computed over
+        """
+        self.name = name
+        self.model = model
+        self.budget = budget
+        self.latencies: deque[float] = deque(maxlen=window)
+        self.fallback_until = 0.0
+        self.fallback_calls = 0
+        self.failed_calls = 0
+
+    @property
+    def p95(self) -> float:
+        """
+        95th percentile latency of the recent primary model calls.
+
+        Returns:
+            Latency in seconds, or 0.0 if no call was recorded
+        """
+        latencies = sorted(self.latencies)
+        return latencies[int(0.95 * (len(latencies) - 1))] if latencies else 0.0
+
+
+class ModelRouter:
+    """
+    Latency-aware router choosing the model of each LLM stage.
+
+    Every stage runs on its configured primary model. When the p95 latency of the
+    primary model exceeds the stage's budget, calls of that stage are routed to the
+    faster fallback model for a cooldown period, after which the primary model is
+    tried again with a fresh latency window.
+    """
+
+    def __init__(self, fallback_model: str, window: int, cooldown: float, min_samples: int = 5) -> None:
+        """
+        Initialize the router.
+
+        Args:
+            fallback_model: Faster model used while a stage is over budget
+            window: Number of recent calls the p95 is computed over
+            cooldown: Seconds a stage stays on the fallback model
+            min_samples: Calls needed before the p95 is trusted
+        """
+        self.fallback_model = fallback_model
+        self.window = max(1, window)
+        self.cooldown = cooldown
+        self.min_samples = min_samples
+        self._stages: dict[str, _Stage] = {}
+        self._llms: dict[str, BaseLlm] = {}
+
+    def register(self, stage: str, model: str, budget: float) -> None:
+        """
+        Register an LLM stage with its primary model and latency budget.
+
+        Args:
+            stage: Name of the stage
+            model: Primary model of the stage
+            budget: p95 latency budget in seconds (0 disables the fallback)
+        """
+        self._stages[stage] = _Stage(stage, model, budget, self.window)
+
+    def model(self, stage: str) -> 'RoutedLlm':
+        """
+        Build the model of an LLM agent, timing every call of the stage.
+
+        Args:
+            stage: Name of the stage the agent belongs to
+
+        Returns:
+            Model routing and timing the calls of the stage
+        """
+        return RoutedLlm(model=self._stages[stage].model, stage=stage, router=self)
+
+    def llm(self, model: str) -> BaseLlm:
+        """
+        Get the shared client of a model.
+
+        Args:
+            model: Name of the model
+
+        Returns:
+            Model instance resolved through the ADK model registry
+        """
+        if model not in self._llms:
+            self._llms[model] = LLMRegistry.new_llm(model)
+        return self._llms[model]
+
+    def model_for(self, stage: str) -> str:
+        """
+        Choose the model the next call of a stage should use.
+
+        Args:
+            stage: Name of the stage
+
+        Returns:
+            Primary model, or the fallback model while the stage is over budget
+        """
+        state = self._stages[stage]
+        if state.fallback_until and time.monotonic() >= state.fallback_until:
+            logger.info(f'Stage {stage} cooldown elapsed, retrying model {state.model}')
+            state.fallback_until = 0.0
+            state.latencies.clear()
+        return self.fallback_model if state.fallback_until else state.model
+
+    def record(self, stage: str, model: str, latency: float, failed: bool = False) -> None:
+        """
+        Record the latency of a call and switch to the fallback if needed.
+
+        Args:
+            stage: Name of the stage
+            model: Model that served the call
+            latency: Call latency in seconds
+            failed: Whether the call raised, timed out or was cancelled
+        """
+        state = self._stages[stage]
+        if failed:
+            state.failed_calls += 1
+        if model != state.model:
+            state.fallback_calls += 1
+            return
+
+        if failed and state.budget > 0:
+            # A failed call counts against the budget however early it failed
+            latency = max(latency, math.nextafter(state.budget, math.inf))
+        state.latencies.append(latency)
+        if (
+            state.budget > 0
+            and not state.fallback_until
+            and state.model != self.fallback_model
+            and len(state.latencies) >= self.min_samples
+            and state.p95 > state.budget
+        ):
+            state.fallback_until = time.monotonic() + self.cooldown
+            logger.warning(
+                f'Stage {stage} p95 latency {state.p95:.2f}s exceeds budget {state.budget:.2f}s, '
+                f'routing to {self.fallback_model} for {self.cooldown:.0f}s',
+            )
+
+    def callbacks(self, stage: str) -> dict[str, Any]:
+        """
+        Build the model callbacks routing the calls of an LLM agent.
+
+        The calls themselves are timed by the agent's model (see `model`), so calls
+        that raise, time out or are cancelled are recorded too.
+
+        Args:
+            stage: Name of the stage the agent belongs to
+
+        Returns:
+            Keyword arguments for LlmAgent (before and after model callbacks)
+        """
+        def before_model(callback_context: CallbackContext, llm_request: LlmRequest) -> Optional[LlmResponse]:
+            model = self.model_for(stage)
+            llm_request.model = model
+            stage_span = current_span()
+            if stage_span is not None:
+                stage_span.set(model=model)
+                stage_span.add(llm_calls=1)
+            return None
+
+        def after_model(callback_context: CallbackContext, llm_response: LlmResponse) -> Optional[LlmResponse]:
+            # Streaming yields partial responses before the final aggregated one
+            if llm_response.partial:
+                return None
+            stage_span = current_span()
+            if stage_span is not None:
+                stage_span.add_usage(llm_response)
+            return None
+
+        return {'before_model_callback': before_model, 'after_model_callback': after_model}
+
+    def metrics(self) -> dict[str, Any]:
+        """
+        Snapshot of model choice and latency per stage.
+
+        Returns:
+            Dictionary of metrics keyed by stage name
+        """
+        return {
+            name: {
+                'model': state.model,
+                'active_model': self.fallback_model if state.fallback_until else state.model,
+                'budget_seconds': state.budget,
+                'p95_seconds': round(state.p95, 4),
+                'samples': len(state.latencies),
+                'fallback_calls': state.fallback_calls,
+                'failed_calls': state.failed_calls,
+            }
+            for name, state in self._stages.items()
+        }
+
+
+class RoutedLlm(BaseLlm):
+    """
+    Model of an LLM stage, delegating each call to the model chosen by the router.
+
+    The call is timed end to end, and recorded when it completes, raises, times
+    out or is cancelled, so a failing or hanging primary model also triggers the
+    fallback.
+    """
+
+    stage: str
+    router: ModelRouter = Field(exclude=True)
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False,
+    ) -> AsyncGenerator[LlmResponse, None]:
+        """
+        Generate content with the routed model of the stage.
+
+        Args:
+            llm_request: Request sent to the model, whose model name was set by the router
+            stream: Whether to stream the response
+
+        Yields:
+            Responses of the routed model
+        """
+        model = llm_request.model or self.model
+        started = time.perf_counter()
+        completed = False
+        try:
+            async for llm_response in self.router.llm(model).generate_content_async(llm_request, stream):
+                completed = completed or not llm_response.partial
+                yield llm_response
+        finally:
+            self.router.record(self.stage, model, time.perf_counter() - started, failed=not completed)
+
+
+model_router = ModelRouter(
+    fallback_model=config.fallback_model,
+    window=config.model_router_window,
+    cooldown=config.model_router_cooldown,
+)
+model_router.register('classify', config.classify_model, config.classify_latency_budget)
+model_router.register('plan', config.plan_model, config.plan_latency_budget)
+model_router.register('filter', config.filter_model, config.filter_latency_budget)
+model_router.register('web_search', config.web_search_model, config.web_search_latency_budget)
+model_router.register('answer', config.answer_model, config.answer_latency_budget)
@@ -0,0 +1,206 @@
+import asyncio
+import time
+from collections import deque
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+from multi_tool_agent.utils.config import config
+from multi_tool_agent.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class _Pool:
+    """Bookkeeping for one pool of branch slots."""
+
+    def __init__(self, name: str, limit: int) -> None:
+        """
+        Initialize the pool.
+
+        Args:
+            name: Name of the pool
+            limit: Maximum number of branches running at once
+        """
+        self.name = name
+        self.limit = limit
+        self.active = 0
+        self.waiting: OrderedDict[str, deque[asyncio.Future]] = OrderedDict()
+        self.wait_times: deque[float] = deque(maxlen=1000)
+        self.granted = 0
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        Number of branches waiting for a slot.
+
+        Returns:
+            Count of pending waiters across all sessions
+        """
+        return sum(
+            1 for waiters in self.waiting.values()
+            for waiter in waiters if not waiter.done()
+        )
+
+
+class BranchScheduler:
+    """
+    Process-wide scheduler bounding concurrent research branches.
+
+    Each branch type has its own pool with a global limit, and every session is
+    additionally capped across pools. Waiting branches are queued per session and
+    slots are handed out round-robin across sessions, so one session with many
+    steps cannot starve the others.
+    """
+
+    def __init__(self, pool_limits: dict[str, int], session_limit: int) -> None:
+        """
+        Initialize the scheduler.
+
+        Args:
+            pool_limits: Maximum concurrent branches for each pool name
+            session_limit: Maximum concurrent branches for a single session
+        """
+        self.session_limit = max(1, session_limit)
+        self._pools = {
+            name: _Pool(name, max(1, limit)) for name, limit in pool_limits.items()
+        }
+        self._session_active: dict[str, int] = {}
+
+    def _can_run(self, pool: _Pool, session_id: str) -> bool:
+        """
+        Check whether a branch of the session could start in the pool now.
+
+        Args:
+            pool: Pool the branch belongs to
+            session_id: Session owning the branch
+
+        Returns:
+            True if both the pool and the session have a free slot
+        """
+        return pool.active < pool.limit and self._session_active.get(session_id, 0) < self.session_limit
+
+    def _grant(self, pool: _Pool, session_id: str) -> None:
+        """
+        Account for a branch starting to run.
+
+        Args:
+            pool: Pool the branch belongs to
+            session_id: Session owning the branch
+        """
+        pool.active += 1
+        pool.granted += 1
+        self._session_active[session_id] = self._session_active.get(session_id, 0) + 1
+
+    def _dispatch(self) -> None:
+        """Hand free slots to waiting branches, round-robin across sessions."""
+        for pool in self._pools.values():
+            progress = True
+            while progress and pool.active < pool.limit:
+                progress = False
+                for session_id in list(pool.waiting):
+                    waiters = pool.waiting[session_id]
+                    while waiters and waiters[0].done():
+                        waiters.popleft()
+                    if not waiters:
+                        del pool.waiting[session_id]
+                        continue
+                    if not self._can_run(pool, session_id):
+                        continue
+
+                    self._grant(pool, session_id)
+                    waiters.popleft().set_result(None)
+                    # Rotate the session to the back of the queue for fairness
+                    pool.waiting.move_to_end(session_id)
+                    progress = True
+                    break
+
+    def _release(self, pool: _Pool, session_id: str) -> None:
+        """
+        Account for a branch finishing and wake up waiters.
+
+        Args:
+            pool: Pool the branch belonged to
+            session_id: Session owning the branch
+        """
+        pool.active -= 1
+        remaining = self._session_active.get(session_id, 1) - 1
+        if remaining > 0:
+            self._session_active[session_id] = remaining
+        else:
+            self._session_active.pop(session_id, None)
+        self._dispatch()
+
+    @asynccontextmanager
+    async def slot(self, pool_name: str, session_id: str) -> AsyncIterator[None]:
+        """
+        Hold a branch slot for the duration of the context.
+
+        Args:
+            pool_name: Pool the branch belongs to (e.g. 'arxiv' or 'web')
+            session_id: Session owning the branch
+
+        Yields:
+            None once the branch is allowed to run
+        """
+        pool = self._pools[pool_name]
+        queued_at = time.perf_counter()
+
+        if not pool.waiting and self._can_run(pool, session_id):
+            self._grant(pool, session_id)
+        else:
+            waiter = asyncio.get_running_loop().create_future()
+            pool.waiting.setdefault(session_id, deque()).append(waiter)
+            # Other waiters may be blocked only by their own session limit
+            self._dispatch()
+            logger.debug(
+                f'Queued {pool_name} branch of session {session_id} (queue depth {pool.queue_depth})',
+            )
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    # The slot was granted just before cancellation
+                    self._release(pool, session_id)
+                else:
+                    waiter.cancel()
+                    self._dispatch()
+                raise
+
+        wait_time = time.perf_counter() - queued_at
+        pool.wait_times.append(wait_time)
+        try:
+            yield
+        finally:
+            self._release(pool, session_id)
+
+    def metrics(self) -> dict[str, Any]:
+        """
+        Snapshot of queue depth, in-flight branches and wait times per pool.
+
+        Returns:
+            Dictionary of metrics keyed by pool name, plus active session count
+        """
+        pools: dict[str, Any] = {}
+        for name, pool in self._pools.items():
+            waits = sorted(pool.wait_times)
+            pools[name] = {
+                'limit': pool.limit,
+                'active': pool.active,
+                'queue_depth': pool.queue_depth,
+                'granted': pool.granted,
+                'wait_avg_seconds': round(sum(waits) / len(waits), 4) if waits else 0.0,
+                'wait_p95_seconds': round(waits[int(0.95 * (len(waits) - 1))], 4) if waits else 0.0,
+                'wait_max_seconds': round(waits[-1], 4) if waits else 0.0,
+            }
+        return {'pools': pools, 'active_sessions': len(self._session_active)}
+
+
+branch_scheduler = BranchScheduler(
+    pool_limits={
+        'arxiv': config.research_max_arxiv_branches,
+        'web': config.research_max_web_branches,
+    },
+    session_limit=config.research_max_branches_per_session,
+)
@@ -1,9 +1,13 @@
 # multi_tool_agent/core/services.py
+import os
 from typing import Optional
 
+from multi_tool_agent.core.ingestion import IngestionQueue
+from multi_tool_agent.core.registry import RunRegistry
 from multi_tool_agent.data.document_service import create_document_service
 from multi_tool_agent.data.document_service import DocumentIngestionService
 from multi_tool_agent.utils.config import Config
+from multi_tool_agent.utils.config import config
 from multi_tool_agent.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -12,15 +16,19 @@ logger = get_logger(__name__)
 class ServiceContainer:
     """Container for managing service dependencies."""
 
-    def __init__(self, config: Config) -> None:
+    def __init__(self, config: Config, document_service: Optional[DocumentIngestionService] = None) -> None:
         """
         Initialize the service container.
 
         Args:
             config: Configuration object containing service settings
+            document_service: Prebuilt document service (e.g. a stand-in for benchmarks),
+                created lazily from the configuration when omitted
         """
         self.config = config
-        self._document_service: Optional[DocumentIngestionService] = None
+        self._document_service: Optional[DocumentIngestionService] = document_service
+        self._run_registry: Optional[RunRegistry] = None
+        self._ingestion_queue: Optional[IngestionQueue] = None
         logger.debug('ServiceContainer initialized')
 
     @property
@@ -36,3 +44,44 @@ class ServiceContainer:
             self._document_service = create_document_service(self.config)
             logger.debug('Document service created successfully')
         return self._document_service
+
+    @property
+    def run_registry(self) -> RunRegistry:
+        """
+        Lazy-loaded registry of completed runs, stored alongside the documents.
+
+        Returns:
+            RunRegistry instance
+        """
+        if self._run_registry is None:
+            self._run_registry = RunRegistry(
+                self.document_service,
+                collection_name=self.config.run_registry_collection,
+                threshold=self.config.run_reuse_threshold,
+                ttl=self.config.run_reuse_ttl,
+            )
+        return self._run_registry
+
+    @property
+    def ingestion_queue(self) -> IngestionQueue:
+        """
+        Lazy-loaded paper ingestion queue, persisted under the cache directory.
+
+        Returns:
+            IngestionQueue instance
+        """
+        if self._ingestion_queue is None:
+            self._ingestion_queue = IngestionQueue(
+                self.document_service,
+                path=os.path.join(self.config.cache_dir, 'ingestion.sqlite') if self.config.cache_dir else None,
+                workers=self.config.ingest_workers,
+                max_attempts=self.config.ingest_max_attempts,
+                preingest_interval=self.config.ingest_preingest_interval,
+                preingest_top=self.config.ingest_preingest_top,
+                preingest_window=self.config.ingest_preingest_window,
+            )
+        return self._ingestion_queue
+
+
+# Process-wide container; building it is cheap since services are created on first use
+service_container = ServiceContainer(config)
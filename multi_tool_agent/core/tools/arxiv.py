@@ -1,13 +1,93 @@
+import asyncio
+import threading
 from io import BytesIO
+from typing import Optional
+from urllib.parse import urlsplit
 
-import feedparser
 import requests
-from PyPDF2 import PdfReader
 
+from multi_tool_agent.core.tools.mirrors import pdf_downloader
+from multi_tool_agent.utils.cache import TTLCache
+from multi_tool_agent.utils.config import config
 from multi_tool_agent.utils.logger import get_logger
+from multi_tool_agent.utils.tracing import current_span
+from multi_tool_agent.utils.tracing import span
 
 logger = get_logger(__name__)
 
+_QUERY_OPERATORS = frozenset({'AND', 'OR', 'ANDNOT'})
+
+search_cache = TTLCache(
+    'arxiv_search',
+    ttl=config.arxiv_search_cache_ttl,
+    directory=config.cache_dir or None,
+)
+
+paper_cache = TTLCache(
+    'arxiv_papers',
+    ttl=config.arxiv_paper_cache_ttl,
+    max_entries=64,
+    directory=config.cache_dir or None,
+    lease_timeout=config.arxiv_pdf_timeout,
+)
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def get_http_session() -> requests.Session:
+    """
+    Return the process-wide HTTP session for the arXiv API and PDF hosts.
+
+    The session keeps its connections alive, so consecutive searches and
+    downloads reuse the same TLS connection instead of handshaking every time.
+
+    Returns:
+        Shared requests.Session
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = requests.Session()
+    return _session
+
+
+def warm_up() -> None:
+    """
+    Open (or refresh) the pooled connections to the arXiv API and PDF mirror hosts.
+
+    Raises:
+        requests.RequestException: If a host cannot be reached
+    """
+    session = get_http_session()
+    hosts = {}
+    for url in (config.arxiv_api_url, *config.arxiv_pdf_urls):
+        parts = urlsplit(url)
+        hosts.setdefault(f'{parts.scheme}://{parts.netloc}', url)
+    for url in hosts.values():
+        # Any response will do: the point is the established connection
+        session.head(url, timeout=config.warmup_timeout)
+
+
+def normalize_arxiv_query(query: str) -> str:
+    """
+    Normalize a search query so that equivalent queries share one cache entry.
+
+    Whitespace is collapsed and terms are lowercased, except for the boolean
+    operators of the arXiv query syntax which are case-sensitive.
+
+    Args:
+        query: Raw search query string
+
+    Returns:
+        Canonical form of the query
+    """
+    return ' '.join(
+        term if term in _QUERY_OPERATORS else term.lower()
+        for term in query.split()
+    )
+
 
 def search_arxiv(query: str, max_results: int = 50, start: int = 0) -> list[dict[str, str]]:
     """
@@ -24,12 +104,19 @@ def search_arxiv(query: str, max_results: int = 50, start: int = 0) -> list[dict
     logger.debug(
         f'Searching ArXiv with query: "{query}", max_results: {max_results}, start: {start}',
     )
-    base_url = 'http://export.arxiv.org/api/query?'
-    params = f'search_query={query}&start={start}&max_results={max_results}'
-    url = base_url + params
+    params = {
+        'search_query': normalize_arxiv_query(query),
+        'start': start,
+        'max_results': max_results,
+    }
 
-    resp = requests.get(url)
+    resp = get_http_session().get(config.arxiv_api_url, params=params)
     resp.raise_for_status()
+    search_span = current_span()
+    if search_span is not None:
+        search_span.add(bytes=len(resp.content))
+
+    import feedparser
 
     feed = feedparser.parse(resp.text)
     papers = []
@@ -52,6 +139,118 @@ def search_arxiv(query: str, max_results: int = 50, start: int = 0) -> list[dict
     return papers
 
 
+async def search_arxiv_cached(query: str, max_results: int = 50, start: int = 0) -> list[dict[str, str]]:
+    """
+    Search arXiv through the result cache.
+
+    Results are cached per normalized query for ARXIV_SEARCH_CACHE_TTL seconds, and
+    concurrent identical searches share a single request to the arXiv API.
+
+    Args:
+        query: Search query string
+        max_results: Maximum number of results to return
+        start: Starting index for pagination
+
+    Returns:
+        List of dictionaries containing paper information (id, title, abstract, url)
+    """
+    key = f'{normalize_arxiv_query(query)}|{start}|{max_results}'
+    with span('arxiv.search') as search_span:
+        papers = await search_cache.get_or_fetch(
+            key, lambda: asyncio.to_thread(search_arxiv, query, max_results, start),
+        )
+        search_span.set(results=len(papers))
+    return papers
+
+
+def download_arxiv_pdf(arxiv_id: str) -> bytes:
+    """
+    Download the PDF of an arXiv paper, failing over across the configured mirrors.
+
+    Args:
+        arxiv_id: The arXiv paper ID (e.g., "2301.07041")
+
+    Returns:
+        Raw PDF bytes
+    """
+    logger.debug(f'Downloading ArXiv paper {arxiv_id}')
+    return pdf_downloader.fetch_sync(f'{arxiv_id}.pdf', get_http_session())
+
+
+async def download_arxiv_pdf_async(arxiv_id: str) -> bytes:
+    """
+    Download the PDF of an arXiv paper, hedging slow requests across the configured mirrors.
+
+    Args:
+        arxiv_id: The arXiv paper ID (e.g., "2301.07041")
+
+    Returns:
+        Raw PDF bytes
+    """
+    logger.debug(f'Downloading ArXiv paper {arxiv_id}')
+    return await pdf_downloader.fetch(f'{arxiv_id}.pdf')
+
+
+def parse_arxiv_pdf(arxiv_id: str, pdf_content: bytes) -> tuple[str, str, dict[str, str]]:
+    """
+    Extract the text of a downloaded arXiv PDF.
+
+    Args:
+        arxiv_id: The arXiv paper ID (e.g., "2301.07041")
+        pdf_content: Raw PDF bytes
+
+    Returns:
+        Tuple containing:
+        - Paper ID
+        - Extracted text content from the PDF
+        - Metadata dictionary with paper information
+    """
+    from PyPDF2 import PdfReader
+
+    reader = PdfReader(BytesIO(pdf_content))
+    text = '\n'.join(page.extract_text() or '' for page in reader.pages)
+
+    metadata = {
+        'arxiv_id': arxiv_id,
+        'source': 'arxiv',
+        'pdf_url': f'http://arxiv.org/pdf/{arxiv_id}.pdf',
+        'abs_url': f'http://arxiv.org/abs/{arxiv_id}',
+        'document_type': 'research_paper',
+    }
+
+    logger.info(
+        f'Successfully extracted {len(text)} characters from ArXiv paper {arxiv_id}',
+    )
+    return arxiv_id, text, metadata
+
+
+async def fetch_arxiv_paper_async(arxiv_id: str) -> tuple[str, str, dict[str, str]]:
+    """
+    Download and parse an arXiv paper through the paper cache.
+
+    The extracted text is cached on disk, so a paper is downloaded and parsed
+    once for all the runs and worker processes sharing the cache directory.
+    Parsing runs in a worker thread.
+
+    Args:
+        arxiv_id: The arXiv paper ID (e.g., "2301.07041")
+
+    Returns:
+        Tuple of the paper ID, the extracted text and the metadata
+    """
+    async def fetch() -> list:
+        with span('arxiv.download', paper_id=arxiv_id) as download_span:
+            pdf_content = await download_arxiv_pdf_async(arxiv_id)
+            download_span.set(bytes=len(pdf_content))
+        with span('arxiv.parse', paper_id=arxiv_id) as parse_span:
+            paper = await asyncio.to_thread(parse_arxiv_pdf, arxiv_id, pdf_content)
+            parse_span.set(characters=len(paper[1]))
+        return list(paper)
+
+    paper_id, text, metadata = await paper_cache.get_or_fetch(arxiv_id, fetch)
+    return paper_id, text, metadata
+
+
 def get_arxiv_paper(arxiv_id: str) -> tuple[str, str, dict[str, str]]:
     """
     Fetch the full content of an arXiv paper (PDF text) given its ID.
@@ -66,26 +265,9 @@ def get_arxiv_paper(arxiv_id: str) -> tuple[str, str, dict[str, str]]:
         - Metadata dictionary with paper information
     """
     logger.debug(f'Fetching ArXiv paper {arxiv_id}')
-    pdf_url = f'http://arxiv.org/pdf/{arxiv_id}.pdf'
 
     try:
-        resp = requests.get(pdf_url)
-        resp.raise_for_status()
-        reader = PdfReader(BytesIO(resp.content))
-        text = '\n'.join(page.extract_text() or '' for page in reader.pages)
-
-        metadata = {
-            'arxiv_id': arxiv_id,
-            'source': 'arxiv',
-            'pdf_url': f'http://arxiv.org/pdf/{arxiv_id}.pdf',
-            'abs_url': f'http://arxiv.org/abs/{arxiv_id}',
-            'document_type': 'research_paper',
-        }
-
-        logger.info(
-            f'Successfully extracted {len(text)} characters from ArXiv paper {arxiv_id}',
-        )
-        return arxiv_id, text, metadata
+        return parse_arxiv_pdf(arxiv_id, download_arxiv_pdf(arxiv_id))
     except Exception as e:
         logger.error(
             f'Error fetching ArXiv paper {arxiv_id}: {e}', exc_info=True,
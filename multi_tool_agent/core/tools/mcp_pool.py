@@ -0,0 +1,173 @@
+import asyncio
+import os
+import shlex
+from typing import Optional
+from typing import TYPE_CHECKING
+
+from multi_tool_agent.utils.config import config
+from multi_tool_agent.utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from google.adk.tools.mcp_tool.mcp_toolset import MCPToolset
+
+logger = get_logger(__name__)
+
+
+class TavilyMCPPool:
+    """
+    Process-wide pool of Tavily MCP toolsets.
+
+    Each toolset owns one Tavily MCP server subprocess whose session is kept open
+    and shared by every web search agent it is handed to, so the server starts once
+    per process instead of once per web step. Toolsets are created lazily, handed
+    out round-robin, and periodically health-checked and restarted when broken.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        command: str,
+        args: list[str],
+        timeout: float = 30.0,
+        health_interval: float = 60.0,
+    ) -> None:
+        """
+        Initialize the pool.
+
+        Args:
+            size: Number of Tavily MCP server processes to keep
+            command: Command launching the MCP server (e.g. 'npx' or a pinned local binary)
+            args: Arguments for the command
+            timeout: Read timeout of MCP requests in seconds
+            health_interval: Seconds between health checks (0 disables them)
+        """
+        self.size = max(1, size)
+        self.command = command
+        self.args = args
+        self.timeout = timeout
+        self.health_interval = health_interval
+        self.restarts = 0
+        self._toolsets: list[Optional['MCPToolset']] = [None] * self.size
+        self._next = 0
+        self._monitor: Optional[asyncio.Task] = None
+
+    def _create_toolset(self) -> 'MCPToolset':
+        """
+        Create a toolset for one Tavily MCP server process.
+
+        Returns:
+            MCPToolset exposing only the tavily-search tool
+        """
+        from google.adk.tools.mcp_tool.mcp_session_manager import StdioConnectionParams
+        from google.adk.tools.mcp_tool.mcp_toolset import MCPToolset
+        from mcp import StdioServerParameters
+
+        return MCPToolset(
+            connection_params=StdioConnectionParams(
+                server_params=StdioServerParameters(
+                    command=self.command,
+                    args=self.args,
+                    env={
+                        'TAVILY_API_KEY': os.getenv('TAVILY_API_KEY', ''),
+                    },
+                ),
+                timeout=self.timeout,
+            ),
+            tool_filter=['tavily-search'],
+        )
+
+    def _toolset(self, index: int) -> 'MCPToolset':
+        """
+        Return the toolset at a pool slot, creating it on first use.
+
+        Args:
+            index: Pool slot
+
+        Returns:
+            Toolset of that slot
+        """
+        toolset = self._toolsets[index]
+        if toolset is None:
+            toolset = self._toolsets[index] = self._create_toolset()
+        return toolset
+
+    def acquire(self) -> 'MCPToolset':
+        """
+        Hand out a pooled toolset, round-robin across the pool.
+
+        Returns:
+            Toolset whose server session is shared with other agents
+        """
+        index = self._next
+        self._next = (self._next + 1) % self.size
+        self._ensure_monitor()
+        return self._toolset(index)
+
+    async def start(self) -> None:
+        """Launch every server process of the pool, open its session and start health checks."""
+        self._ensure_monitor()
+        await asyncio.gather(*(self._check(index) for index in range(self.size)))
+
+    async def _check(self, index: int) -> bool:
+        """
+        Health-check one pool slot, restarting its server if it does not respond.
+
+        Args:
+            index: Pool slot to check
+
+        Returns:
+            True if the server was healthy
+        """
+        toolset = self._toolset(index)
+        try:
+            await asyncio.wait_for(toolset.get_tools(), timeout=self.timeout)
+            return True
+        except Exception as e:
+            logger.warning(f'Tavily MCP server {index} unhealthy, restarting: {e}')
+            self._toolsets[index] = self._create_toolset()
+            self.restarts += 1
+            await toolset.close()
+            return False
+
+    async def health_check(self) -> list[bool]:
+        """
+        Health-check every server of the pool.
+
+        Returns:
+            Health status of each pool slot before any restart
+        """
+        return list(await asyncio.gather(*(self._check(index) for index in range(self.size))))
+
+    def _ensure_monitor(self) -> None:
+        """Start the periodic health check when running inside an event loop."""
+        if self.health_interval <= 0 or (self._monitor is not None and not self._monitor.done()):
+            return
+        try:
+            self._monitor = asyncio.get_running_loop().create_task(self._monitor_loop())
+        except RuntimeError:
+            pass
+
+    async def _monitor_loop(self) -> None:
+        """Periodically health-check the servers that have been started."""
+        while True:
+            await asyncio.sleep(self.health_interval)
+            started = [index for index, toolset in enumerate(self._toolsets) if toolset is not None]
+            await asyncio.gather(*(self._check(index) for index in started))
+
+    async def close(self) -> None:
+        """Stop the health check and shut down every server process."""
+        if self._monitor is not None:
+            self._monitor.cancel()
+            self._monitor = None
+        for index, toolset in enumerate(self._toolsets):
+            if toolset is not None:
+                await toolset.close()
+                self._toolsets[index] = None
+
+
+tavily_mcp_pool = TavilyMCPPool(
+    size=config.tavily_mcp_pool_size,
+    command=config.tavily_mcp_command,
+    args=shlex.split(config.tavily_mcp_args),
+    health_interval=config.tavily_mcp_health_interval,
+)
@@ -0,0 +1,337 @@
+import asyncio
+import time
+from collections import deque
+from typing import Any
+from typing import Optional
+
+import httpx
+import requests
+
+from multi_tool_agent.utils.config import config
+from multi_tool_agent.utils.logger import get_logger
+from multi_tool_agent.utils.tracing import current_span
+
+logger = get_logger(__name__)
+
+
+class _Endpoint:
+    """Latency and outcome bookkeeping for one mirror."""
+
+    def __init__(self, base_url: str, window: int) -> None:
+        """
+        Initialize the endpoint.
+
+        Args:
+            base_url: Base URL the request paths are appended to
+            window: Number of recent successful requests the percentiles are computed over
+        """
+        self.base_url = base_url.rstrip('/')
+        self.latencies: deque[float] = deque(maxlen=window)
+        self.requests = 0
+        self.successes = 0
+        self.failures = 0
+        self.cancelled = 0
+        self.wins = 0
+        self.consecutive_failures = 0
+
+    def percentile(self, q: float) -> float:
+        """
+        Percentile of the recent successful request latencies.
+
+        Args:
+            q: Percentile between 0 and 100
+
+        Returns:
+            Latency in seconds, or 0.0 if no request succeeded yet
+        """
+        latencies = sorted(self.latencies)
+        return latencies[int(q / 100 * (len(latencies) - 1))] if latencies else 0.0
+
+    def metrics(self) -> dict[str, Any]:
+        """
+        Snapshot of the endpoint's counters and latency percentiles.
+
+        Returns:
+            Dictionary of request counts and p50/p90/p99 latency in seconds
+        """
+        return {
+            'requests': self.requests,
+            'successes': self.successes,
+            'failures': self.failures,
+            'cancelled': self.cancelled,
+            'wins': self.wins,
+            'p50': round(self.percentile(50), 6),
+            'p90': round(self.percentile(90), 6),
+            'p99': round(self.percentile(99), 6),
+        }
+
+
+class MirroredDownloader:
+    """
+    Downloader that spreads requests over mirrors and hedges slow ones.
+
+    A request first goes to the best endpoint: the one with the lowest observed
+    median latency, skipping endpoints that keep failing. If no response has
+    arrived after the hedging delay, a duplicate request goes to the next
+    endpoint; the first complete response wins and the others are cancelled. A
+    failed request immediately hands over to the next endpoint. The hedging delay
+    tracks the observed latency percentile of the endpoint, so only the slowest
+    requests are duplicated.
+
+    Latencies of cancelled requests are not recorded, so the percentiles slightly
+    underestimate the tail of endpoints that often lose.
+    """
+
+    def __init__(
+        self,
+        base_urls: list[str],
+        hedge_delay: float = 2.0,
+        hedge_percentile: float = 90.0,
+        max_requests: int = 2,
+        timeout: float = 60.0,
+        window: int = 100,
+        min_samples: int = 5,
+    ) -> None:
+        """
+        Initialize the downloader.
+
+        Args:
+            base_urls: Mirror base URLs, in order of preference
+            hedge_delay: Hedging delay in seconds until min_samples latencies are observed
+            hedge_percentile: Observed latency percentile used as hedging delay
+            max_requests: Maximum requests per download, duplicates included (1 disables hedging)
+            timeout: Timeout of each request in seconds
+            window: Number of recent latencies tracked per endpoint
+            min_samples: Latencies an endpoint needs before its percentiles are trusted
+        """
+        self.endpoints = [_Endpoint(url, window) for url in base_urls if url.strip()]
+        if not self.endpoints:
+            raise ValueError('At least one base URL is required')
+        self.hedge_delay = hedge_delay
+        self.hedge_percentile = hedge_percentile
+        self.max_requests = max(1, max_requests)
+        self.timeout = timeout
+        self.min_samples = min_samples
+        self.hedged = 0
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _http_client(self) -> httpx.AsyncClient:
+        """
+        Return the pooled HTTP client, creating it on first use.
+
+        Returns:
+            Shared httpx.AsyncClient
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            )
+        return self._client
+
+    def _order(self) -> list[_Endpoint]:
+        """
+        Endpoints in the order requests should try them.
+
+        Returns:
+            Endpoints that are not failing first, fastest observed median first,
+            then in configured order
+        """
+        def key(item: tuple[int, _Endpoint]) -> tuple[bool, float, int]:
+            index, endpoint = item
+            known = len(endpoint.latencies) >= self.min_samples
+            return endpoint.consecutive_failures >= 3, endpoint.percentile(50) if known else 0.0, index
+
+        return [endpoint for _, endpoint in sorted(enumerate(self.endpoints), key=key)]
+
+    def delay_for(self, endpoint: _Endpoint) -> float:
+        """
+        Hedging delay after a request to an endpoint.
+
+        Args:
+            endpoint: Endpoint the outstanding request went to
+
+        Returns:
+            Observed latency percentile of the endpoint, or the configured delay
+            until enough latencies have been observed
+        """
+        if len(endpoint.latencies) < self.min_samples:
+            return self.hedge_delay
+        return endpoint.percentile(self.hedge_percentile)
+
+    def _record(self, endpoint: _Endpoint, started: float, error: Optional[BaseException]) -> None:
+        """
+        Record the outcome of a finished request.
+
+        Args:
+            endpoint: Endpoint the request went to
+            started: perf_counter() value at the start of the request
+            error: Exception the request failed with, or None on success
+        """
+        if error is None:
+            endpoint.latencies.append(time.perf_counter() - started)
+            endpoint.successes += 1
+            endpoint.consecutive_failures = 0
+        else:
+            endpoint.failures += 1
+            endpoint.consecutive_failures += 1
+
+    async def _get(self, endpoint: _Endpoint, path: str) -> bytes:
+        """
+        Fetch a path from one endpoint and record the outcome.
+
+        Args:
+            endpoint: Endpoint to request
+            path: Path appended to the endpoint's base URL
+
+        Returns:
+            Response body
+
+        Raises:
+            httpx.HTTPError: If the request fails or returns an error status
+        """
+        endpoint.requests += 1
+        started = time.perf_counter()
+        try:
+            response = await self._http_client().get(f'{endpoint.base_url}/{path.lstrip("/")}')
+            response.raise_for_status()
+        except asyncio.CancelledError:
+            endpoint.cancelled += 1
+            raise
+        except Exception as e:
+            self._record(endpoint, started, e)
+            raise
+        self._record(endpoint, started, None)
+        return response.content
+
+    async def fetch(self, path: str) -> bytes:
+        """
+        Download a path, hedging slow requests across the endpoints.
+
+        Args:
+            path: Path appended to the endpoints' base URLs
+
+        Returns:
+            Body of the first complete response
+
+        Raises:
+            httpx.HTTPError: If every request failed (the last error is raised)
+        """
+        order = self._order()
+        tasks: dict[asyncio.Task, _Endpoint] = {}
+        launched = 0
+        last_error: Optional[BaseException] = None
+
+        def launch() -> _Endpoint:
+            nonlocal launched
+            endpoint = order[launched % len(order)]
+            launched += 1
+            tasks[asyncio.create_task(self._get(endpoint, path))] = endpoint
+            return endpoint
+
+        latest = launch()
+        try:
+            while tasks:
+                can_hedge = launched < self.max_requests
+                done, _ = await asyncio.wait(
+                    tasks, timeout=self.delay_for(latest) if can_hedge else None, return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    self.hedged += 1
+                    logger.debug(f'Hedging {path}: no response after {self.delay_for(latest):.3f}s')
+                    latest = launch()
+                    continue
+                for task in done:
+                    endpoint = tasks.pop(task)
+                    if task.exception() is None:
+                        endpoint.wins += 1
+                        download_span = current_span()
+                        if download_span is not None:
+                            download_span.set(endpoint=endpoint.base_url, requests=launched)
+                        return task.result()
+                    last_error = task.exception()
+                    logger.warning(f'Download of {path} from {endpoint.base_url} failed: {last_error}')
+                    if launched < self.max_requests:
+                        latest = launch()
+        finally:
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+        assert last_error is not None
+        raise last_error
+
+    def fetch_sync(self, path: str, session: requests.Session) -> bytes:
+        """
+        Download a path without hedging, failing over to the next endpoint on errors.
+
+        Args:
+            path: Path appended to the endpoints' base URLs
+            session: HTTP session to issue the requests with
+
+        Returns:
+            Response body
+
+        Raises:
+            requests.RequestException: If every endpoint failed (the last error is raised)
+        """
+        last_error: Optional[BaseException] = None
+        for endpoint in self._order()[:self.max_requests]:
+            endpoint.requests += 1
+            started = time.perf_counter()
+            try:
+                response = session.get(f'{endpoint.base_url}/{path.lstrip("/")}', timeout=self.timeout)
+                response.raise_for_status()
+            except requests.RequestException as e:
+                self._record(endpoint, started, e)
+                last_error = e
+                logger.warning(f'Download of {path} from {endpoint.base_url} failed: {e}')
+                continue
+            self._record(endpoint, started, None)
+            endpoint.wins += 1
+            return response.content
+        assert last_error is not None
+        raise last_error
+
+    async def warm_up(self) -> None:
+        """
+        Open (or refresh) a pooled connection to every endpoint.
+
+        Raises:
+            httpx.HTTPError: If no endpoint can be reached
+        """
+        # Any response will do: the point is the established connection
+        outcomes = await asyncio.gather(
+            *(self._http_client().head(endpoint.base_url) for endpoint in self.endpoints), return_exceptions=True,
+        )
+        errors = [outcome for outcome in outcomes if isinstance(outcome, BaseException)]
+        if len(errors) == len(outcomes):
+            raise errors[0]
+
+    def metrics(self) -> dict[str, Any]:
+        """
+        Snapshot of the per-endpoint metrics.
+
+        Returns:
+            Dictionary with the number of hedged downloads and each endpoint's metrics
+        """
+        return {
+            'hedged': self.hedged,
+            'endpoints': {endpoint.base_url: endpoint.metrics() for endpoint in self.endpoints},
+        }
+
+    async def close(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+pdf_downloader = MirroredDownloader(
+    base_urls=config.arxiv_pdf_urls,
+    hedge_delay=config.arxiv_pdf_hedge_delay,
+    hedge_percentile=config.arxiv_pdf_hedge_percentile,
+    max_requests=config.arxiv_pdf_max_requests,
+    timeout=config.arxiv_pdf_timeout,
+)
@@ -1,13 +1,27 @@
 import os
+from collections.abc import Awaitable
+from collections.abc import Callable
 from typing import Any
 from typing import Optional
 
-from tavily import TavilyClient
+import httpx
 
+from multi_tool_agent.utils.cache import TTLCache
+from multi_tool_agent.utils.config import config
 from multi_tool_agent.utils.logger import get_logger
+from multi_tool_agent.utils.tracing import span
 
 logger = get_logger(__name__)
 
+search_cache = TTLCache(
+    'tavily_search',
+    ttl=config.tavily_search_cache_ttl,
+    directory=config.cache_dir or None,
+)
+
+_client: Optional[httpx.AsyncClient] = None
+_run_urls: dict[str, set[str]] = {}
+
 
 def tavily_search(
     query: str,
@@ -35,6 +49,8 @@ def tavily_search(
     if end_date:
         logger.debug(f'Search end_date: {end_date}')
 
+    from tavily import TavilyClient
+
     client = TavilyClient(os.getenv('TAVILY_API_KEY'))
 
     # Build parameters dict, excluding None values
@@ -53,3 +69,142 @@ def tavily_search(
     except Exception as e:
         logger.error(f'Error during Tavily search: {e}', exc_info=True)
         raise
+
+
+def get_tavily_client() -> httpx.AsyncClient:
+    """
+    Return the process-wide HTTP client for the Tavily API.
+
+    The client is created on first use and keeps its connections alive, so
+    consecutive searches reuse the same TLS connection.
+
+    Returns:
+        Shared httpx.AsyncClient configured for the Tavily API
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            base_url=config.tavily_api_url,
+            headers={
+                'Content-Type': 'application/json',
+                'Authorization': f'Bearer {os.getenv("TAVILY_API_KEY", "")}',
+            },
+            timeout=config.tavily_timeout,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        )
+    return _client
+
+
+async def warm_up() -> None:
+    """
+    Open (or refresh) the pooled connection to the Tavily API.
+
+    Raises:
+        httpx.HTTPError: If the API host cannot be reached
+    """
+    # Any response will do: the point is the established connection
+    await get_tavily_client().head('/')
+
+
+async def tavily_search_async(
+    query: str,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    max_results: int = 5,
+) -> dict[str, Any]:
+    """
+    Search for information using the Tavily API through the pooled client and cache.
+
+    Results are cached per normalized query, date range and result count for
+    TAVILY_SEARCH_CACHE_TTL seconds, and concurrent identical searches share one request.
+
+    Args:
+        query: The search query string
+        start_date: Optional start date for filtering results (YYYY-MM-DD format)
+        end_date: Optional end date for filtering results (YYYY-MM-DD format)
+        max_results: Maximum number of results to return
+
+    Returns:
+        Dictionary containing search results from Tavily API
+    """
+    normalized_query = ' '.join(query.lower().split())
+    search_params: dict[str, Any] = {'query': normalized_query, 'max_results': max_results}
+    if start_date is not None:
+        search_params['start_date'] = start_date
+    if end_date is not None:
+        search_params['end_date'] = end_date
+
+    async def fetch() -> dict[str, Any]:
+        logger.debug(
+            f'Searching Tavily with query: "{normalized_query}", max_results: {max_results}',
+        )
+        try:
+            with span('tavily.search') as search_span:
+                resp = await get_tavily_client().post('/search', json=search_params)
+                resp.raise_for_status()
+                search_span.set(bytes=len(resp.content))
+            response = resp.json()
+            logger.info(
+                f'Tavily search completed successfully, returned {len(response.get("results", []))} results',
+            )
+            return response
+        except Exception as e:
+            logger.error(f'Error during Tavily search: {e}', exc_info=True)
+            raise
+
+    key = f'{normalized_query}|{start_date or ""}|{end_date or ""}|{max_results}'
+    return await search_cache.get_or_fetch(key, fetch)
+
+
+def create_tavily_tool(run_id: str) -> Callable[..., Awaitable[dict[str, Any]]]:
+    """
+    Create the native web search tool for one research run.
+
+    The returned tool drops result URLs that an earlier web step of the same run
+    already returned, so parallel web steps do not feed duplicates to the answer.
+
+    Args:
+        run_id: Unique identifier for the current run
+
+    Returns:
+        Async function usable as an ADK function tool
+    """
+    async def tavily_search(
+        query: str,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        max_results: int = 5,
+    ) -> dict[str, Any]:
+        """
+        Search the web for current information.
+
+        Args:
+            query: The search query string
+            start_date: Optional start date for filtering results (YYYY-MM-DD format)
+            end_date: Optional end date for filtering results (YYYY-MM-DD format)
+            max_results: Maximum number of results to return
+
+        Returns:
+            Dictionary with the search results, each with title, url and content
+        """
+        try:
+            response = await tavily_search_async(query, start_date, end_date, max_results)
+        except Exception as e:
+            return {'error': str(e), 'results': []}
+
+        seen = _run_urls.setdefault(run_id, set())
+        results = [result for result in response.get('results', []) if result.get('url') not in seen]
+        seen.update(result.get('url') for result in results)
+        return {**response, 'results': results}
+
+    return tavily_search
+
+
+def forget_run(run_id: str) -> None:
+    """
+    Drop the URL deduplication state of a finished run.
+
+    Args:
+        run_id: Unique identifier of the run
+    """
+    _run_urls.pop(run_id, None)
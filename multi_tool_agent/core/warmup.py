@@ -0,0 +1,203 @@
+import asyncio
+import time
+from collections.abc import Awaitable
+from collections.abc import Callable
+from typing import Any
+from typing import Optional
+
+from multi_tool_agent.core.services import service_container
+from multi_tool_agent.core.services import ServiceContainer
+from multi_tool_agent.core.tools import arxiv
+from multi_tool_agent.core.tools import tavily
+from multi_tool_agent.core.tools.mcp_pool import tavily_mcp_pool
+from multi_tool_agent.core.tools.mirrors import pdf_downloader
+from multi_tool_agent.utils.config import config
+from multi_tool_agent.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class Warmup:
+    """
+    Background warm-up of the connections and subprocesses used by the workflow.
+
+    Every component (Qdrant, the embedding client, the arXiv hosts, Tavily or its
+    MCP servers) is connected concurrently, so the first request does not pay for
+    probes, client creation, TLS handshakes or subprocess launches. Afterwards the
+    connections are refreshed periodically so they survive idle periods, and
+    components that failed are retried.
+    """
+
+    def __init__(self, services: ServiceContainer, timeout: float, keepalive_interval: float) -> None:
+        """
+        Initialize the warm-up.
+
+        Args:
+            services: Service container whose services are warmed up
+            timeout: Seconds each component may take before it is marked failed
+            keepalive_interval: Seconds between connection refreshes (0 disables them)
+        """
+        self.services = services
+        self.timeout = timeout
+        self.keepalive_interval = keepalive_interval
+        self.components: dict[str, dict[str, Any]] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._keepalive: Optional[asyncio.Task] = None
+
+    def _targets(self) -> dict[str, Callable[[], Awaitable[Any]]]:
+        """
+        Warm-up coroutine of every component in use.
+
+        Returns:
+            Coroutine functions keyed by component name
+        """
+        targets: dict[str, Callable[[], Awaitable[Any]]] = {
+            'vector_store': lambda: self.services.document_service.vector_store.warm_up(),
+            'embedding': lambda: self.services.document_service.embedding.warm_up(),
+            'arxiv': lambda: asyncio.to_thread(arxiv.warm_up),
+            'arxiv_pdf': pdf_downloader.warm_up,
+        }
+        if config.web_search_backend == 'native':
+            targets['tavily'] = tavily.warm_up
+        else:
+            targets['tavily_mcp'] = tavily_mcp_pool.start
+        return targets
+
+    async def _warm(self, name: str, target: Callable[[], Awaitable[Any]]) -> None:
+        """
+        Warm up one component and record its status.
+
+        Args:
+            name: Component name
+            target: Coroutine function connecting the component
+        """
+        component = self.components.setdefault(name, {'status': 'pending'})
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(target(), timeout=self.timeout)
+        except Exception as e:
+            component.update(status='failed', error=str(e) or type(e).__name__)
+            logger.warning(f'Warm-up of {name} failed: {component["error"]}')
+        else:
+            component.update(status='ready', error=None)
+            logger.debug(f'Warm-up of {name} took {time.perf_counter() - started:.3f}s')
+        component.update(seconds=round(time.perf_counter() - started, 3), checked_at=time.time())
+
+    async def _run(self) -> None:
+        """Warm up every component concurrently, then keep the connections alive."""
+        targets = self._targets()
+        for name in targets:
+            self.components[name] = {'status': 'pending'}
+        started = time.perf_counter()
+        # Build the document service off the event loop, since it imports the client libraries
+        try:
+            await asyncio.to_thread(lambda: self.services.document_service)
+        except Exception as e:
+            # The vector store and embedding warm-ups report the failure
+            logger.warning(f'Could not create the document service: {e}')
+        await asyncio.gather(*(self._warm(name, target) for name, target in targets.items()))
+        logger.info(
+            f'Warm-up finished in {time.perf_counter() - started:.3f}s: '
+            + ', '.join(f'{name}={component["status"]}' for name, component in self.components.items()),
+        )
+        if self.keepalive_interval > 0:
+            self._keepalive = asyncio.get_running_loop().create_task(self._keepalive_loop(targets))
+
+    async def _keepalive_loop(self, targets: dict[str, Callable[[], Awaitable[Any]]]) -> None:
+        """
+        Periodically refresh the connections, retrying failed components.
+
+        Args:
+            targets: Warm-up coroutine functions keyed by component name
+        """
+        # The MCP pool runs its own health checks
+        targets = {name: target for name, target in targets.items() if name != 'tavily_mcp'}
+        while True:
+            await asyncio.sleep(self.keepalive_interval)
+            await asyncio.gather(*(self._warm(name, target) for name, target in targets.items()))
+
+    def start(self) -> None:
+        """Start the warm-up in the running event loop, unless it already started."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every component has been warmed up (or has failed to).
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if every component is ready
+        """
+        if self._task is not None:
+            try:
+                await asyncio.wait_for(asyncio.shield(self._task), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+        return self.readiness()['ready']
+
+    def readiness(self) -> dict[str, Any]:
+        """
+        Report the warm-up status, e.g. for a readiness probe.
+
+        Returns:
+            Whether every component is ready, whether the initial warm-up finished,
+            and the status of each component
+        """
+        return {
+            'ready': bool(self.components) and all(c['status'] == 'ready' for c in self.components.values()),
+            'finished': self._task is not None and self._task.done(),
+            'components': {name: dict(component) for name, component in self.components.items()},
+        }
+
+    async def close(self) -> None:
+        """Stop the warm-up and the keepalive loop."""
+        for task in (self._task, self._keepalive):
+            if task is not None and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._keepalive = None
+
+
+_warmup: Optional[Warmup] = None
+
+
+def start_warmup(services: Optional[ServiceContainer] = None) -> Warmup:
+    """
+    Start the process-wide warm-up in the running event loop (idempotent).
+
+    Args:
+        services: Service container to warm up (defaults to the shared container)
+
+    Returns:
+        The process-wide Warmup
+    """
+    global _warmup
+    if _warmup is None:
+        _warmup = Warmup(
+            services or service_container,
+            timeout=config.warmup_timeout,
+            keepalive_interval=config.warmup_keepalive_interval,
+        )
+    _warmup.start()
+    return _warmup
+
+
+def readiness() -> dict[str, Any]:
+    """
+    Health hook reporting whether the process is warmed up.
+
+    Without a warm-up the process is reported ready, since every connection is
+    then established on first use.
+
+    Returns:
+        Readiness report with per-component status
+    """
+    if _warmup is None:
+        return {'ready': True, 'finished': True, 'warmup': False, 'components': {}}
+    return {**_warmup.readiness(), 'warmup': True}
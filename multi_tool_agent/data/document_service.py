@@ -10,8 +10,8 @@ from multi_tool_agent.data.vector_store import create_vector_store
 from multi_tool_agent.data.vector_stores.base import Document
 from multi_tool_agent.data.vector_stores.base import VectorStore
 from multi_tool_agent.utils.config import Config
-from multi_tool_agent.utils.config import config
 from multi_tool_agent.utils.logger import get_logger
+from multi_tool_agent.utils.tracing import span
 
 logger = get_logger(__name__)
 
@@ -70,6 +70,19 @@ class DocumentIngestionService:
         for i in range(0, len(text), size):
             yield text[i:i + size]
 
+    def chunk_document(self, content: str, max_length: int = 5000) -> list[str]:
+        """
+        Clean a document, truncate it and split it into the chunks that get embedded.
+
+        Args:
+            content: Text content of the document
+            max_length: Maximum length of content to process
+
+        Returns:
+            Chunks of the processed content
+        """
+        return list(self.chunk_text(self.process_text(content)[:max_length]))
+
     async def ingest_document(
         self,
         document_id: str,
@@ -81,6 +94,9 @@ class DocumentIngestionService:
         """
         Ingest a single document into both storage and vector store.
 
+        Chunk ids are derived from the document id, so ingesting a document again
+        into the same collection overwrites its chunks instead of duplicating them.
+
         Args:
             document_id: Unique identifier for the document
             content: Text content of the document
@@ -92,29 +108,32 @@ class DocumentIngestionService:
             True if ingestion was successful, False otherwise
         """
         try:
-            processed_content = self.process_text(content)[:max_length]
-            chunks = list(self.chunk_text(processed_content))
+            chunks = self.chunk_document(content, max_length)
+            characters = sum(len(chunk) for chunk in chunks)
             logger.info(
-                f'Document {document_id}: processing {len(processed_content)} characters into {len(chunks)} chunks',
+                f'Document {document_id}: processing {characters} characters into {len(chunks)} chunks',
             )
 
-            success = True
-            i = 0
-            for chunk in chunks:
-                embedding = await self.embedding.embed_text(chunk)
-                vector_document = Document(
-                    id=str(uuid.uuid4()),
+            if not chunks:
+                return True
+
+            with span('embed', texts=len(chunks), characters=characters):
+                embeddings = await self.embedding.embed_texts(chunks)
+            vector_documents = [
+                Document(
+                    id=str(uuid.uuid5(uuid.NAMESPACE_URL, f'{document_id}#{index}')),
                     content=chunk,
                     metadata=metadata,
                     vector=embedding,
                 )
+                for index, (chunk, embedding) in enumerate(zip(chunks, embeddings))
+            ]
 
-                success &= await self.vector_store.add_documents([vector_document], collection_name)
-                logger.info(
-                    f'Ingested chunk {i+1} into collection {collection_name}',
-                )
-                i += 1
-
+            with span('vector_store.upsert', points=len(vector_documents), collection=collection_name):
+                success = await self.vector_store.add_documents(vector_documents, collection_name)
+            logger.info(
+                f'Ingested {len(vector_documents)} chunks of document {document_id} into collection {collection_name}',
+            )
             return success
 
         except Exception as e:
@@ -145,14 +164,16 @@ class DocumentIngestionService:
             List of dictionaries containing search results
         """
         try:
-            query_embedding = await self.embedding.embed_text(query_text)
-
-            search_results = await self.vector_store.search(
-                query_vector=query_embedding,
-                collection_name=collection_name,
-                top_k=top_k,
-                filters=filters,
-            )
+            with span('embed', texts=1, characters=len(query_text)):
+                query_embedding = await self.embedding.embed_text(query_text)
+
+            with span('vector_store.search', top_k=top_k, collection=collection_name):
+                search_results = await self.vector_store.search(
+                    query_vector=query_embedding,
+                    collection_name=collection_name,
+                    top_k=top_k,
+                    filters=filters,
+                )
 
             results = []
             for result in search_results:
@@ -184,13 +205,10 @@ def create_document_service(config: Config) -> DocumentIngestionService:
     Returns:
         Configured DocumentIngestionService instance
     """
-    vector_store = create_vector_store(config)
     embedding_service = create_embedding_service(config)
+    vector_store = create_vector_store(config, embedding_service)
 
     return DocumentIngestionService(
         vector_store=vector_store,
         embedding_service=embedding_service,
     )
-
-
-document_service = create_document_service(config)
@@ -1,5 +1,4 @@
 from multi_tool_agent.data.embeddings.base import EmbeddingService
-from multi_tool_agent.data.embeddings.openai_embeddings import OpenAIEmbedding
 from multi_tool_agent.utils.config import Config
 from multi_tool_agent.utils.logger import get_logger
 
@@ -10,6 +9,9 @@ def create_embedding_service(config: Config) -> EmbeddingService:
     """
     Create and return the configured embedding service.
 
+    With EMBEDDING_CACHE_TTL, the service is wrapped in a CachedEmbedding whose
+    vectors are stored under CACHE_DIR.
+
     Args:
         config: Configuration object containing embedding settings
 
@@ -23,6 +25,8 @@ def create_embedding_service(config: Config) -> EmbeddingService:
         f'Creating embedding service of type: {config.embedding_type}',
     )
     if config.embedding_type == 'openai':
+        from multi_tool_agent.data.embeddings.openai_embeddings import OpenAIEmbedding
+
         service = OpenAIEmbedding(
             model_name=config.embedding_model or 'text-embedding-3-small',
             api_key=config.openai_api_key,
@@ -30,9 +34,21 @@ def create_embedding_service(config: Config) -> EmbeddingService:
         logger.debug(
             f'Created OpenAI embedding service with model: {config.embedding_model}',
         )
-        return service
     else:
         logger.error(f'Unsupported embedding type: {config.embedding_type}')
         raise ValueError(
             f'Unsupported embedding type: {config.embedding_type}',
         )
+
+    if config.embedding_cache_ttl <= 0:
+        return service
+    from multi_tool_agent.data.embeddings.cached import CachedEmbedding
+    from multi_tool_agent.utils.cache import TTLCache
+
+    cache = TTLCache(
+        'embeddings',
+        ttl=config.embedding_cache_ttl,
+        max_entries=4096,
+        directory=config.cache_dir or None,
+    )
+    return CachedEmbedding(service, cache, namespace=f'{config.embedding_type}:{service.model_name}')
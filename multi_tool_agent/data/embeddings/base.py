@@ -38,3 +38,10 @@ class EmbeddingService(ABC):
         Returns:
             Dimension size of the embedding vectors
         """
+
+    async def warm_up(self) -> None:
+        """
+        Create the client and establish its connection ahead of the first request.
+
+        The default implementation does nothing.
+        """
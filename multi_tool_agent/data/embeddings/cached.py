@@ -0,0 +1,91 @@
+import hashlib
+
+from multi_tool_agent.data.embeddings.base import EmbeddingService
+from multi_tool_agent.utils.cache import TTLCache
+from multi_tool_agent.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class CachedEmbedding(EmbeddingService):
+    """
+    Embedding service caching the vectors of another one.
+
+    Vectors are keyed by the model and the hash of the text, so the chunks of a
+    paper ingested again, by another run or by another worker process sharing
+    the cache directory, are not embedded twice.
+    """
+
+    def __init__(self, service: EmbeddingService, cache: TTLCache, namespace: str) -> None:
+        """
+        Initialize the cached embedding service.
+
+        Args:
+            service: Embedding service computing the missing vectors
+            cache: Cache holding the vectors
+            namespace: Prefix of the cache keys, e.g. the model name
+        """
+        self.service = service
+        self.cache = cache
+        self.namespace = namespace
+
+    def _key(self, text: str) -> str:
+        """
+        Build the cache key of a text.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Cache key
+        """
+        return f'{self.namespace}:{hashlib.sha256(text.encode("utf-8")).hexdigest()}'
+
+    async def warm_up(self) -> None:
+        """Warm up the underlying embedding service."""
+        await self.service.warm_up()
+
+    async def embed_text(self, text: str) -> list[float]:
+        """
+        Embed a single text, using the cached vector if there is one.
+
+        Args:
+            text: Input text to embed
+
+        Returns:
+            List of float values representing the text embedding
+        """
+        return await self.cache.get_or_fetch(self._key(text), lambda: self.service.embed_text(text))
+
+    async def embed_texts(self, texts: list[str]) -> list[list[float]]:
+        """
+        Embed multiple texts, computing only the uncached vectors in one batch.
+
+        Args:
+            texts: List of input texts to embed
+
+        Returns:
+            List of embedding vectors, one for each input text
+        """
+        keys = [self._key(text) for text in texts]
+        vectors = await self.cache.get_many(keys)
+        missing = {key: text for key, text in zip(keys, texts) if key not in vectors}
+        self.cache.hits += len(keys) - len(missing)
+        self.cache.misses += len(missing)
+
+        if missing:
+            embedded = dict(zip(missing, await self.service.embed_texts(list(missing.values()))))
+            vectors.update(embedded)
+            await self.cache.set_many(embedded)
+            logger.debug(f'Embedded {len(missing)} of {len(texts)} texts, the others were cached')
+        return [vectors[key] for key in keys]
+
+    @property
+    def vector_size(self) -> int:
+        """
+        Get the size of the embedding vectors.
+
+        Returns:
+            Dimension size of the underlying service's vectors
+        """
+        return self.service.vector_size
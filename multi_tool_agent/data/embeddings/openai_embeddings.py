@@ -46,6 +46,15 @@ class OpenAIEmbedding(EmbeddingService):
                 )
         return self._client
 
+    async def warm_up(self) -> None:
+        """
+        Create the client and open its connection by looking up the embedding model.
+
+        Raises:
+            Exception: If the OpenAI API cannot be reached or rejects the request
+        """
+        await self.client.models.retrieve(self.model_name)
+
     async def embed_text(self, text: str) -> list[float]:
         """
         Generate embedding for a single text using OpenAI.
@@ -1,5 +1,14 @@
 """Vector store module for vector indexing and search backends."""
+from typing import Any
+
 from multi_tool_agent.data.vector_stores.base import VectorStore
-from multi_tool_agent.data.vector_stores.qdrant import QdrantVectorStore
 
 __all__ = ['VectorStore', 'QdrantVectorStore']
+
+
+def __getattr__(name: str) -> Any:
+    # Backends pull in their client libraries, so they are imported on first access
+    if name == 'QdrantVectorStore':
+        from multi_tool_agent.data.vector_stores.qdrant import QdrantVectorStore
+        return QdrantVectorStore
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
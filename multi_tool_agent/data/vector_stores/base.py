@@ -91,3 +91,10 @@ class VectorStore(ABC):
         Returns:
             True if successful, False otherwise
         """
+
+    async def warm_up(self) -> None:
+        """
+        Establish (or refresh) the connection to the backend ahead of the first request.
+
+        The default implementation does nothing.
+        """
@@ -1,3 +1,5 @@
+import asyncio
+import threading
 from typing import Any
 from typing import Optional
 
@@ -29,6 +31,7 @@ class QdrantVectorStore(VectorStore):
         port: int = 6333,
         grpc_port: int = 6334,
         prefer_grpc: bool = True,
+        location: Optional[str] = None,
     ) -> None:
         """
         Initialize Qdrant vector store.
@@ -39,13 +42,18 @@ class QdrantVectorStore(VectorStore):
             port: Qdrant server HTTP port
             grpc_port: Qdrant server gRPC port
             prefer_grpc: Whether to prefer gRPC over HTTP when available
+            location: ':memory:' or a local path to run Qdrant embedded instead of connecting to a server
         """
         self.embedding_service = embedding_service
         self.host = host
         self.port = port
         self.grpc_port = grpc_port
         self.prefer_grpc = prefer_grpc
+        self.location = location
         self._client = None
+        self._known_collections: set[str] = set()
+        self._collections_lock = threading.Lock()
+        self._embedded_lock = threading.Lock()
         logger.debug(f'Initialized Qdrant vector store at {host}:{port} (HTTP) / {host}:{grpc_port} (gRPC)')
 
     @property
@@ -56,6 +64,13 @@ class QdrantVectorStore(VectorStore):
         Returns:
             QdrantClient instance
         """
+        if self._client is None and self.location:
+            logger.debug(f'Using embedded Qdrant at {self.location}')
+            if self.location == ':memory:':
+                self._client = QdrantClient(location=self.location)
+            else:
+                self._client = QdrantClient(path=self.location)
+
         if self._client is None:
             if self.prefer_grpc:
                 try:
@@ -87,6 +102,34 @@ class QdrantVectorStore(VectorStore):
         
         return self._client
 
+    def _call(self, method: str, **kwargs: Any) -> Any:
+        """
+        Call a client method, serializing calls when Qdrant runs embedded.
+
+        The embedded (local) client is not thread-safe, while upserts run in worker
+        threads concurrently with searches.
+
+        Args:
+            method: Name of the QdrantClient method
+            **kwargs: Arguments of the method
+
+        Returns:
+            Result of the method
+        """
+        if not self.location:
+            return getattr(self.client, method)(**kwargs)
+        with self._embedded_lock:
+            return getattr(self.client, method)(**kwargs)
+
+    async def warm_up(self) -> None:
+        """
+        Connect to Qdrant (running the gRPC probe and HTTP fallback) and issue a request.
+
+        Raises:
+            Exception: If Qdrant cannot be reached
+        """
+        await asyncio.to_thread(self._call, 'get_collections')
+
     def _ensure_collection(self, collection_name: str) -> bool:
         """
         Ensure the collection exists with the correct configuration.
@@ -97,18 +140,21 @@ class QdrantVectorStore(VectorStore):
         Returns:
             True if successful, False otherwise
         """
+        if collection_name in self._known_collections:
+            return True
         try:
-            collections = self.client.get_collections()
-            collection_names = [c.name for c in collections.collections]
-
-            if collection_name not in collection_names:
-                self.client.create_collection(
-                    collection_name=collection_name,
-                    vectors_config=VectorParams(
-                        size=self.embedding_service.vector_size,
-                        distance=Distance.COSINE,
-                    ),
-                )
+            # Concurrent ingestions into the same collection must not race on creation
+            with self._collections_lock:
+                if not self._call('collection_exists', collection_name=collection_name):
+                    self._call(
+                        'create_collection',
+                        collection_name=collection_name,
+                        vectors_config=VectorParams(
+                            size=self.embedding_service.vector_size,
+                            distance=Distance.COSINE,
+                        ),
+                    )
+                self._known_collections.add(collection_name)
             return True
         except Exception as e:
             logger.error(
@@ -130,7 +176,7 @@ class QdrantVectorStore(VectorStore):
         Raises:
             ValueError: If the collection doesn't exist
         """
-        if not self._ensure_collection(collection_name):
+        if not await asyncio.to_thread(self._ensure_collection, collection_name):
             raise ValueError(
                 f"Collection '{collection_name}' does not exist in Qdrant.",
             )
@@ -151,7 +197,9 @@ class QdrantVectorStore(VectorStore):
                 )
                 points.append(point)
 
-            self.client.upsert(
+            await asyncio.to_thread(
+                self._call,
+                'upsert',
                 collection_name=collection_name,
                 points=points,
             )
@@ -185,6 +233,12 @@ class QdrantVectorStore(VectorStore):
             List of search results ordered by similarity score
         """
         try:
+            # Searching a collection nothing was added to yet finds nothing
+            if collection_name not in self._known_collections:
+                if not self._call('collection_exists', collection_name=collection_name):
+                    return []
+                self._known_collections.add(collection_name)
+
             query_filter = None
             if filters:
                 # Convert filters to Qdrant filter format
@@ -198,7 +252,8 @@ class QdrantVectorStore(VectorStore):
                     ],
                 )
 
-            search_result = self.client.search(
+            search_result = self._call(
+                'search',
                 collection_name=collection_name,
                 query_vector=query_vector,
                 query_filter=query_filter,
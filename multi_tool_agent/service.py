@@ -0,0 +1,211 @@
+import argparse
+import asyncio
+import json
+import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from contextlib import AsyncExitStack
+from typing import Any
+from typing import Optional
+
+from multi_tool_agent.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+APP_NAME = 'deep-research-service'
+
+
+def _sse(data: dict[str, Any] | str, event: Optional[str] = None) -> str:
+    """
+    Format one server-sent event.
+
+    Args:
+        data: JSON payload, as a dictionary or an already serialized string
+        event: Event type, or None for the default 'message' type
+
+    Returns:
+        Server-sent event frame
+    """
+    payload = data if isinstance(data, str) else json.dumps(data, ensure_ascii=False, default=str)
+    return (f'event: {event}\n' if event else '') + f'data: {payload}\n\n'
+
+
+def create_app(agent: Any) -> Any:
+    """
+    Create the HTTP service exposing an agent.
+
+    POST /research admits the request through the process-wide admission
+    controller and streams the workflow events as server-sent events. Requests
+    over the tenant's quota are answered with 429, and requests shed because the
+    queue is full or too slow with 503; both carry a Retry-After header. GET
+    /metrics reports the queue depth and the work in flight for autoscaling,
+    and GET /healthz the readiness of the process.
+
+    Args:
+        agent: Root agent answering the requests
+
+    Returns:
+        FastAPI application
+    """
+    from fastapi import FastAPI
+    from fastapi import Header
+    from fastapi.responses import JSONResponse
+    from fastapi.responses import StreamingResponse
+    from google.adk.runners import Runner
+    from google.adk.sessions import InMemorySessionService
+    from google.genai import types
+    from pydantic import BaseModel
+    from starlette.background import BackgroundTask
+
+    from multi_tool_agent.core.admission import admission_controller
+    from multi_tool_agent.core.admission import AdmissionRejected
+    from multi_tool_agent.core.scheduler import branch_scheduler
+    from multi_tool_agent.core.tools.mcp_pool import tavily_mcp_pool
+    from multi_tool_agent.core.tools.mirrors import pdf_downloader
+    from multi_tool_agent.core.warmup import readiness
+    from multi_tool_agent.core.warmup import start_warmup
+
+    class ResearchRequest(BaseModel):
+        query: str
+        session_id: Optional[str] = None
+        user_id: Optional[str] = None
+
+    runner = Runner(agent=agent, app_name=APP_NAME, session_service=InMemorySessionService())
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        warm = start_warmup(agent.services) if agent.services.config.warmup else None
+        if agent.services.config.ingest_queue:
+            # Adopts the jobs left by an earlier process and starts pre-ingestion
+            agent.services.ingestion_queue.start()
+        try:
+            yield
+        finally:
+            if warm is not None:
+                await warm.close()
+            if agent.services.config.ingest_queue:
+                await agent.services.ingestion_queue.close()
+            await tavily_mcp_pool.close()
+            await pdf_downloader.close()
+
+    app = FastAPI(title='Deep Research', lifespan=lifespan)
+
+    @app.post('/research')
+    async def research(
+        request: ResearchRequest, x_tenant_id: Optional[str] = Header(default=None),
+    ) -> Any:
+        tenant = x_tenant_id or 'default'
+        user_id = request.user_id or tenant
+        cost = admission_controller.estimate_cost(request.query)
+
+        # Entered here, so that rejections are answered with a status code, and
+        # left when the stream ends or the client disconnects
+        slot = AsyncExitStack()
+        try:
+            waited = await slot.enter_async_context(admission_controller.admit(tenant, cost))
+        except AdmissionRejected as e:
+            return JSONResponse(
+                status_code=e.status,
+                content={'error': e.reason, 'retry_after': e.retry_after},
+                headers={'Retry-After': str(int(e.retry_after + 0.999))},
+            )
+
+        try:
+            session = None
+            if request.session_id:
+                session = await runner.session_service.get_session(
+                    app_name=APP_NAME, user_id=user_id, session_id=request.session_id,
+                )
+            if session is None:
+                session = await runner.session_service.create_session(
+                    app_name=APP_NAME, user_id=user_id, session_id=request.session_id,
+                )
+        except BaseException:
+            await slot.aclose()
+            raise
+
+        async def stream() -> AsyncIterator[str]:
+            try:
+                yield _sse({'session_id': session.id, 'queued_seconds': round(waited, 3), 'cost': cost}, 'admitted')
+                message = types.Content(role='user', parts=[types.Part(text=request.query)])
+                async for event in runner.run_async(user_id=user_id, session_id=session.id, new_message=message):
+                    yield _sse(event.model_dump_json(exclude_none=True, by_alias=True))
+                yield _sse({'session_id': session.id}, 'done')
+            except Exception as e:
+                logger.error(f'Research request of tenant {tenant} failed: {e}', exc_info=True)
+                yield _sse({'error': repr(e)}, 'error')
+            finally:
+                await slot.aclose()
+
+        # The background task releases the slot if the stream never started
+        return StreamingResponse(
+            stream(),
+            media_type='text/event-stream',
+            headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+            background=BackgroundTask(slot.aclose),
+        )
+
+    @app.get('/metrics')
+    async def metrics() -> dict[str, Any]:
+        report = {
+            'admission': admission_controller.metrics(),
+            'branches': branch_scheduler.metrics(),
+            'readiness': readiness(),
+        }
+        if agent.services.config.ingest_queue:
+            report['ingestion'] = await asyncio.to_thread(agent.services.ingestion_queue.metrics)
+        return report
+
+    @app.get('/healthz')
+    async def healthz() -> Any:
+        report = readiness()
+        return JSONResponse(status_code=200 if report['ready'] else 503, content=report)
+
+    return app
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    Parse the command-line arguments.
+
+    Returns:
+        Parsed arguments
+    """
+    parser = argparse.ArgumentParser(description='Serve the root agent over HTTP with admission control')
+    parser.add_argument('--host', default='127.0.0.1', help='Interface to bind')
+    parser.add_argument('--port', type=int, default=8080, help='Port to bind')
+    parser.add_argument('--env-file', help='Environment file to load (default: multi_tool_agent/.env)')
+    return parser.parse_args()
+
+
+def serve(host: str, port: int, env_file: Optional[str] = None) -> None:
+    """
+    Load the environment and serve the root agent until interrupted.
+
+    Args:
+        host: Interface to bind
+        port: Port to bind
+        env_file: Environment file to load (default: multi_tool_agent/.env)
+    """
+    try:
+        from dotenv import load_dotenv
+        load_dotenv(env_file or os.path.join(os.path.dirname(__file__), '.env'))
+    except ImportError:
+        pass
+
+    import uvicorn
+
+    # Imported after the environment is loaded, since the configuration is read on import
+    from multi_tool_agent.agent import root_agent
+
+    uvicorn.run(create_app(root_agent), host=host, port=port)
+
+
+def main() -> None:
+    """Run the service from the command line."""
+    args = parse_args()
+    serve(args.host, args.port, args.env_file)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,443 @@
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable
+from collections.abc import Callable
+from typing import Any
+from typing import Optional
+
+from multi_tool_agent.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Seconds between purges of the expired entries of the persistent tier
+_PURGE_INTERVAL = 300.0
+
+# Maximum number of keys looked up in one SQLite statement
+_LOOKUP_BATCH = 500
+
+# Seconds a statement waits for another process's write lock before giving up
+_BUSY_TIMEOUT = 0.5
+
+
+class TTLCache:
+    """
+    Two-tier cache with per-entry time-to-live and request coalescing.
+
+    Entries live in a bounded in-memory LRU tier and, when a directory is given, in
+    a SQLite file that survives restarts. Values must be JSON-serializable and
+    should be treated as read-only by callers.
+
+    The SQLite file can be shared by several processes: a miss claims a lease on
+    its key, and the other processes missing the same key wait for the entry
+    instead of fetching it again. The persistent tier is read and written in a
+    worker thread, so that disk I/O does not block the event loop, and a
+    statement that finds the file locked by another process for longer than a
+    short busy timeout is treated as a miss.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl: float,
+        max_entries: int = 1024,
+        directory: Optional[str] = None,
+        lease_timeout: float = 60.0,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            name: Name of the cache, used for the SQLite file name and logging
+            ttl: Time-to-live of each entry in seconds (0 disables caching)
+            max_entries: Maximum number of entries kept in memory
+            directory: Directory of the persistent tier (None keeps the cache in memory only)
+            lease_timeout: Seconds other processes wait for a fetch claimed by one process
+        """
+        self.name = name
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.directory = directory
+        self.lease_timeout = lease_timeout
+        self.hits = 0
+        self.misses = 0
+        self._memory: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task] = {}
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+        self._purged_at = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Whether entries are stored at all.
+
+        Returns:
+            True if the TTL is positive
+        """
+        return self.ttl > 0
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """
+        Lazily open the persistent tier.
+
+        Returns:
+            SQLite connection, or None if there is no persistent tier
+        """
+        if self.directory is None:
+            return None
+        # Opened by whichever thread gets here first
+        with self._db_lock:
+            if self._db is None:
+                try:
+                    os.makedirs(self.directory, exist_ok=True)
+                    db = sqlite3.connect(
+                        os.path.join(self.directory, f'{self.name}.sqlite'),
+                        timeout=_BUSY_TIMEOUT,
+                        check_same_thread=False,
+                    )
+                    db.execute('PRAGMA journal_mode=WAL')
+                    db.execute(
+                        'CREATE TABLE IF NOT EXISTS entries '
+                        '(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)',
+                    )
+                    db.execute('CREATE INDEX IF NOT EXISTS entries_expiry ON entries (expires_at)')
+                    db.execute(
+                        'CREATE TABLE IF NOT EXISTS leases '
+                        '(key TEXT PRIMARY KEY, owner INTEGER NOT NULL, expires_at REAL NOT NULL)',
+                    )
+                    db.commit()
+                    self._db = db
+                except Exception as e:
+                    logger.warning(
+                        f'Persistent tier of cache {self.name} unavailable, using memory only: {e}',
+                    )
+                    self.directory = None
+        return self._db
+
+    def _remember(self, key: str, expires_at: float, value: Any) -> None:
+        """
+        Store an entry in the in-memory tier, evicting the least recently used one.
+
+        Args:
+            key: Cache key
+            expires_at: Expiry timestamp of the entry
+            value: Cached value
+        """
+        self._memory[key] = (expires_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _recall(self, key: str) -> Optional[Any]:
+        """
+        Look up a non-expired entry in the in-memory tier.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        entry = self._memory.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.time():
+            del self._memory[key]
+            return None
+        self._memory.move_to_end(key)
+        return entry[1]
+
+    def _load(self, keys: list[str]) -> dict[str, tuple[float, Any]]:
+        """
+        Read non-expired entries from the persistent tier.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Expiry timestamp and value of each key found
+        """
+        db = self._connect()
+        if db is None:
+            return {}
+        now = time.time()
+        rows = []
+        try:
+            with self._db_lock:
+                for start in range(0, len(keys), _LOOKUP_BATCH):
+                    batch = keys[start:start + _LOOKUP_BATCH]
+                    rows += db.execute(
+                        f'SELECT key, value, expires_at FROM entries '
+                        f'WHERE key IN ({", ".join("?" * len(batch))}) AND expires_at > ?',
+                        (*batch, now),
+                    ).fetchall()
+        except sqlite3.OperationalError as e:
+            logger.debug(f'Cache {self.name} lookup skipped: {e}')
+        return {key: (expires_at, json.loads(value)) for key, value, expires_at in rows}
+
+    def _store(self, items: dict[str, Any], expires_at: float) -> None:
+        """
+        Write entries to the persistent tier in one transaction.
+
+        Expired entries are purged every few minutes rather than on every write.
+
+        Args:
+            items: Values by cache key
+            expires_at: Expiry timestamp of the entries
+        """
+        db = self._connect()
+        if db is None:
+            return
+        rows = [(key, json.dumps(value, ensure_ascii=False), expires_at) for key, value in items.items()]
+        now = time.time()
+        with self._db_lock:
+            try:
+                db.executemany('INSERT OR REPLACE INTO entries (key, value, expires_at) VALUES (?, ?, ?)', rows)
+                if now - self._purged_at >= _PURGE_INTERVAL:
+                    db.execute('DELETE FROM entries WHERE expires_at <= ?', (now,))
+                    self._purged_at = now
+                db.commit()
+            except sqlite3.OperationalError as e:
+                # The entries stay in memory; other processes fetch them again
+                db.rollback()
+                logger.debug(f'Cache {self.name} write skipped: {e}')
+
+    async def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """
+        Look up non-expired entries, checking memory first and then disk.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Cached value of each key found
+        """
+        if not self.enabled:
+            return {}
+
+        found = {}
+        missing = []
+        for key in keys:
+            value = self._recall(key)
+            if value is None:
+                missing.append(key)
+            else:
+                found[key] = value
+
+        if missing and self.directory is not None:
+            for key, (expires_at, value) in (await asyncio.to_thread(self._load, missing)).items():
+                self._remember(key, expires_at, value)
+                found[key] = value
+        return found
+
+    async def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a non-expired entry, checking memory first and then disk.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        return (await self.get_many([key])).get(key)
+
+    async def set_many(self, items: dict[str, Any]) -> None:
+        """
+        Store entries in both tiers, writing them to disk in one transaction.
+
+        Args:
+            items: JSON-serializable values by cache key
+        """
+        if not self.enabled or not items:
+            return
+
+        expires_at = time.time() + self.ttl
+        for key, value in items.items():
+            self._remember(key, expires_at, value)
+        if self.directory is not None:
+            await asyncio.to_thread(self._store, items, expires_at)
+
+    async def set(self, key: str, value: Any) -> None:
+        """
+        Store an entry in both tiers.
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value to cache
+        """
+        await self.set_many({key: value})
+
+    def _claim(self, key: str) -> bool:
+        """
+        Claim the fetch of a key among the processes sharing the persistent tier.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            True if this process should fetch the value, False if another
+            process holds an unexpired lease on it
+        """
+        db = self._connect()
+        if db is None:
+            return True
+        now = time.time()
+        with self._db_lock:
+            try:
+                db.execute('DELETE FROM leases WHERE key = ? AND expires_at <= ?', (key, now))
+                cursor = db.execute(
+                    'INSERT OR IGNORE INTO leases (key, owner, expires_at) VALUES (?, ?, ?)',
+                    (key, os.getpid(), now + self.lease_timeout),
+                )
+                db.commit()
+            except sqlite3.OperationalError as e:
+                db.rollback()
+                logger.debug(f'Cache {self.name} fetching "{key}" without a lease: {e}')
+                return True
+        return cursor.rowcount == 1
+
+    def _unclaim(self, key: str) -> None:
+        """
+        Release the lease of this process on a key.
+
+        Args:
+            key: Cache key
+        """
+        db = self._connect()
+        if db is None:
+            return
+        with self._db_lock:
+            try:
+                db.execute('DELETE FROM leases WHERE key = ? AND owner = ?', (key, os.getpid()))
+                db.commit()
+            except sqlite3.OperationalError as e:
+                # The lease expires on its own
+                db.rollback()
+                logger.debug(f'Cache {self.name} lease on "{key}" not released: {e}')
+
+    def _leased(self, key: str) -> bool:
+        """
+        Check whether a process holds an unexpired lease on a key.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            True if the key is leased, or if the persistent tier is locked
+        """
+        db = self._connect()
+        if db is None:
+            return False
+        try:
+            with self._db_lock:
+                row = db.execute(
+                    'SELECT 1 FROM leases WHERE key = ? AND expires_at > ?', (key, time.time()),
+                ).fetchone()
+        except sqlite3.OperationalError:
+            return True
+        return row is not None
+
+    async def _wait_for_lease(self, key: str, interval: float = 0.1) -> Optional[Any]:
+        """
+        Wait for another process to store the value of a key it claimed.
+
+        Args:
+            key: Cache key
+            interval: Seconds between checks of the persistent tier
+
+        Returns:
+            Value stored by the other process, or None if its lease was released
+            or expired without one
+        """
+        deadline = time.monotonic() + self.lease_timeout
+        while time.monotonic() < deadline:
+            await asyncio.sleep(interval)
+            value = await self.get(key)
+            if value is not None:
+                return value
+            if not await asyncio.to_thread(self._leased, key):
+                return None
+        return None
+
+    async def _fetch(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Fetch and store the value of a missing key, unless another process already is.
+
+        Runs in a task of its own, shared by every caller of the key, so that
+        cancelling one of them does not cancel the fetch of the others.
+
+        Args:
+            key: Cache key
+            fetch: Coroutine factory producing the value
+
+        Returns:
+            Fetched value, or the value stored by the process holding the lease
+        """
+        claimed = False
+        try:
+            claimed = not self.enabled or self.directory is None or await asyncio.to_thread(self._claim, key)
+            if not claimed:
+                value = await self._wait_for_lease(key)
+                if value is not None:
+                    self.hits += 1
+                    logger.debug(f'Cache {self.name} joined fetch of another process for key "{key}"')
+                    return value
+
+            self.misses += 1
+            value = await fetch()
+            await self.set(key, value)
+            return value
+        finally:
+            del self._inflight[key]
+            if claimed and self.enabled and self.directory is not None:
+                await asyncio.to_thread(self._unclaim, key)
+
+    async def get_or_fetch(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Return a cached value or fetch it, sharing one fetch among concurrent callers.
+
+        Cancelling a caller only stops its wait: the fetch goes on for the others
+        and its value is cached.
+
+        Args:
+            key: Cache key
+            fetch: Coroutine factory producing the value on a miss
+
+        Returns:
+            Cached or freshly fetched value
+        """
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            value = await self.get(key)
+            if value is not None:
+                self.hits += 1
+                logger.debug(f'Cache {self.name} hit for key "{key}"')
+                return value
+            # Another caller may have started fetching while the disk was read
+            inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.hits += 1
+            logger.debug(f'Cache {self.name} joined in-flight fetch for key "{key}"')
+        else:
+            inflight = asyncio.get_running_loop().create_task(self._fetch(key, fetch))
+            # Mark the exception as retrieved when every caller was cancelled
+            inflight.add_done_callback(lambda task: task.cancelled() or task.exception())
+            self._inflight[key] = inflight
+        return await asyncio.shield(inflight)
+
+    def clear(self) -> None:
+        """Remove all entries from both tiers."""
+        self._memory.clear()
+        db = self._connect()
+        if db is None:
+            return
+        with self._db_lock:
+            db.execute('DELETE FROM entries')
+            db.execute('DELETE FROM leases')
+            db.commit()
@@ -15,13 +15,179 @@ class Config:
         self.qdrant_grpc_port = int(os.getenv('QDRANT_GRPC_PORT', '6334'))
         self.qdrant_prefer_grpc = os.getenv('QDRANT_PREFER_GRPC', 'true').lower() == 'true'
         self.qdrant_collection = os.getenv('QDRANT_COLLECTION', 'documents')
+        self.qdrant_location = os.getenv(
+            'QDRANT_LOCATION', '',
+        )  # ':memory:' or a local path for embedded Qdrant, empty = server at host/port
 
         self.embedding_type = os.getenv('EMBEDDING_TYPE', 'openai')  # openai
         self.embedding_model = os.getenv(
             'EMBEDDING_MODEL', 'text-embedding-3-small',
         )
+        self.embedding_cache_ttl = float(
+            os.getenv('EMBEDDING_CACHE_TTL', '2592000'),
+        )  # seconds, 0 = disabled
         self.openai_api_key = os.getenv('OPENAI_API_KEY')
 
+        self.classify_model = os.getenv('CLASSIFY_MODEL', 'gemini-2.0-flash-lite')
+        self.plan_model = os.getenv('PLAN_MODEL', 'gemini-2.0-flash')
+        self.filter_model = os.getenv('FILTER_MODEL', 'gemini-2.0-flash-lite')
+        self.web_search_model = os.getenv('WEB_SEARCH_MODEL', 'gemini-2.0-flash')
+        self.answer_model = os.getenv('ANSWER_MODEL', 'gemini-2.0-flash')
+        self.fallback_model = os.getenv('FALLBACK_MODEL', 'gemini-2.0-flash-lite')
+        self.classify_latency_budget = float(
+            os.getenv('CLASSIFY_LATENCY_BUDGET', '0'),
+        )  # p95 seconds, 0 = never fall back
+        self.plan_latency_budget = float(os.getenv('PLAN_LATENCY_BUDGET', '0'))
+        self.filter_latency_budget = float(os.getenv('FILTER_LATENCY_BUDGET', '0'))
+        self.web_search_latency_budget = float(
+            os.getenv('WEB_SEARCH_LATENCY_BUDGET', '0'),
+        )
+        self.answer_latency_budget = float(os.getenv('ANSWER_LATENCY_BUDGET', '0'))
+        self.model_router_window = int(os.getenv('MODEL_ROUTER_WINDOW', '50'))
+        self.model_router_cooldown = float(
+            os.getenv('MODEL_ROUTER_COOLDOWN', '300'),
+        )  # seconds on the fallback model before retrying the primary one
+
+        self.cache_dir = os.path.expanduser(
+            os.getenv('CACHE_DIR', '~/.cache/deep-research'),
+        )  # empty = in-memory caches only
+
+        self.tracing = os.getenv('TRACING', 'auto')  # auto, otel, jsonl, none
+        self.trace_dir = os.path.expanduser(
+            os.getenv('TRACE_DIR', ''),
+        )  # JSON-lines spans, also enables them in auto mode (empty = CACHE_DIR/traces)
+
+        self.arxiv_api_url = os.getenv(
+            'ARXIV_API_URL', 'http://export.arxiv.org/api/query',
+        )
+        self.arxiv_pdf_url = os.getenv('ARXIV_PDF_URL', 'http://arxiv.org/pdf')
+        self.arxiv_pdf_urls = [
+            url.strip() for url in os.getenv('ARXIV_PDF_URLS', self.arxiv_pdf_url).split(',') if url.strip()
+        ]  # mirrors, in order of preference
+        self.arxiv_pdf_hedge_delay = float(
+            os.getenv('ARXIV_PDF_HEDGE_DELAY', '2'),
+        )  # seconds, until enough latencies are observed
+        self.arxiv_pdf_hedge_percentile = float(os.getenv('ARXIV_PDF_HEDGE_PERCENTILE', '90'))
+        self.arxiv_pdf_max_requests = int(
+            os.getenv('ARXIV_PDF_MAX_REQUESTS', '2'),
+        )  # per download, hedged duplicates included, 1 = no hedging
+        self.arxiv_pdf_timeout = float(os.getenv('ARXIV_PDF_TIMEOUT', '60'))  # seconds
+        self.arxiv_search_cache_ttl = float(
+            os.getenv('ARXIV_SEARCH_CACHE_TTL', '3600'),
+        )  # seconds, 0 = disabled
+        self.arxiv_paper_cache_ttl = float(
+            os.getenv('ARXIV_PAPER_CACHE_TTL', '2592000'),
+        )  # seconds the extracted text of a paper is kept, 0 = disabled
+        self.arxiv_ingest_concurrency = int(
+            os.getenv('ARXIV_INGEST_CONCURRENCY', '3'),
+        )
+        self.arxiv_ingest_quorum = int(os.getenv('ARXIV_INGEST_QUORUM', '0'))  # 0 = all papers
+        self.arxiv_ingest_deadline = float(
+            os.getenv('ARXIV_INGEST_DEADLINE', '0'),
+        )  # seconds, 0 = no deadline
+        self.ingest_queue = os.getenv('INGEST_QUEUE', 'true').lower() == 'true'
+        self.ingest_workers = int(os.getenv('INGEST_WORKERS', '8'))
+        self.ingest_max_attempts = int(os.getenv('INGEST_MAX_ATTEMPTS', '2'))
+        self.ingest_preingest_interval = float(
+            os.getenv('INGEST_PREINGEST_INTERVAL', '0'),
+        )  # seconds between pre-ingestions of the popular papers, 0 = disabled
+        self.ingest_preingest_top = int(os.getenv('INGEST_PREINGEST_TOP', '20'))
+        self.ingest_preingest_window = float(
+            os.getenv('INGEST_PREINGEST_WINDOW', '86400'),
+        )  # seconds of request history defining the popular papers
+
+        self.web_search_backend = os.getenv('WEB_SEARCH_BACKEND', 'mcp')  # mcp, native
+        self.tavily_api_url = os.getenv(
+            'TAVILY_API_URL', 'https://api.tavily.com',
+        )
+        self.tavily_timeout = float(os.getenv('TAVILY_TIMEOUT', '15'))
+        self.tavily_search_cache_ttl = float(
+            os.getenv('TAVILY_SEARCH_CACHE_TTL', '900'),
+        )  # seconds, 0 = disabled
+        self.tavily_mcp_pool_size = int(os.getenv('TAVILY_MCP_POOL_SIZE', '2'))
+        self.tavily_mcp_command = os.getenv('TAVILY_MCP_COMMAND', 'npx')
+        self.tavily_mcp_args = os.getenv(
+            'TAVILY_MCP_ARGS', '-y tavily-mcp@latest',
+        )  # e.g. TAVILY_MCP_COMMAND=tavily-mcp with empty args for a pinned local install
+        self.tavily_mcp_health_interval = float(
+            os.getenv('TAVILY_MCP_HEALTH_INTERVAL', '60'),
+        )  # seconds, 0 = disabled
+
+        self.research_max_arxiv_branches = int(
+            os.getenv('RESEARCH_MAX_ARXIV_BRANCHES', '4'),
+        )
+        self.research_max_web_branches = int(
+            os.getenv('RESEARCH_MAX_WEB_BRANCHES', '8'),
+        )
+        self.research_max_branches_per_session = int(
+            os.getenv('RESEARCH_MAX_BRANCHES_PER_SESSION', '3'),
+        )
+
+        self.request_deadline = float(os.getenv('REQUEST_DEADLINE', '0'))  # seconds, 0 = no deadline
+        self.research_deadline = float(os.getenv('RESEARCH_DEADLINE', '0'))  # seconds, 0 = no deadline
+        self.arxiv_branch_deadline = float(
+            os.getenv('ARXIV_BRANCH_DEADLINE', '0'),
+        )  # seconds, 0 = no deadline
+        self.web_branch_deadline = float(
+            os.getenv('WEB_BRANCH_DEADLINE', '0'),
+        )  # seconds, 0 = no deadline
+        self.deadline_answer_reserve = float(
+            os.getenv('DEADLINE_ANSWER_RESERVE', '15'),
+        )  # seconds of the request deadline kept for the answer
+        self.arxiv_rag_reserve = float(
+            os.getenv('ARXIV_RAG_RESERVE', '2'),
+        )  # seconds of an arXiv branch deadline kept for retrieval
+
+        self.answer_context_tokens = int(
+            os.getenv('ANSWER_CONTEXT_TOKENS', '6000'),
+        )
+        self.answer_streaming = os.getenv('ANSWER_STREAMING', 'false').lower() == 'true'
+
+        self.run_state_pruning = os.getenv(
+            'RUN_STATE_PRUNING', 'delete',
+        )  # delete, archive, none
+
+        self.speculative_planning = os.getenv('SPECULATIVE_PLANNING', 'false').lower() == 'true'
+        self.speculation_min_overlap = float(
+            os.getenv('SPECULATION_MIN_OVERLAP', '0.5'),
+        )
+
+        self.run_checkpoints = os.getenv('RUN_CHECKPOINTS', 'true').lower() == 'true'
+        self.run_checkpoint_ttl = float(
+            os.getenv('RUN_CHECKPOINT_TTL', '3600'),
+        )  # seconds an unfinished run can be resumed, 0 = no limit
+
+        self.run_reuse = os.getenv('RUN_REUSE', 'false').lower() == 'true'
+        self.run_reuse_threshold = float(
+            os.getenv('RUN_REUSE_THRESHOLD', '0.92'),
+        )  # minimum cosine similarity of the user intents
+        self.run_reuse_ttl = float(
+            os.getenv('RUN_REUSE_TTL', '604800'),
+        )  # seconds a completed run can be reused, 0 = no limit
+        self.run_reuse_web_refresh = os.getenv('RUN_REUSE_WEB_REFRESH', 'true').lower() == 'true'
+        self.run_registry_collection = os.getenv('RUN_REGISTRY_COLLECTION', 'run_registry')
+
+        self.warmup = os.getenv('WARMUP', 'false').lower() == 'true'
+        self.warmup_timeout = float(os.getenv('WARMUP_TIMEOUT', '30'))  # seconds
+        self.warmup_keepalive_interval = float(
+            os.getenv('WARMUP_KEEPALIVE_INTERVAL', '60'),
+        )  # seconds, 0 = disabled
+
+        self.service_capacity = int(
+            os.getenv('SERVICE_CAPACITY', '8'),
+        )  # cost units in flight; a research request costs SERVICE_RESEARCH_COST, a short message 1
+        self.service_research_cost = int(os.getenv('SERVICE_RESEARCH_COST', '4'))
+        self.service_max_queue = int(os.getenv('SERVICE_MAX_QUEUE', '32'))
+        self.service_max_queue_wait = float(
+            os.getenv('SERVICE_MAX_QUEUE_WAIT', '30'),
+        )  # seconds; requests expected to wait longer are shed
+        self.service_tenant_limit = int(
+            os.getenv('SERVICE_TENANT_LIMIT', '4'),
+        )  # requests per tenant in flight or queued
+        self.service_workers = int(
+            os.getenv('SERVICE_WORKERS', '0'),
+        )  # worker processes of the supervisor, 0 = one per CPU
+
     def to_dict(self) -> dict[str, Any]:
         """
         Convert configuration to dictionary format.
@@ -36,9 +202,83 @@ class Config:
             'qdrant_grpc_port': self.qdrant_grpc_port,
             'qdrant_prefer_grpc': self.qdrant_prefer_grpc,
             'qdrant_collection': self.qdrant_collection,
+            'qdrant_location': self.qdrant_location,
             'embedding_type': self.embedding_type,
             'embedding_model': self.embedding_model,
+            'embedding_cache_ttl': self.embedding_cache_ttl,
             'openai_api_key': self.openai_api_key,
+            'classify_model': self.classify_model,
+            'plan_model': self.plan_model,
+            'filter_model': self.filter_model,
+            'web_search_model': self.web_search_model,
+            'answer_model': self.answer_model,
+            'fallback_model': self.fallback_model,
+            'classify_latency_budget': self.classify_latency_budget,
+            'plan_latency_budget': self.plan_latency_budget,
+            'filter_latency_budget': self.filter_latency_budget,
+            'web_search_latency_budget': self.web_search_latency_budget,
+            'answer_latency_budget': self.answer_latency_budget,
+            'model_router_window': self.model_router_window,
+            'model_router_cooldown': self.model_router_cooldown,
+            'cache_dir': self.cache_dir,
+            'tracing': self.tracing,
+            'trace_dir': self.trace_dir,
+            'arxiv_api_url': self.arxiv_api_url,
+            'arxiv_pdf_url': self.arxiv_pdf_url,
+            'arxiv_pdf_urls': self.arxiv_pdf_urls,
+            'arxiv_pdf_hedge_delay': self.arxiv_pdf_hedge_delay,
+            'arxiv_pdf_hedge_percentile': self.arxiv_pdf_hedge_percentile,
+            'arxiv_pdf_max_requests': self.arxiv_pdf_max_requests,
+            'arxiv_pdf_timeout': self.arxiv_pdf_timeout,
+            'arxiv_search_cache_ttl': self.arxiv_search_cache_ttl,
+            'arxiv_paper_cache_ttl': self.arxiv_paper_cache_ttl,
+            'arxiv_ingest_concurrency': self.arxiv_ingest_concurrency,
+            'arxiv_ingest_quorum': self.arxiv_ingest_quorum,
+            'arxiv_ingest_deadline': self.arxiv_ingest_deadline,
+            'ingest_queue': self.ingest_queue,
+            'ingest_workers': self.ingest_workers,
+            'ingest_max_attempts': self.ingest_max_attempts,
+            'ingest_preingest_interval': self.ingest_preingest_interval,
+            'ingest_preingest_top': self.ingest_preingest_top,
+            'ingest_preingest_window': self.ingest_preingest_window,
+            'web_search_backend': self.web_search_backend,
+            'tavily_api_url': self.tavily_api_url,
+            'tavily_timeout': self.tavily_timeout,
+            'tavily_search_cache_ttl': self.tavily_search_cache_ttl,
+            'tavily_mcp_pool_size': self.tavily_mcp_pool_size,
+            'tavily_mcp_command': self.tavily_mcp_command,
+            'tavily_mcp_args': self.tavily_mcp_args,
+            'tavily_mcp_health_interval': self.tavily_mcp_health_interval,
+            'research_max_arxiv_branches': self.research_max_arxiv_branches,
+            'research_max_web_branches': self.research_max_web_branches,
+            'research_max_branches_per_session': self.research_max_branches_per_session,
+            'request_deadline': self.request_deadline,
+            'research_deadline': self.research_deadline,
+            'arxiv_branch_deadline': self.arxiv_branch_deadline,
+            'web_branch_deadline': self.web_branch_deadline,
+            'deadline_answer_reserve': self.deadline_answer_reserve,
+            'arxiv_rag_reserve': self.arxiv_rag_reserve,
+            'answer_context_tokens': self.answer_context_tokens,
+            'answer_streaming': self.answer_streaming,
+            'run_state_pruning': self.run_state_pruning,
+            'speculative_planning': self.speculative_planning,
+            'speculation_min_overlap': self.speculation_min_overlap,
+            'run_checkpoints': self.run_checkpoints,
+            'run_checkpoint_ttl': self.run_checkpoint_ttl,
+            'run_reuse': self.run_reuse,
+            'run_reuse_threshold': self.run_reuse_threshold,
+            'run_reuse_ttl': self.run_reuse_ttl,
+            'run_reuse_web_refresh': self.run_reuse_web_refresh,
+            'run_registry_collection': self.run_registry_collection,
+            'warmup': self.warmup,
+            'warmup_timeout': self.warmup_timeout,
+            'warmup_keepalive_interval': self.warmup_keepalive_interval,
+            'service_capacity': self.service_capacity,
+            'service_research_cost': self.service_research_cost,
+            'service_max_queue': self.service_max_queue,
+            'service_max_queue_wait': self.service_max_queue_wait,
+            'service_tenant_limit': self.service_tenant_limit,
+            'service_workers': self.service_workers,
         }
 
 
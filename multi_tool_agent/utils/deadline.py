@@ -0,0 +1,131 @@
+import asyncio
+import time
+from collections.abc import AsyncGenerator
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+from typing import TypeVar
+
+T = TypeVar('T')
+
+_deadline: ContextVar[Optional[float]] = ContextVar('deadline', default=None)
+
+_DONE = object()
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised by iterate_until when the deadline passes before the generator finished."""
+
+
+def current_deadline() -> Optional[float]:
+    """
+    Return the deadline of the current context.
+
+    Returns:
+        Deadline on the time.monotonic() clock, or None if there is none
+    """
+    return _deadline.get()
+
+
+def remaining(deadline: Optional[float]) -> Optional[float]:
+    """
+    Seconds left until a deadline.
+
+    Args:
+        deadline: Deadline on the time.monotonic() clock, or None
+
+    Returns:
+        Seconds left (negative once expired), or None if there is no deadline
+    """
+    return None if deadline is None else deadline - time.monotonic()
+
+
+@contextmanager
+def deadline_scope(budget: float, reserve: float = 0.0) -> Iterator[Optional[float]]:
+    """
+    Bound the enclosed block, and every task started in it, by a deadline.
+
+    The deadline is the earlier of `budget` seconds from now and the enclosing
+    deadline minus `reserve` seconds, so a nested stage never outlives its parent
+    and leaves the parent time for the work that follows it.
+
+    Args:
+        budget: Seconds the block may take (0 adds no budget of its own)
+        reserve: Seconds of the enclosing deadline kept for the work after the block
+
+    Yields:
+        The deadline of the block, or None if there is none
+    """
+    candidates = []
+    if budget > 0:
+        candidates.append(time.monotonic() + budget)
+    parent = _deadline.get()
+    if parent is not None:
+        candidates.append(parent - reserve)
+    deadline = min(candidates) if candidates else None
+    token = _deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        try:
+            _deadline.reset(token)
+        except ValueError:
+            # Async generators may be closed from another context
+            pass
+
+
+async def iterate_until(items: AsyncGenerator[T, None], deadline: Optional[float]) -> AsyncGenerator[T, None]:
+    """
+    Re-yield the items of an async generator until a deadline passes.
+
+    The generator runs to completion in a task of its own, one item at a time, so
+    that it can be cancelled cleanly at the deadline: its cleanup then runs in the
+    context it was started in, whereas cancelling the consumer of this generator
+    would cancel whatever task happens to be driving it.
+
+    Args:
+        items: Async generator to drive
+        deadline: Deadline on the time.monotonic() clock (None never expires)
+
+    Yields:
+        The items of the generator
+
+    Raises:
+        DeadlineExceeded: If the deadline passed before the generator finished; the
+            generator has been cancelled and closed by then. Errors raised by the
+            generator itself, TimeoutError included, propagate unchanged
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def drive() -> None:
+        try:
+            async for item in items:
+                consumed = asyncio.Event()
+                await queue.put((item, consumed))
+                # Produce the next item only once this one has been consumed
+                await consumed.wait()
+        finally:
+            await items.aclose()
+            queue.put_nowait((_DONE, None))
+
+    task = asyncio.create_task(drive())
+    try:
+        while True:
+            try:
+                item, consumed = await asyncio.wait_for(queue.get(), timeout=remaining(deadline))
+            except TimeoutError:
+                raise DeadlineExceeded(f'Deadline passed while iterating {items!r}') from None
+            if item is _DONE:
+                break
+            yield item
+            consumed.set()
+        # Re-raise whatever ended the generator early
+        await task
+    finally:
+        if not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
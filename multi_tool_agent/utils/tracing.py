@@ -0,0 +1,340 @@
+import json
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from collections import OrderedDict
+from collections.abc import Callable
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+from typing import Optional
+
+from multi_tool_agent.utils.config import config
+from multi_tool_agent.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+try:
+    from opentelemetry import trace as otel_trace
+except ImportError:  # pragma: no cover - OpenTelemetry is optional
+    otel_trace = None
+
+_context: ContextVar[dict[str, str]] = ContextVar('trace_context', default={})
+_current: ContextVar[Optional['Span']] = ContextVar('trace_span', default=None)
+
+_runs: dict[str, list[dict[str, Any]]] = {}
+# Recently summarized runs, whose late spans are dropped instead of being kept forever
+_finished_runs: OrderedDict[str, None] = OrderedDict()
+_FINISHED_RUNS_KEPT = 1000
+recent_summaries: deque[dict[str, Any]] = deque(maxlen=100)
+_run_listeners: list[Callable[[dict[str, Any]], None]] = []
+
+SUMMED_ATTRIBUTES = ('prompt_tokens', 'output_tokens', 'bytes')
+
+
+class _JsonlExporter:
+    """Append-only JSON-lines writer for finished spans and run summaries."""
+
+    def __init__(self, directory: str) -> None:
+        """
+        Initialize the exporter.
+
+        Args:
+            directory: Directory receiving spans.jsonl and runs.jsonl
+        """
+        self.directory = directory
+        self._files: dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def write(self, file_name: str, record: dict[str, Any]) -> None:
+        """
+        Append one record to a JSON-lines file of the trace directory.
+
+        Args:
+            file_name: Name of the file inside the trace directory
+            record: JSON-serializable record
+        """
+        line = json.dumps(record, ensure_ascii=False, default=str) + '\n'
+        with self._lock:
+            f = self._files.get(file_name)
+            if f is None:
+                os.makedirs(self.directory, exist_ok=True)
+                f = self._files[file_name] = open(
+                    os.path.join(self.directory, file_name), 'a', encoding='utf-8',
+                )
+            f.write(line)
+            f.flush()
+
+
+_exporter: Optional[_JsonlExporter] = None
+_otel_tracer: Any = None
+_mode: Optional[str] = None
+
+
+def _resolve_mode() -> str:
+    """
+    Decide once where spans are exported, according to TRACING.
+
+    In 'auto' mode spans go to OpenTelemetry when an SDK tracer provider has been
+    configured by the host process, to the local JSON-lines files when TRACE_DIR
+    is set, and nowhere otherwise. 'jsonl' (or 'otel' without the SDK) exports to
+    TRACE_DIR, defaulting to the traces directory under CACHE_DIR. Whatever the
+    mode, the spans of a run are kept in memory until finish_run summarizes it.
+
+    Returns:
+        One of 'otel', 'jsonl' or 'none'
+    """
+    global _mode, _exporter, _otel_tracer
+    if _mode is not None:
+        return _mode
+
+    mode = config.tracing
+    if mode in ('auto', 'otel') and otel_trace is not None:
+        provider = otel_trace.get_tracer_provider()
+        configured = type(provider).__name__ not in ('ProxyTracerProvider', 'NoOpTracerProvider')
+        if mode == 'otel' or configured:
+            _otel_tracer = otel_trace.get_tracer('deep-research')
+            mode = 'otel'
+    if mode == 'auto' and _otel_tracer is None:
+        # The JSON-lines files grow without bound, so they are written only on request
+        mode = 'jsonl' if config.trace_dir else 'none'
+    if mode in ('jsonl', 'otel') and _otel_tracer is None:
+        directory = config.trace_dir or (os.path.join(config.cache_dir, 'traces') if config.cache_dir else '')
+        mode = 'jsonl' if directory else 'none'
+        if mode == 'jsonl':
+            _exporter = _JsonlExporter(directory)
+    if mode not in ('otel', 'jsonl'):
+        mode = 'none'
+
+    logger.debug(f'Tracing spans exported to: {mode}')
+    _mode = mode
+    return mode
+
+
+class Span:
+    """A timed operation tagged with the run, agent and session it belongs to."""
+
+    def __init__(self, name: str, attributes: dict[str, Any], parent: Optional['Span']) -> None:
+        """
+        Start the span.
+
+        Args:
+            name: Name of the stage or external call
+            attributes: Initial attributes, merged over the bound trace context
+            parent: Enclosing span, if any
+        """
+        self.name = name
+        self.parent = parent
+        self.span_id = uuid.uuid4().hex[:16]
+        self.attributes: dict[str, Any] = {**_context.get(), **attributes}
+        self.trace_id = parent.trace_id if parent else self.attributes.get('run_id') or uuid.uuid4().hex
+        self.status = 'ok'
+        self.started_at = time.time()
+        self._start = time.perf_counter()
+        self.duration: Optional[float] = None
+
+        self._otel = None
+        if _resolve_mode() == 'otel':
+            otel_context = otel_trace.set_span_in_context(parent._otel) if parent and parent._otel else None
+            self._otel = _otel_tracer.start_span(name, context=otel_context)
+
+    def set(self, **attributes: Any) -> None:
+        """
+        Set attributes of the span.
+
+        Args:
+            **attributes: Attribute values (e.g. bytes, results)
+        """
+        self.attributes.update(attributes)
+
+    def add(self, **amounts: int) -> None:
+        """
+        Add to numeric attributes of the span, such as token counts or byte sizes.
+
+        Args:
+            **amounts: Amount to add per attribute
+        """
+        for key, amount in amounts.items():
+            self.attributes[key] = self.attributes.get(key, 0) + (amount or 0)
+
+    def add_usage(self, response: Any) -> None:
+        """
+        Add the LLM token usage reported on a model response.
+
+        Partial streaming responses are ignored, since the final response carries
+        the usage of the whole generation.
+
+        Args:
+            response: LlmResponse or Event emitted for an LLM call
+        """
+        usage = getattr(response, 'usage_metadata', None)
+        if usage is None or getattr(response, 'partial', False):
+            return
+        self.add(
+            prompt_tokens=usage.prompt_token_count or 0,
+            output_tokens=usage.candidates_token_count or 0,
+        )
+
+    def end(self, status: str = 'ok') -> None:
+        """
+        Finish the span and export it.
+
+        Args:
+            status: Final status ('ok', 'error' or 'cancelled')
+        """
+        if self.duration is not None:
+            return
+        self.duration = time.perf_counter() - self._start
+        self.status = status
+
+        record = {
+            'name': self.name,
+            'trace_id': self.trace_id,
+            'span_id': self.span_id,
+            'parent_id': self.parent.span_id if self.parent else None,
+            'start': self.started_at,
+            'duration': round(self.duration, 6),
+            'status': self.status,
+            'attributes': self.attributes,
+        }
+        run_id = self.attributes.get('run_id')
+        if run_id and run_id not in _finished_runs:
+            _runs.setdefault(run_id, []).append(record)
+
+        if self._otel is not None:
+            for key, value in self.attributes.items():
+                if value is not None:
+                    self._otel.set_attribute(key, value if isinstance(value, (str, bool, int, float)) else str(value))
+            if status == 'error':
+                self._otel.set_status(otel_trace.Status(otel_trace.StatusCode.ERROR))
+            self._otel.end()
+        elif _exporter is not None:
+            try:
+                _exporter.write('spans.jsonl', record)
+            except OSError as e:
+                logger.warning(f'Could not export span {self.name}: {e}')
+
+
+def current_span() -> Optional[Span]:
+    """
+    Return the innermost active span of the current context.
+
+    Returns:
+        Active span, or None outside of any span
+    """
+    return _current.get()
+
+
+def bound_attributes() -> dict[str, str]:
+    """
+    Return the attributes bound to the current context.
+
+    Returns:
+        Context attributes such as run_id, agent_id or session_id
+    """
+    return dict(_context.get())
+
+
+@contextmanager
+def bind(**attributes: str) -> Iterator[None]:
+    """
+    Tag every span started inside the context with the given attributes.
+
+    Args:
+        **attributes: Context attributes such as run_id, agent_id or session_id
+    """
+    token = _context.set({**_context.get(), **attributes})
+    try:
+        yield
+    finally:
+        try:
+            _context.reset(token)
+        except ValueError:
+            # Async generators may be closed from another context
+            pass
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Span]:
+    """
+    Time the enclosed block as a span nested in the current one.
+
+    Args:
+        name: Name of the stage or external call
+        **attributes: Initial span attributes
+
+    Yields:
+        The started span, for setting attributes such as token counts or sizes
+    """
+    current = Span(name, attributes, _current.get())
+    token = _current.set(current)
+    status = 'ok'
+    try:
+        yield current
+    except GeneratorExit:
+        raise
+    except BaseException as e:
+        status = 'cancelled' if type(e).__name__ == 'CancelledError' else 'error'
+        current.set(error=repr(e))
+        raise
+    finally:
+        try:
+            _current.reset(token)
+        except ValueError:
+            pass
+        current.end(status)
+
+
+def add_run_listener(listener: Callable[[dict[str, Any]], None]) -> None:
+    """
+    Register a callback receiving the trace summary of every finished run.
+
+    Args:
+        listener: Callable invoked with each run summary
+    """
+    _run_listeners.append(listener)
+
+
+def finish_run(run_id: str) -> dict[str, Any]:
+    """
+    Summarize and release the spans recorded for a run.
+
+    Args:
+        run_id: Unique identifier of the run
+
+    Returns:
+        Summary with the session of the run, per-span-name count, total and max
+        duration, and summed token counts and byte sizes
+    """
+    records = _runs.pop(run_id, [])
+    _finished_runs[run_id] = None
+    while len(_finished_runs) > _FINISHED_RUNS_KEPT:
+        _finished_runs.popitem(last=False)
+    stages: dict[str, dict[str, Any]] = {}
+    totals = {key: 0 for key in SUMMED_ATTRIBUTES}
+    for record in records:
+        stage = stages.setdefault(record['name'], {'count': 0, 'total_seconds': 0.0, 'max_seconds': 0.0})
+        stage['count'] += 1
+        stage['total_seconds'] = round(stage['total_seconds'] + record['duration'], 6)
+        stage['max_seconds'] = max(stage['max_seconds'], record['duration'])
+        for key in SUMMED_ATTRIBUTES:
+            value = record['attributes'].get(key)
+            if isinstance(value, (int, float)):
+                totals[key] += value
+
+    session_id = next((r['attributes']['session_id'] for r in records if r['attributes'].get('session_id')), None)
+    summary = {'run_id': run_id, 'session_id': session_id, 'spans': len(records), 'stages': stages, **totals}
+    if records:
+        logger.info(f'Trace summary of run {run_id}: {json.dumps(summary)}')
+        recent_summaries.append(summary)
+        for listener in _run_listeners:
+            listener(summary)
+        if _exporter is not None:
+            try:
+                _exporter.write('runs.jsonl', summary)
+            except OSError as e:
+                logger.warning(f'Could not export trace summary of run {run_id}: {e}')
+    return summary
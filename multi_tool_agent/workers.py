@@ -0,0 +1,326 @@
+import argparse
+import asyncio
+import multiprocessing
+import os
+import time
+import uuid
+import zlib
+from collections.abc import AsyncIterator
+from collections.abc import Callable
+from contextlib import asynccontextmanager
+from multiprocessing.process import BaseProcess
+from typing import Any
+from typing import Optional
+
+from multi_tool_agent.service import serve
+from multi_tool_agent.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Admission metrics summed over the workers
+_SUMMED_METRICS = ('capacity', 'inflight', 'inflight_cost', 'queue_depth', 'queued_cost', 'max_queue', 'admitted')
+
+
+class Supervisor:
+    """
+    Runs research service workers in separate processes and restarts the ones that exit.
+
+    Each worker is a full research service (see multi_tool_agent.service) with
+    its own event loop, GIL, admission controller and in-memory sessions,
+    listening on a loopback port of its own. A session is pinned to one worker
+    by the hash of its id. The workers share the search, paper and embedding
+    caches through the SQLite files under CACHE_DIR.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        base_port: int,
+        host: str = '127.0.0.1',
+        env_file: Optional[str] = None,
+        target: Callable[[str, int, Optional[str]], None] = serve,
+        restart_delay: float = 1.0,
+    ) -> None:
+        """
+        Initialize the supervisor.
+
+        Args:
+            workers: Number of worker processes
+            base_port: Port of the first worker; the others use the following ports
+            host: Interface the workers bind
+            env_file: Environment file loaded by the workers
+            target: Function serving a worker, called with the host, port and env_file
+            restart_delay: Seconds to wait before restarting a worker that exited
+        """
+        self.host = host
+        self.ports = [base_port + index for index in range(max(1, workers))]
+        self.env_file = env_file
+        self.target = target
+        self.restart_delay = restart_delay
+        self.restarts = 0
+        self.processes: list[Optional[BaseProcess]] = [None] * len(self.ports)
+        self._context = multiprocessing.get_context('spawn')
+        self._stopping = False
+
+    def url(self, index: int) -> str:
+        """
+        Base URL of a worker.
+
+        Args:
+            index: Index of the worker
+
+        Returns:
+            URL the worker listens on
+        """
+        return f'http://{self.host}:{self.ports[index]}'
+
+    def route(self, session_id: str) -> int:
+        """
+        Pick the worker holding a session.
+
+        Args:
+            session_id: Id of the session
+
+        Returns:
+            Index of the worker, the same for every request of the session
+        """
+        return zlib.crc32(session_id.encode('utf-8')) % len(self.ports)
+
+    def _spawn(self, index: int) -> None:
+        """
+        Start the process of a worker.
+
+        Args:
+            index: Index of the worker
+        """
+        process = self._context.Process(
+            target=self.target,
+            args=(self.host, self.ports[index], self.env_file),
+            name=f'research-worker-{index}',
+            daemon=True,
+        )
+        process.start()
+        self.processes[index] = process
+        logger.info(f'Started worker {index} (pid {process.pid}) on port {self.ports[index]}')
+
+    def start(self) -> None:
+        """Start every worker."""
+        self._stopping = False
+        for index in range(len(self.ports)):
+            self._spawn(index)
+
+    async def monitor(self, interval: float = 1.0) -> None:
+        """
+        Restart the workers that exit, until the supervisor stops.
+
+        Args:
+            interval: Seconds between checks
+        """
+        while not self._stopping:
+            await asyncio.sleep(interval)
+            for index, process in enumerate(self.processes):
+                if self._stopping or process is None or process.is_alive():
+                    continue
+                logger.warning(f'Worker {index} exited with code {process.exitcode}, restarting')
+                self.restarts += 1
+                await asyncio.sleep(self.restart_delay)
+                if not self._stopping:
+                    self._spawn(index)
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """
+        Stop every worker, killing the ones that do not exit in time.
+
+        Args:
+            timeout: Seconds to wait for the workers to exit
+        """
+        self._stopping = True
+        processes = [process for process in self.processes if process is not None]
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+        deadline = time.monotonic() + timeout
+        for process in processes:
+            process.join(max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                logger.warning(f'Worker {process.name} did not exit, killing it')
+                process.kill()
+                process.join()
+
+    def status(self) -> list[dict[str, Any]]:
+        """
+        Describe the worker processes.
+
+        Returns:
+            Index, port, pid and liveness of each worker
+        """
+        return [
+            {
+                'index': index,
+                'port': self.ports[index],
+                'pid': process.pid if process is not None else None,
+                'alive': process is not None and process.is_alive(),
+            }
+            for index, process in enumerate(self.processes)
+        ]
+
+
+def create_app(supervisor: Supervisor) -> Any:
+    """
+    Create the front service routing requests to the supervisor's workers.
+
+    POST /research is forwarded to the worker of its session, with a new session
+    id when the request has none, and the worker's server-sent events are
+    streamed back. The session id is returned in the X-Session-ID header, so that
+    follow-up requests reach the same worker. GET /metrics sums the admission
+    metrics of the workers, and GET /healthz reports ready once every worker is.
+
+    Args:
+        supervisor: Supervisor running the workers
+
+    Returns:
+        FastAPI application
+    """
+    import httpx
+    from fastapi import FastAPI
+    from fastapi import Request
+    from fastapi.responses import JSONResponse
+    from fastapi.responses import Response
+    from fastapi.responses import StreamingResponse
+    from starlette.background import BackgroundTask
+
+    client: Optional[httpx.AsyncClient] = None
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        nonlocal client
+        client = httpx.AsyncClient(timeout=httpx.Timeout(10.0, read=None))
+        supervisor.start()
+        monitor = asyncio.create_task(supervisor.monitor())
+        try:
+            yield
+        finally:
+            monitor.cancel()
+            await client.aclose()
+            await asyncio.to_thread(supervisor.stop)
+
+    app = FastAPI(title='Deep Research', lifespan=lifespan)
+
+    @app.post('/research')
+    async def research(request: Request) -> Any:
+        body = await request.json()
+        session_id = body.get('session_id') or str(uuid.uuid4())
+        index = supervisor.route(session_id)
+        headers = {'X-Session-ID': session_id, 'X-Worker': str(index)}
+        forwarded = {'X-Tenant-ID': request.headers['X-Tenant-ID']} if 'X-Tenant-ID' in request.headers else {}
+        try:
+            response = await client.send(
+                client.build_request(
+                    'POST', f'{supervisor.url(index)}/research',
+                    json={**body, 'session_id': session_id}, headers=forwarded,
+                ),
+                stream=True,
+            )
+        except httpx.TransportError as e:
+            logger.warning(f'Worker {index} unavailable: {e}')
+            return JSONResponse(
+                status_code=503,
+                content={'error': 'worker_unavailable', 'retry_after': supervisor.restart_delay},
+                headers={**headers, 'Retry-After': '1'},
+            )
+
+        if response.status_code != 200:
+            content = await response.aread()
+            await response.aclose()
+            if 'Retry-After' in response.headers:
+                headers['Retry-After'] = response.headers['Retry-After']
+            return Response(
+                content=content,
+                status_code=response.status_code,
+                media_type=response.headers.get('Content-Type'),
+                headers=headers,
+            )
+
+        return StreamingResponse(
+            response.aiter_raw(),
+            media_type='text/event-stream',
+            headers={**headers, 'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+            background=BackgroundTask(response.aclose),
+        )
+
+    async def worker_report(index: int, path: str) -> tuple[int, Optional[dict[str, Any]]]:
+        try:
+            response = await client.get(f'{supervisor.url(index)}{path}', timeout=5.0)
+            return response.status_code, response.json()
+        except (httpx.HTTPError, ValueError) as e:
+            logger.debug(f'No {path} report from worker {index}: {e}')
+            return 503, None
+
+    @app.get('/metrics')
+    async def metrics() -> dict[str, Any]:
+        workers = supervisor.status()
+        reports = await asyncio.gather(*(worker_report(worker['index'], '/metrics') for worker in workers))
+        admission: dict[str, Any] = {name: 0 for name in _SUMMED_METRICS}
+        rejected: dict[str, int] = {}
+        for worker, (_, report) in zip(workers, reports):
+            worker['metrics'] = report
+            if report is None:
+                continue
+            for name in _SUMMED_METRICS:
+                admission[name] += report['admission'][name]
+            for reason, count in report['admission']['rejected'].items():
+                rejected[reason] = rejected.get(reason, 0) + count
+        admission['rejected'] = rejected
+        admission['utilization'] = round(admission['inflight_cost'] / admission['capacity'], 4) \
+            if admission['capacity'] else 0.0
+        return {'admission': admission, 'restarts': supervisor.restarts, 'workers': workers}
+
+    @app.get('/healthz')
+    async def healthz() -> Any:
+        workers = supervisor.status()
+        reports = await asyncio.gather(*(worker_report(worker['index'], '/healthz') for worker in workers))
+        for worker, (status_code, _) in zip(workers, reports):
+            worker['ready'] = worker['alive'] and status_code == 200
+        ready = all(worker['ready'] for worker in workers)
+        return JSONResponse(status_code=200 if ready else 503, content={'ready': ready, 'workers': workers})
+
+    return app
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    Parse the command-line arguments.
+
+    Returns:
+        Parsed arguments
+    """
+    parser = argparse.ArgumentParser(description='Serve the root agent from several worker processes')
+    parser.add_argument('--host', default='127.0.0.1', help='Interface to bind')
+    parser.add_argument('--port', type=int, default=8080, help='Port to bind')
+    parser.add_argument('--workers', type=int, help='Worker processes (default: SERVICE_WORKERS, or one per CPU)')
+    parser.add_argument('--worker-port', type=int, help='Loopback port of the first worker (default: port + 1)')
+    parser.add_argument('--env-file', help='Environment file to load (default: multi_tool_agent/.env)')
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Run the supervisor from the command line."""
+    args = parse_args()
+    try:
+        from dotenv import load_dotenv
+        load_dotenv(args.env_file or os.path.join(os.path.dirname(__file__), '.env'))
+    except ImportError:
+        pass
+
+    import uvicorn
+
+    # Imported after the environment is loaded, since the configuration is read on import
+    from multi_tool_agent.utils.config import config
+
+    workers = args.workers or config.service_workers or os.cpu_count() or 1
+    supervisor = Supervisor(workers, args.worker_port or args.port + 1, env_file=args.env_file)
+    uvicorn.run(create_app(supervisor), host=args.host, port=args.port)
+
+
+if __name__ == '__main__':
+    main()
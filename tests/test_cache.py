@@ -0,0 +1,64 @@
+import asyncio
+import tempfile
+import unittest
+
+from multi_tool_agent.utils.cache import TTLCache
+
+
+class GetOrFetchTest(unittest.IsolatedAsyncioTestCase):
+    """Request coalescing of TTLCache.get_or_fetch."""
+
+    async def _fetch_with_cancelled_first_caller(self, cache: TTLCache) -> None:
+        """
+        Cancel the caller that started a shared fetch and check the others still get the value.
+
+        Args:
+            cache: Cache under test
+        """
+        calls = 0
+        release = asyncio.Event()
+
+        async def fetch() -> str:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return 'value'
+
+        first = asyncio.create_task(cache.get_or_fetch('key', fetch))
+        await asyncio.sleep(0.05)
+        second = asyncio.create_task(cache.get_or_fetch('key', fetch))
+        await asyncio.sleep(0.05)
+
+        first.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await first
+        release.set()
+
+        self.assertEqual(await second, 'value')
+        self.assertFalse(second.cancelled())
+        self.assertEqual(calls, 1)
+        self.assertEqual(await cache.get('key'), 'value')
+
+    async def test_cancelled_caller_does_not_cancel_others(self) -> None:
+        await self._fetch_with_cancelled_first_caller(TTLCache('test', ttl=60))
+
+    async def test_cancelled_caller_does_not_cancel_others_on_disk(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            await self._fetch_with_cancelled_first_caller(TTLCache('test', ttl=60, directory=directory))
+
+    async def test_failed_fetch_reaches_every_caller(self) -> None:
+        cache = TTLCache('test', ttl=60)
+
+        async def fetch() -> str:
+            await asyncio.sleep(0.05)
+            raise RuntimeError('unavailable')
+
+        results = await asyncio.gather(
+            cache.get_or_fetch('key', fetch), cache.get_or_fetch('key', fetch), return_exceptions=True,
+        )
+        self.assertTrue(all(isinstance(result, RuntimeError) for result in results))
+        self.assertIsNone(await cache.get('key'))
+
+
+if __name__ == '__main__':
+    unittest.main()